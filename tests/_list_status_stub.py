@@ -0,0 +1,214 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# pyright: reportPrivateUsage=none
+"""Local stub server which mimics the bot list APIs used by `yuyo.list_status`.
+
+This lets the standard services be tested and benchmarked offline by
+redirecting their requests to a local aiohttp server through a client
+middleware; the original host is kept in the `Host` header.
+"""
+from __future__ import annotations
+
+__all__ = ["StubListServer", "StubRequest"]
+
+import asyncio
+import dataclasses
+import time
+import typing
+
+import aiohttp
+from aiohttp import test_utils
+from aiohttp import web
+
+if typing.TYPE_CHECKING:
+    from collections import abc as collections
+    from typing import Self
+
+BOTS_GG = "discord.bots.gg"
+DISCORD_BOT_LIST = "discordbotlist.com"
+TOP_GG = "top.gg"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class StubRequest:
+    """Record of a request received by the stub server."""
+
+    host: str
+    method: str
+    json: typing.Any
+    started_at: float
+    finished_at: float
+    status: int
+
+
+@dataclasses.dataclass(slots=True)
+class _Rule:
+    host: str
+    status: int
+    retry_after: float | None
+    shard_id: int | None
+    times: int
+
+
+class StubListServer:
+    """Local server which mimics top.gg, bots.gg and discordbotlist.com's stats endpoints."""
+
+    __slots__ = ("_in_flight", "_rules", "_server", "latency", "peak_in_flight", "requests", "top_gg_shards")
+
+    def __init__(self, *, latency: float = 0.0) -> None:
+        """Initialise a stub list server.
+
+        Parameters
+        ----------
+        latency
+            How long (in seconds) the server should take to respond to each request.
+        """
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._in_flight = 0
+        self._rules: list[_Rule] = []
+        self._server = test_utils.TestServer(app)
+        self.latency = latency
+        self.peak_in_flight = 0
+        self.requests: list[StubRequest] = []
+        self.top_gg_shards: list[int] = []
+
+    async def __aenter__(self) -> Self:
+        await self._server.start_server()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self._server.close()
+
+    def add_rule(
+        self,
+        host: str,
+        status: int,
+        /,
+        *,
+        retry_after: float | None = None,
+        shard_id: int | None = None,
+        times: int = 1,
+    ) -> Self:
+        """Make the server respond to matching stats posts with an error status.
+
+        Parameters
+        ----------
+        host
+            The bot list host this rule applies to.
+        status
+            The status code to respond with.
+        retry_after
+            Value of the `Retry-After` header to respond with.
+        shard_id
+            If passed, only posts for this shard will match.
+        times
+            How many requests this rule should match before it's used up.
+
+            Setting this to `-1` marks it as unlimited.
+        """
+        self._rules.append(_Rule(host, status, retry_after, shard_id, times))
+        return self
+
+    def posts(self, host: str, /) -> list[typing.Any]:
+        """Get the bodies of the stats posts which were successfully made to a host."""
+        return [
+            request.json
+            for request in self.requests
+            if request.host == host and request.method == "POST" and request.status < 300
+        ]
+
+    def make_session(self, **kwargs: typing.Any) -> aiohttp.ClientSession:
+        """Create an aiohttp session which sends all its requests to this server.
+
+        Parameters
+        ----------
+        **kwargs
+            Keyword arguments passed through to [aiohttp.ClientSession][].
+        """
+        return aiohttp.ClientSession(middlewares=(self._redirect,), **kwargs)
+
+    async def _redirect(
+        self,
+        request: aiohttp.ClientRequest,
+        handler: collections.Callable[[aiohttp.ClientRequest], collections.Awaitable[aiohttp.ClientResponse]],
+    ) -> aiohttp.ClientResponse:
+        request.url = self._server.make_url(request.url.path_qs)
+        return await handler(request)
+
+    def _match_rule(self, host: str, json: typing.Any, /) -> _Rule | None:
+        shard_id = json.get("shard_id") if isinstance(json, dict) else None
+        for rule in self._rules:
+            if rule.times != 0 and rule.host == host and rule.shard_id in (None, shard_id):
+                if rule.times > 0:
+                    rule.times -= 1
+
+                return rule
+
+        return None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        started_at = time.monotonic()
+        json = await request.json() if request.can_read_body else None
+        self._in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+
+            response = self._respond(request, json)
+
+        finally:
+            self._in_flight -= 1
+
+        self.requests.append(
+            StubRequest(request.host, request.method, json, started_at, time.monotonic(), response.status)
+        )
+        return response
+
+    def _respond(self, request: web.Request, json: typing.Any, /) -> web.Response:
+        if request.host not in (BOTS_GG, DISCORD_BOT_LIST, TOP_GG) or not request.path.endswith("/stats"):
+            return web.Response(status=404)
+
+        if request.method == "GET":
+            if request.host != TOP_GG:
+                return web.Response(status=405)
+
+            return web.json_response({"server_count": sum(self.top_gg_shards), "shards": self.top_gg_shards})
+
+        if rule := self._match_rule(request.host, json):
+            headers = {} if rule.retry_after is None else {"Retry-After": str(rule.retry_after)}
+            return web.Response(status=rule.status, headers=headers)
+
+        if request.host == TOP_GG and "shards" in json:
+            self.top_gg_shards = list(json["shards"])
+
+        return web.Response(status=200)
@@ -31,9 +31,12 @@
 # pyright: reportUnknownMemberType=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
+import typing
 from collections import abc as collections
 from unittest import mock
 
+import alluka
 import pytest
 
 from yuyo import _internal
@@ -95,3 +98,101 @@ async def test_seek_iterator_with_depleted_sync_iterator() -> None:
     mock_iterator = iter([])
 
     assert await _internal.seek_iterator(mock_iterator, default=123321) == 123321
+
+
+async def _no_injection(ctx: int, /, value: str = "", *, other: "int | None" = None) -> None: ...
+
+
+async def _injected_default(ctx: int, value: str = alluka.inject(type=str)) -> None: ...
+
+
+async def _injected_annotation(ctx: int, value: alluka.Injected[str]) -> None: ...
+
+
+async def _injected_string_annotation(ctx: int, value: "alluka.Injected[str]") -> None: ...
+
+
+async def _unresolvable_annotation(ctx: int, value: "NotAType") -> None: ...  # type: ignore  # noqa: F821
+
+
+@pytest.mark.parametrize(
+    ("callback", "result"),
+    [
+        (_no_injection, False),
+        (_injected_default, True),
+        (_injected_annotation, True),
+        (_injected_string_annotation, True),
+        (_unresolvable_annotation, True),
+    ],
+)
+def test_needs_injection(callback: collections.Callable[..., typing.Any], result: bool) -> None:
+    assert _internal.needs_injection(callback) is result
+
+
+class TestWaiterRegistry:
+    @pytest.mark.asyncio
+    async def test_resolve(self) -> None:
+        registry = _internal.WaiterRegistry[tuple[str, int], str]()
+        future = registry.add(("meow", 123), 60)
+
+        assert ("meow", 123) in registry
+        assert registry.resolve(("meow", 123), "result") is True
+        assert await future == "result"
+        assert len(registry) == 0
+
+    @pytest.mark.asyncio
+    async def test_resolve_when_not_found(self) -> None:
+        registry = _internal.WaiterRegistry[tuple[str, int], str]()
+        registry.add(("meow", 123), 60)
+
+        assert registry.resolve(("meow", 321), "result") is False
+        assert registry.resolve(("nyan", 123), "result") is False
+
+    @pytest.mark.asyncio
+    async def test_add_when_already_waiting(self) -> None:
+        registry = _internal.WaiterRegistry[str, str]()
+        registry.add("meow", None)
+
+        with pytest.raises(RuntimeError, match="'meow' is already being waited for"):
+            registry.add("meow", None)
+
+    @pytest.mark.asyncio
+    async def test_expires_in_deadline_order(self) -> None:
+        registry = _internal.WaiterRegistry[str, str]()
+        late = registry.add("late", 0.05)
+        early = registry.add("early", 0.01)
+        never = registry.add("never", None)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await early
+
+        assert not late.done()
+        assert "late" in registry
+
+        with pytest.raises(asyncio.TimeoutError):
+            await late
+
+        assert not never.done()
+        assert len(registry) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_deadline_doesnt_expire_new_waiter(self) -> None:
+        registry = _internal.WaiterRegistry[str, str]()
+        registry.add("meow", 0.01)
+        registry.resolve("meow", "result")
+        future = registry.add("meow", 60)
+
+        await asyncio.sleep(0.03)
+
+        assert not future.done()
+        assert "meow" in registry
+
+    @pytest.mark.asyncio
+    async def test_discard(self) -> None:
+        registry = _internal.WaiterRegistry[str, str]()
+        future = registry.add("meow", 0.01)
+        registry.discard("meow", future)
+
+        assert "meow" not in registry
+        await asyncio.sleep(0.03)
+        assert not future.done()
@@ -32,6 +32,7 @@
 # pyright: reportUnknownMemberType=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
 from unittest import mock
 
 import hikari
@@ -159,3 +160,91 @@ class TestChunkTracker:
     @pytest.mark.skip(reason="TODO")
     @pytest.mark.asyncio
     async def test(self) -> None: ...
+
+
+def _make_payload_event(name: str, shard: mock.Mock, payload: dict[str, object], /) -> mock.Mock:
+    event = mock.Mock(payload=payload, shard=shard)
+    event.name = name
+    return event
+
+
+def _make_chunk_event(shard: mock.Mock, guild_id: int, chunk_index: int, chunk_count: int, /) -> mock.Mock:
+    return _make_payload_event(
+        "GUILD_MEMBERS_CHUNK",
+        shard,
+        {"chunk_count": chunk_count, "chunk_index": chunk_index, "guild_id": str(guild_id), "nonce": "meow"},
+    )
+
+
+class TestChunkTrackerTimeouts:
+    @pytest.mark.asyncio
+    async def test_request_times_out(self) -> None:
+        mock_event_manager = mock.Mock(dispatch=mock.AsyncMock())
+        mock_shard = mock.Mock(id=0)
+        tracker = chunk_tracker.ChunkTracker(mock_event_manager, mock.Mock(), mock.Mock(), timeout=0.05)
+
+        await tracker._on_payload_event(_make_chunk_event(mock_shard, 123, 1, 3))
+        mock_event_manager.dispatch.assert_not_called()
+        await asyncio.sleep(0.15)
+
+        mock_event_manager.dispatch.assert_awaited_once()
+        event = mock_event_manager.dispatch.call_args.args[0]
+        assert isinstance(event, chunk_tracker.ChunkRequestFinishedEvent)
+        assert event.guild_id == 123
+        assert event.missed_chunks == {0, 2}
+        assert tracker._requests == {}
+        assert tracker._deadlines == []
+
+    @pytest.mark.asyncio
+    async def test_request_timeout_is_pushed_back_by_new_chunks(self) -> None:
+        mock_event_manager = mock.Mock(dispatch=mock.AsyncMock())
+        mock_shard = mock.Mock(id=0)
+        tracker = chunk_tracker.ChunkTracker(mock_event_manager, mock.Mock(), mock.Mock(), timeout=0.2)
+
+        await tracker._on_payload_event(_make_chunk_event(mock_shard, 123, 0, 3))
+        await asyncio.sleep(0.12)
+        await tracker._on_payload_event(_make_chunk_event(mock_shard, 123, 1, 3))
+        await asyncio.sleep(0.12)
+
+        mock_event_manager.dispatch.assert_not_called()
+        assert len(tracker._deadlines) == 1
+
+        await asyncio.sleep(0.2)
+
+        mock_event_manager.dispatch.assert_awaited_once()
+        assert mock_event_manager.dispatch.call_args.args[0].missed_chunks == {2}
+
+    @pytest.mark.asyncio
+    async def test_request_finished_before_timeout(self) -> None:
+        mock_event_manager = mock.Mock(dispatch=mock.AsyncMock())
+        mock_shard = mock.Mock(id=0)
+        tracker = chunk_tracker.ChunkTracker(mock_event_manager, mock.Mock(), mock.Mock(), timeout=0.05)
+
+        await tracker._on_payload_event(_make_chunk_event(mock_shard, 123, 0, 2))
+        await tracker._on_payload_event(_make_chunk_event(mock_shard, 123, 1, 2))
+        mock_event_manager.dispatch.assert_awaited_once()
+        await asyncio.sleep(0.15)
+
+        mock_event_manager.dispatch.assert_awaited_once()
+        assert mock_event_manager.dispatch.call_args.args[0].missed_chunks == set()
+        assert tracker._task is None
+
+    @pytest.mark.asyncio
+    async def test_identify_times_out_after_requests(self) -> None:
+        mock_event_manager = mock.Mock(dispatch=mock.AsyncMock())
+        mock_shard = mock.Mock(id=2)
+        tracker = chunk_tracker.ChunkTracker(mock_event_manager, mock.Mock(), mock.Mock(), timeout=0.05)
+
+        await tracker._on_payload_event(
+            _make_payload_event("READY", mock_shard, {"guilds": [{"id": "123"}, {"id": "456"}]})
+        )
+        await tracker._on_payload_event(_make_chunk_event(mock_shard, 123, 0, 2))
+        await asyncio.sleep(0.15)
+
+        request_event, shard_event = (call.args[0] for call in mock_event_manager.dispatch.call_args_list)
+        assert isinstance(request_event, chunk_tracker.ChunkRequestFinishedEvent)
+        assert request_event.missed_chunks == {1}
+        assert isinstance(shard_event, chunk_tracker.ShardFinishedChunkingEvent)
+        assert shard_event.incomplete_guild_ids == [123]
+        assert shard_event.missed_guild_ids == [456]
+        assert tracker._tracked_identifies == {}
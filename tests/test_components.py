@@ -32,8 +32,11 @@
 # pyright: reportUnknownMemberType=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
 import datetime
 import inspect
+import io
+import pathlib
 import typing
 from unittest import mock
 
@@ -44,6 +47,7 @@ import hikari
 import pytest
 
 import yuyo
+from yuyo._internal import serialise
 
 try:
     import tanjun
@@ -317,6 +321,23 @@ class TestComponentContext:
 
         assert context.selected_roles == {}
 
+    def test_selected_ids_property(self) -> None:
+        mock_interaction = mock.Mock(values=["123", "4321", "55"])
+        context = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", register_task=lambda _: None)
+
+        result = context.selected_ids
+
+        assert result == (hikari.Snowflake(123), hikari.Snowflake(4321), hikari.Snowflake(55))
+        assert all(isinstance(value, hikari.Snowflake) for value in result)
+        assert context.selected_ids is result
+
+    def test_selected_ids_property_for_text_menu(self) -> None:
+        mock_interaction = mock.Mock(values=["123"], component_type=hikari.ComponentType.TEXT_SELECT_MENU)
+        context = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", register_task=lambda _: None)
+
+        with pytest.raises(ValueError, match="Cannot get the selected IDs for a text select menu"):
+            context.selected_ids  # noqa: B018
+
     def test_selected_texts_property(self) -> None:
         mock_interaction = mock.Mock()
         context = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", register_task=lambda _: None)
@@ -365,6 +386,10 @@ class TestComponentClient:
             [mock.call(hikari.StartingEvent, client._on_starting), mock.call(hikari.StoppingEvent, client._on_stopping)]
         )
 
+    def test___init___when_deletion_store_passed_without_rest(self) -> None:
+        with pytest.raises(ValueError, match="A REST client must be provided to load stored deletions"):
+            yuyo.ComponentClient(deletion_store=mock.Mock(yuyo.interactions.AbstractDeletionStore))
+
     def test_alluka(self) -> None:
         client = yuyo.ComponentClient(event_manager=mock.Mock())
 
@@ -618,6 +643,38 @@ class TestSingleExecutor:
         assert ctx._ephemeral_default is True
         mock_callback.assert_awaited_once_with(ctx)
 
+    @pytest.mark.asyncio
+    async def test_execute_when_callback_needs_injection(self) -> None:
+        mock_callback = mock.AsyncMock()
+        mock_alluka = mock.AsyncMock()
+
+        async def callback(ctx: yuyo.components.Context, value: alluka.Injected[int]) -> None:
+            await mock_callback(ctx, value)
+
+        ctx = mock.Mock(client=mock.Mock(alluka=mock_alluka))
+        executor = yuyo.components.SingleExecutor("dkkpoeewlk", callback)
+
+        await executor.execute(ctx)
+
+        mock_alluka.call_with_async_di.assert_awaited_once_with(callback, ctx)
+        mock_callback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_calls_simple_callback_directly(self) -> None:
+        mock_callback = mock.AsyncMock()
+        mock_alluka = mock.AsyncMock()
+
+        async def callback(ctx: yuyo.components.Context) -> None:
+            await mock_callback(ctx)
+
+        ctx = mock.Mock(client=mock.Mock(alluka=mock_alluka))
+        executor = yuyo.components.SingleExecutor("dkkpoeewlk", callback)
+
+        await executor.execute(ctx)
+
+        mock_callback.assert_awaited_once_with(ctx)
+        mock_alluka.call_with_async_di.assert_not_called()
+
 
 def test_as_single_executor() -> None:
     mock_callback = mock.Mock()
@@ -631,6 +688,75 @@ def test_as_single_executor() -> None:
     assert result._ephemeral_default is True
 
 
+class TestMultiWaitForExecutor:
+    def test_custom_ids_property(self) -> None:
+        executor = yuyo.components.MultiWaitForExecutor(["meow", "nyan"], timeout=None)
+
+        assert executor.custom_ids == ["meow", "nyan"]
+
+    @pytest.mark.asyncio
+    async def test_wait_for(self) -> None:
+        client = yuyo.components.Client()
+        ctx = yuyo.components.ComponentContext(
+            client, mock.Mock(user=mock.Mock(id=hikari.Snowflake(123))), "meow", "", lambda _: None
+        )
+        executor = yuyo.components.MultiWaitForExecutor(
+            ["meow"], ephemeral_default=True, timeout=datetime.timedelta(seconds=30)
+        )
+
+        task = asyncio.create_task(executor.wait_for("meow:metadata", 123))
+        await asyncio.sleep(0)
+        assert executor.is_waiting("meow", 123)
+
+        await executor.execute(ctx)
+
+        assert await task is ctx
+        assert ctx._ephemeral_default is True
+        assert not executor.is_waiting("meow", 123)
+
+    @pytest.mark.asyncio
+    async def test_execute_for_other_user(self) -> None:
+        mock_ctx = mock.Mock(
+            create_initial_response=mock.AsyncMock(),
+            id_match="meow",
+            interaction=mock.Mock(user=mock.Mock(id=hikari.Snowflake(321))),
+        )
+        executor = yuyo.components.MultiWaitForExecutor(["meow"], timeout=datetime.timedelta(seconds=30))
+
+        task = asyncio.create_task(executor.wait_for("meow", 123))
+        await asyncio.sleep(0)
+
+        await executor.execute(mock_ctx)
+
+        mock_ctx.create_initial_response.assert_awaited_once_with(
+            "You are not allowed to use this component", ephemeral=True
+        )
+        assert not task.done()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert not executor.is_waiting("meow", 123)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_times_out(self) -> None:
+        executor = yuyo.components.MultiWaitForExecutor(["meow"], timeout=datetime.timedelta(seconds=0.01))
+
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.wait_for("meow", 123)
+
+        assert not executor.is_waiting("meow", 123)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_when_timeout_is_zero(self) -> None:
+        executor = yuyo.components.MultiWaitForExecutor(["meow"], timeout=datetime.timedelta())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.wait_for("meow", 123)
+
+        assert not executor.is_waiting("meow", 123)
+
+
 class TestComponentExecutor: ...
 
 
@@ -667,6 +793,38 @@ class TestActionColumnExecutor:
         assert isinstance(component, hikari.api.SelectMenuBuilder)
         assert component.custom_id == "$qY^N`e%|!:meowers"
 
+    @pytest.mark.asyncio
+    async def test_execute_only_uses_injection_when_needed(self) -> None:
+        mock_alluka = mock.AsyncMock()
+        called_with: list[yuyo.components.Context] = []
+
+        class Column(yuyo.ActionColumnExecutor):
+            __slots__ = ()
+
+            @yuyo.components.as_interactive_button(hikari.ButtonStyle.PRIMARY, custom_id="simple")
+            async def simple(self, ctx: yuyo.components.Context) -> None:
+                called_with.append(ctx)
+
+            @yuyo.components.as_interactive_button(hikari.ButtonStyle.PRIMARY, custom_id="injected")
+            async def injected(self, ctx: yuyo.components.Context, value: alluka.Injected[int]) -> None: ...
+
+        async def add_injected(ctx: yuyo.components.Context, value: alluka.Injected[int]) -> None: ...
+
+        column = Column().add_interactive_button(hikari.ButtonStyle.DANGER, add_injected, custom_id="added")
+        simple_ctx = mock.Mock(client=mock.Mock(alluka=mock_alluka), id_match="simple")
+        injected_ctx = mock.Mock(client=mock.Mock(alluka=mock_alluka), id_match="injected")
+        added_ctx = mock.Mock(client=mock.Mock(alluka=mock_alluka), id_match="added")
+
+        await column.execute(simple_ctx)
+        await column.execute(injected_ctx)
+        await column.execute(added_ctx)
+
+        assert called_with == [simple_ctx]
+        assert mock_alluka.call_with_async_di.await_args_list == [
+            mock.call(column._callbacks["injected"], injected_ctx),
+            mock.call(add_injected, added_ctx),
+        ]
+
     def test_add_builder(self) -> None:
         mock_builder = mock.Mock()
 
@@ -2125,6 +2283,191 @@ class TestActionColumnExecutor:
         assert component.custom_id == "custoard"
 
 
+class TestStaticPaginatorIndex:
+    @pytest.mark.asyncio
+    async def test_replace_paginators(self) -> None:
+        index = yuyo.components.StaticPaginatorIndex().set_paginator("old", [yuyo.pagination.Page("meow")])
+        pages = [yuyo.pagination.Page("nyaa"), yuyo.pagination.Page(embed=hikari.Embed(title="echo"))]
+
+        await index.replace_paginators({"new": pages}, yield_every=1)
+
+        paginator = index.get_paginator("new")
+        assert paginator.pages is pages
+        assert paginator.content_hash
+        with pytest.raises(KeyError):
+            index.get_paginator("old")
+
+    @pytest.mark.asyncio
+    async def test_replace_paginators_keeps_unchanged_paginators(self) -> None:
+        index = yuyo.components.StaticPaginatorIndex()
+        await index.replace_paginators({"echo": [yuyo.pagination.Page("meow")], "delta": [yuyo.pagination.Page("a")]})
+        echo = index.get_paginator("echo")
+        delta = index.get_paginator("delta")
+
+        await index.replace_paginators({"echo": [yuyo.pagination.Page("meow")], "delta": [yuyo.pagination.Page("b")]})
+
+        assert index.get_paginator("echo") is echo
+        assert index.get_paginator("delta") is not delta
+        assert index.get_paginator("delta").content_hash != delta.content_hash
+
+    @pytest.mark.asyncio
+    async def test_replace_paginators_hashes_every_locale(self) -> None:
+        index = yuyo.components.StaticPaginatorIndex()
+        page = yuyo.pagination.LocalisedPage({"default": yuyo.pagination.Page("a"), "en-GB": yuyo.pagination.Page("b")})
+        await index.replace_paginators({"a": [page]})
+        old_hash = index.get_paginator("a").content_hash
+
+        page = yuyo.pagination.LocalisedPage({"default": yuyo.pagination.Page("a"), "en-GB": yuyo.pagination.Page("c")})
+        await index.replace_paginators({"a": [page]})
+
+        assert index.get_paginator("a").content_hash != old_hash
+
+    @pytest.mark.asyncio
+    async def test_replace_paginators_doesnt_consume_streams(self) -> None:
+        index = yuyo.components.StaticPaginatorIndex()
+        bytes_stream = io.BytesIO(b"meow")
+        str_stream = io.StringIO("nyaa")
+
+        await index.replace_paginators(
+            {"a": [yuyo.pagination.Page(attachment=bytes_stream), yuyo.pagination.Page(attachment=str_stream)]}
+        )
+
+        assert bytes_stream.read() == b"meow"
+        assert str_stream.read() == "nyaa"
+
+    @pytest.mark.asyncio
+    async def test_replace_paginators_when_file_modified(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "image.png"
+        path.write_bytes(b"meow")
+        index = yuyo.components.StaticPaginatorIndex()
+        await index.replace_paginators({"a": [yuyo.pagination.Page(attachment=hikari.File(path))]})
+        old_hash = index.get_paginator("a").content_hash
+
+        path.write_bytes(b"meow meow")
+        await index.replace_paginators({"a": [yuyo.pagination.Page(attachment=hikari.File(path))]})
+
+        assert index.get_paginator("a").content_hash != old_hash
+
+    @pytest.mark.asyncio
+    async def test_replace_paginators_when_yield_every_is_invalid(self) -> None:
+        index = yuyo.components.StaticPaginatorIndex().set_paginator("old", [yuyo.pagination.Page("meow")])
+
+        with pytest.raises(ValueError, match="yield_every must be greater than 0"):
+            await index.replace_paginators({}, yield_every=0)
+
+        assert index.get_paginator("old")
+
+    def test_export_to_file_and_attach_file(self, tmp_path: pathlib.Path) -> None:
+        embed = (
+            hikari.Embed(title="meow", colour=123, timestamp=datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC))
+            .set_image("https://example.com/image.png")
+            .set_footer("footer", icon=hikari.Bytes(b"data", "file.png"))
+            .add_field("name", "value", inline=True)
+        )
+        index = (
+            yuyo.components.StaticPaginatorIndex()
+            .set_paginator("echo", [yuyo.pagination.Page("nyaa"), yuyo.pagination.Page(embed)], content_hash="ok")
+            .set_paginator(
+                "delta",
+                [
+                    yuyo.pagination.LocalisedPage(
+                        {"default": yuyo.pagination.Page("a"), "en-GB": yuyo.pagination.Page("b", attachment="x.png")}
+                    )
+                ],
+            )
+        )
+        path = tmp_path / "paginators"
+
+        index.export_to_file(path)
+        attached = yuyo.components.StaticPaginatorIndex().attach_file(path)
+
+        echo = attached.get_paginator("echo")
+        assert echo.content_hash == "ok"
+        assert len(echo.pages) == 2
+        assert echo.pages[0].to_kwargs().get("content") == "nyaa"
+        assert echo.pages[1].to_kwargs().get("embeds") == [embed]
+        assert echo.get_page(2) is None
+        delta = attached.get_paginator("delta")
+        assert delta.content_hash is None
+        assert len(delta.pages) == 1
+        assert serialise.encode_page(delta.pages[0]) == serialise.encode_page(index.get_paginator("delta").pages[0])
+
+    def test_export_to_file_when_stream_attachment(self, tmp_path: pathlib.Path) -> None:
+        async def stream() -> typing.AsyncIterator[bytes]:
+            yield b"data"
+
+        index = yuyo.components.StaticPaginatorIndex().set_paginator(
+            "echo", [yuyo.pagination.Page(attachment=hikari.Bytes(stream(), "file.txt"))]
+        )
+        path = tmp_path / "paginators"
+
+        with pytest.raises(ValueError, match=r"Cannot serialise stream-backed attachment 'file\.txt'"):
+            index.export_to_file(path)
+
+        assert not path.exists()
+        assert not list(tmp_path.iterdir())
+
+    def test_attach_file_closes_previous_file(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "paginators"
+        yuyo.components.StaticPaginatorIndex().set_paginator("echo", [yuyo.pagination.Page("meow")]).export_to_file(
+            path
+        )
+        index = yuyo.components.StaticPaginatorIndex().attach_file(path)
+        old_mapping = index._mapping
+        assert old_mapping
+
+        index.attach_file(path)
+
+        assert old_mapping.closed
+        assert index._mapping
+        assert not index._mapping.closed
+        assert index.get_paginator("echo").pages[0].to_kwargs().get("content") == "meow"
+
+    @pytest.mark.asyncio
+    async def test_replace_paginators_closes_attached_file(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "paginators"
+        yuyo.components.StaticPaginatorIndex().set_paginator("echo", [yuyo.pagination.Page("meow")]).export_to_file(
+            path
+        )
+        index = yuyo.components.StaticPaginatorIndex().attach_file(path)
+        mapping = index._mapping
+        assert mapping
+
+        await index.replace_paginators({"echo": [yuyo.pagination.Page("nyaa")]})
+
+        assert mapping.closed
+        assert index._mapping is None
+        assert index.get_paginator("echo").pages[0].to_kwargs().get("content") == "nyaa"
+
+    @pytest.mark.asyncio
+    async def test_replace_paginators_keeps_attached_file_open_while_used(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "paginators"
+        exporter = yuyo.components.StaticPaginatorIndex()
+        await exporter.replace_paginators(
+            {"echo": [yuyo.pagination.Page("meow")], "delta": [yuyo.pagination.Page("a")]}
+        )
+        exporter.export_to_file(path)
+        index = yuyo.components.StaticPaginatorIndex().attach_file(path)
+        mapping = index._mapping
+        assert mapping
+
+        await index.replace_paginators({"echo": [yuyo.pagination.Page("meow")]})
+
+        assert not mapping.closed
+        assert index._mapping is mapping
+        assert index.get_paginator("echo").pages[0].to_kwargs().get("content") == "meow"
+
+    def test_attach_file_when_not_an_export(self, tmp_path: pathlib.Path) -> None:
+        path = tmp_path / "paginators"
+        path.write_bytes(b"meow")
+        index = yuyo.components.StaticPaginatorIndex().set_paginator("old", [yuyo.pagination.Page("meow")])
+
+        with pytest.raises(ValueError, match="Not a valid static paginator export"):
+            index.attach_file(path)
+
+        assert index.get_paginator("old")
+
+
 def test_ensure_parse_channel_types_has_every_channel_class() -> None:
     for _, attribute in inspect.getmembers(hikari):
         if isinstance(attribute, type) and issubclass(attribute, hikari.PartialChannel):
@@ -0,0 +1,503 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# pyright: reportUnknownMemberType=none
+# pyright: reportPrivateUsage=none
+# This leads to too many false-positives around mocks.
+
+import asyncio
+import datetime
+import pathlib
+import time
+from unittest import mock
+
+import hikari
+import pytest
+
+import yuyo
+from yuyo import interactions
+
+
+class TestSQLiteDeletionStore:
+    def test_round_trip(self) -> None:
+        store = interactions.SQLiteDeletionStore(":memory:")
+        initial = interactions.PendingDeletion(123.5, hikari.Snowflake(321), "token", None)
+        followup = interactions.PendingDeletion(125.0, hikari.Snowflake(321), "token", hikari.Snowflake(55))
+        other = interactions.PendingDeletion(126.0, hikari.Snowflake(321), "other", hikari.Snowflake(56))
+
+        store.add([initial, followup])
+        store.add([other])
+        store.remove([initial, other])
+
+        assert store.load() == [followup]
+        store.close()
+
+    def test_persists_to_file(self, tmp_path: pathlib.Path) -> None:
+        deletion = interactions.PendingDeletion(123.5, hikari.Snowflake(321), "token", hikari.Snowflake(55))
+        store = interactions.SQLiteDeletionStore(tmp_path / "deletions.db")
+        store.add([deletion])
+        store.close()
+
+        store = interactions.SQLiteDeletionStore(tmp_path / "deletions.db")
+
+        assert store.load() == [deletion]
+        store.close()
+
+
+class TestDeletionScheduler:
+    @pytest.mark.asyncio
+    async def test_schedule(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_interaction = mock.Mock(application_id=hikari.Snowflake(123), token="meow")
+        scheduler = interactions.DeletionScheduler(rest=mock_rest, batch_window=0)
+
+        scheduler.schedule(mock_interaction, 0.02)
+        scheduler.schedule(mock_interaction, 0.01, message=hikari.Snowflake(4321))
+
+        assert len(scheduler) == 2
+        await asyncio.sleep(0.015)
+        mock_rest.delete_webhook_message.assert_awaited_once_with(hikari.Snowflake(123), "meow", hikari.Snowflake(4321))
+        mock_rest.delete_interaction_response.assert_not_called()
+
+        await asyncio.sleep(0.02)
+        mock_rest.delete_interaction_response.assert_awaited_once_with(hikari.Snowflake(123), "meow")
+        assert len(scheduler) == 0
+        assert scheduler._task is None
+
+    @pytest.mark.asyncio
+    async def test_schedule_uses_interaction_rest(self) -> None:
+        mock_interaction = mock.Mock(
+            application_id=hikari.Snowflake(123), token="meow", app=mock.Mock(rest=mock.AsyncMock())
+        )
+        scheduler = interactions.DeletionScheduler()
+
+        scheduler.schedule(mock_interaction, 0)
+        await asyncio.sleep(0.01)
+
+        mock_interaction.app.rest.delete_interaction_response.assert_awaited_once_with(hikari.Snowflake(123), "meow")
+
+    @pytest.mark.asyncio
+    async def test_schedule_batches_close_deletions(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_interaction = mock.Mock(application_id=hikari.Snowflake(123), token="meow")
+        scheduler = interactions.DeletionScheduler(rest=mock_rest, batch_window=datetime.timedelta(seconds=10))
+
+        scheduler.schedule(mock_interaction, 0.01, message=hikari.Snowflake(1))
+        scheduler.schedule(mock_interaction, 5, message=hikari.Snowflake(2))
+        await asyncio.sleep(0.03)
+
+        assert mock_rest.delete_webhook_message.await_args_list == [
+            mock.call(hikari.Snowflake(123), "meow", hikari.Snowflake(1)),
+            mock.call(hikari.Snowflake(123), "meow", hikari.Snowflake(2)),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_schedule_wakes_for_earlier_deletion(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_interaction = mock.Mock(application_id=hikari.Snowflake(123), token="meow")
+        scheduler = interactions.DeletionScheduler(rest=mock_rest, batch_window=0)
+
+        scheduler.schedule(mock_interaction, 60, message=hikari.Snowflake(1))
+        await asyncio.sleep(0)
+        scheduler.schedule(mock_interaction, 0.01, message=hikari.Snowflake(2))
+        await asyncio.sleep(0.03)
+
+        mock_rest.delete_webhook_message.assert_awaited_once_with(hikari.Snowflake(123), "meow", hikari.Snowflake(2))
+        assert len(scheduler) == 1
+        scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_schedule_ignores_not_found(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_rest.delete_interaction_response.side_effect = hikari.NotFoundError(url="", headers={}, raw_body="")
+        mock_interaction = mock.Mock(application_id=hikari.Snowflake(123), token="meow")
+        scheduler = interactions.DeletionScheduler(rest=mock_rest)
+
+        scheduler.schedule(mock_interaction, 0)
+        scheduler.schedule(mock_interaction, 0, message=hikari.Snowflake(55))
+        await asyncio.sleep(0.01)
+
+        mock_rest.delete_webhook_message.assert_awaited_once_with(hikari.Snowflake(123), "meow", hikari.Snowflake(55))
+        assert scheduler._task is None
+
+    @pytest.mark.asyncio
+    async def test_persists_to_store(self) -> None:
+        mock_rest = mock.AsyncMock()
+        store = interactions.SQLiteDeletionStore(":memory:")
+        mock_interaction = mock.Mock(application_id=hikari.Snowflake(123), token="meow")
+        scheduler = interactions.DeletionScheduler(rest=mock_rest, store=store)
+
+        scheduler.schedule(mock_interaction, 60, message=hikari.Snowflake(55))
+        scheduler.close()
+
+        assert len(scheduler) == 0
+        [deletion] = store.load()
+        assert deletion[1:] == (123, "meow", 55)
+        assert deletion.delete_at == pytest.approx(time.time() + 60, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_batches_store_writes(self) -> None:
+        store = mock.Mock(interactions.AbstractDeletionStore)
+        mock_interaction = mock.Mock(application_id=hikari.Snowflake(123), token="meow")
+        scheduler = interactions.DeletionScheduler(rest=mock.AsyncMock(), batch_window=0.01, store=store)
+
+        scheduler.schedule(mock_interaction, 60, message=hikari.Snowflake(55))
+        scheduler.schedule(mock_interaction, 60, message=hikari.Snowflake(56))
+        store.add.assert_not_called()
+        await asyncio.sleep(0.03)
+
+        [deletions] = store.add.call_args.args
+        assert [deletion.message_id for deletion in deletions] == [55, 56]
+        store.add.assert_called_once()
+        scheduler.close()
+
+    @pytest.mark.asyncio
+    async def test_stores_deletion_before_removing_it(self) -> None:
+        store = interactions.SQLiteDeletionStore(":memory:")
+        mock_interaction = mock.Mock(application_id=hikari.Snowflake(123), token="meow")
+        scheduler = interactions.DeletionScheduler(rest=mock.AsyncMock(), batch_window=10, store=store)
+
+        scheduler.schedule(mock_interaction, 0, message=hikari.Snowflake(55))
+        await asyncio.sleep(0.01)
+
+        assert store.load() == []
+        assert scheduler._task is None
+
+    @pytest.mark.asyncio
+    async def test_close_without_store_keeps_making_deletions(self) -> None:
+        mock_rest = mock.AsyncMock()
+        mock_interaction = mock.Mock(application_id=hikari.Snowflake(123), token="meow")
+        scheduler = interactions.DeletionScheduler(rest=mock_rest, batch_window=0)
+        scheduler.schedule(mock_interaction, 0.01)
+
+        scheduler.close()
+
+        assert len(scheduler) == 1
+        await asyncio.sleep(0.03)
+        mock_rest.delete_interaction_response.assert_awaited_once_with(hikari.Snowflake(123), "meow")
+        assert len(scheduler) == 0
+        assert scheduler._task is None
+
+    @pytest.mark.asyncio
+    async def test_open_loads_from_store(self) -> None:
+        mock_rest = mock.AsyncMock()
+        store = interactions.SQLiteDeletionStore(":memory:")
+        store.add([interactions.PendingDeletion(time.time() - 5, hikari.Snowflake(123), "meow", None)])
+        scheduler = interactions.DeletionScheduler(rest=mock_rest, store=store)
+
+        scheduler.open()
+        await asyncio.sleep(0.01)
+
+        mock_rest.delete_interaction_response.assert_awaited_once_with(hikari.Snowflake(123), "meow")
+        assert store.load() == []
+
+    def test_init_when_store_without_rest(self) -> None:
+        with pytest.raises(ValueError, match="A REST client must be provided to load stored deletions"):
+            interactions.DeletionScheduler(store=mock.Mock(interactions.AbstractDeletionStore))
+
+
+class TestCoalescingEditor:
+    @pytest.mark.asyncio
+    async def test_edit_coalesces_pending_edits(self) -> None:
+        mock_ctx = mock.Mock(edit_initial_response=mock.AsyncMock())
+        editor = interactions.CoalescingEditor(mock_ctx, interval=0.05)
+
+        editor.edit("1")
+        await asyncio.sleep(0)
+        editor.edit("2", embed=mock.Mock())
+        editor.edit("3")
+        editor.edit(embeds=[])
+        result = await editor.close()
+
+        assert result is mock_ctx.edit_initial_response.return_value
+        assert editor.message is result
+        assert not editor.is_pending
+        assert mock_ctx.edit_initial_response.await_args_list == [
+            mock.call(content="1"),
+            mock.call(content="3", embeds=[]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_edit_respects_interval(self) -> None:
+        mock_ctx = mock.Mock(edit_initial_response=mock.AsyncMock())
+        editor = interactions.CoalescingEditor(mock_ctx, interval=0.1)
+
+        editor.edit("1")
+        await editor.flush()
+        start = time.monotonic()
+        editor.edit("2")
+        await editor.flush()
+
+        assert time.monotonic() - start >= 0.09
+        assert mock_ctx.edit_initial_response.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_edit_when_last_response(self) -> None:
+        mock_ctx = mock.Mock(edit_last_response=mock.AsyncMock())
+
+        async with interactions.CoalescingEditor(mock_ctx, last_response=True) as editor:
+            editor.edit("hi", component=None)
+
+        mock_ctx.edit_last_response.assert_awaited_once_with(content="hi", component=None)
+        mock_ctx.edit_initial_response.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_edit_when_closed(self) -> None:
+        editor = interactions.CoalescingEditor(mock.Mock())
+        await editor.close()
+
+        with pytest.raises(RuntimeError, match="Editor has been closed"):
+            editor.edit("hi")
+
+    @pytest.mark.asyncio
+    async def test_flush_raises_edit_error(self) -> None:
+        error = hikari.NotFoundError(url="", headers={}, raw_body="")
+        mock_ctx = mock.Mock(edit_initial_response=mock.AsyncMock(side_effect=[error, mock.Mock()]))
+        editor = interactions.CoalescingEditor(mock_ctx, interval=0)
+        editor.edit("hi")
+
+        with pytest.raises(hikari.NotFoundError):
+            await editor.flush()
+
+        editor.edit("bye")
+        assert await editor.flush() is not None
+
+    @pytest.mark.asyncio
+    async def test_aexit_doesnt_mask_body_error(self, caplog: pytest.LogCaptureFixture) -> None:
+        error = hikari.NotFoundError(url="", headers={}, raw_body="")
+        mock_ctx = mock.Mock(edit_initial_response=mock.AsyncMock(side_effect=error))
+
+        body_error = KeyError("body")
+
+        with pytest.raises(KeyError) as exc_info:  # noqa: PT012
+            async with interactions.CoalescingEditor(mock_ctx, interval=0) as editor:
+                editor.edit("hi")
+                await asyncio.sleep(0)
+                raise body_error
+
+        assert exc_info.value is body_error
+
+        mock_ctx.edit_initial_response.assert_awaited_once_with(content="hi")
+        assert any(
+            record.levelname == "WARNING" and record.exc_info and record.exc_info[1] is error
+            for record in caplog.records
+        )
+
+    @pytest.mark.asyncio
+    async def test_aexit_raises_edit_error(self) -> None:
+        error = hikari.NotFoundError(url="", headers={}, raw_body="")
+        mock_ctx = mock.Mock(edit_initial_response=mock.AsyncMock(side_effect=error))
+
+        with pytest.raises(hikari.NotFoundError):
+            async with interactions.CoalescingEditor(mock_ctx, interval=0) as editor:
+                editor.edit("hi")
+
+
+class TestBaseContext:
+    @pytest.mark.asyncio
+    async def test_coalesce_edits(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+
+        async with ctx.coalesce_edits(interval=0) as editor:
+            editor.edit("hi")
+
+        mock_interaction.edit_initial_response.assert_awaited_once()
+        assert editor.message is mock_interaction.edit_initial_response.return_value
+        assert await ctx.fetch_initial_response() is editor.message
+
+    @pytest.mark.asyncio
+    async def test_create_followup_with_deletion_scheduler(self) -> None:
+        mock_scheduler = mock.Mock(interactions.DeletionScheduler)
+        mock_register_task = mock.Mock()
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        ctx = yuyo.components.Context(
+            mock.Mock(), mock_interaction, "", "", mock_register_task, deletion_scheduler=mock_scheduler
+        )
+
+        message = await ctx.create_followup("hi", delete_after=datetime.timedelta(seconds=30))
+
+        mock_scheduler.schedule.assert_called_once_with(mock_interaction, 30.0, message=message)
+        mock_register_task.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_initial_response_with_deletion_scheduler(self) -> None:
+        mock_scheduler = mock.Mock(interactions.DeletionScheduler)
+        mock_register_task = mock.Mock()
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        ctx = yuyo.components.Context(
+            mock.Mock(), mock_interaction, "", "", mock_register_task, deletion_scheduler=mock_scheduler
+        )
+
+        await ctx.create_initial_response("hi", delete_after=30)
+
+        mock_scheduler.schedule.assert_called_once_with(mock_interaction, 30.0)
+        mock_register_task.assert_not_called()
+
+    def test_response_lock_is_created_lazily(self) -> None:
+        ctx = yuyo.components.Context(mock.Mock(), mock.Mock(), "", "", mock.Mock())
+
+        assert ctx._lock is None
+
+        lock = ctx._response_lock
+
+        assert isinstance(lock, asyncio.Lock)
+        assert ctx._response_lock is lock
+
+    @pytest.mark.asyncio
+    async def test_fetch_last_response_uses_message_from_create_followup(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+        message = await ctx.create_followup("hi")
+
+        result = await ctx.fetch_last_response()
+
+        assert result is message
+        mock_interaction.fetch_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_last_response_when_forced(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+        message = await ctx.create_followup("hi")
+
+        result = await ctx.fetch_last_response(force=True)
+
+        assert result is mock_interaction.fetch_message.return_value
+        mock_interaction.fetch_message.assert_awaited_once_with(message.id)
+        assert await ctx.fetch_last_response() is result
+        mock_interaction.fetch_message.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_last_response_after_delete_last_response(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+        message = await ctx.create_followup("hi")
+        await ctx.delete_last_response()
+
+        result = await ctx.fetch_last_response()
+
+        assert result is mock_interaction.fetch_message.return_value
+        mock_interaction.fetch_message.assert_awaited_once_with(message.id)
+
+    @pytest.mark.asyncio
+    async def test_fetch_initial_response_uses_message_from_edit_initial_response(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+
+        await ctx.edit_initial_response("hi")
+        result = await ctx.fetch_initial_response()
+
+        assert result is mock_interaction.edit_initial_response.return_value
+        mock_interaction.fetch_initial_response.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_initial_response_caches_result(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+
+        result = await ctx.fetch_initial_response()
+
+        assert result is mock_interaction.fetch_initial_response.return_value
+        assert await ctx.fetch_initial_response() is result
+        mock_interaction.fetch_initial_response.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_fetch_initial_response_after_delete_initial_response(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+        await ctx.edit_initial_response("hi")
+        await ctx.delete_initial_response()
+
+        result = await ctx.fetch_initial_response()
+
+        assert result is mock_interaction.fetch_initial_response.return_value
+        mock_interaction.fetch_initial_response.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_fetch_last_response_after_edit_initial_response_when_followup_completed_deferral(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        mock_interaction.execute.return_value = mock.Mock(id=hikari.Snowflake(123))
+        mock_interaction.edit_initial_response.return_value = mock.Mock(id=hikari.Snowflake(123))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+        await ctx.defer()
+        await ctx.create_followup("hi")
+
+        await ctx.edit_initial_response("bye")
+        result = await ctx.fetch_last_response()
+
+        assert result is mock_interaction.edit_initial_response.return_value
+        mock_interaction.fetch_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetch_initial_response_after_edit_last_response_when_followup_completed_deferral(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        mock_interaction.fetch_initial_response.return_value = mock.Mock(id=hikari.Snowflake(123))
+        mock_interaction.execute.return_value = mock.Mock(id=hikari.Snowflake(123))
+        mock_interaction.edit_message.return_value = mock.Mock(id=hikari.Snowflake(123))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+        await ctx.defer()
+        await ctx.fetch_initial_response()
+        await ctx.create_followup("hi")
+
+        await ctx.edit_last_response("bye")
+        result = await ctx.fetch_initial_response()
+
+        assert result is mock_interaction.edit_message.return_value
+        mock_interaction.fetch_initial_response.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_fetch_last_response_after_delete_initial_response_when_followup_completed_deferral(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        mock_interaction.execute.return_value = mock.Mock(id=hikari.Snowflake(123))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+        await ctx.defer()
+        await ctx.create_followup("hi")
+        await ctx.delete_initial_response()
+
+        result = await ctx.fetch_last_response()
+
+        assert result is mock_interaction.fetch_message.return_value
+        mock_interaction.fetch_message.assert_awaited_once_with(hikari.Snowflake(123))
+
+    @pytest.mark.asyncio
+    async def test_fetch_last_response_after_delete_initial_response_keeps_separate_followup(self) -> None:
+        mock_interaction = mock.AsyncMock(created_at=datetime.datetime.now(tz=datetime.UTC))
+        mock_interaction.edit_initial_response.return_value = mock.Mock(id=hikari.Snowflake(123))
+        mock_interaction.execute.return_value = mock.Mock(id=hikari.Snowflake(321))
+        ctx = yuyo.components.Context(mock.Mock(), mock_interaction, "", "", mock.Mock())
+        await ctx.edit_initial_response("hi")
+        message = await ctx.create_followup("bye")
+        await ctx.delete_initial_response()
+
+        result = await ctx.fetch_last_response()
+
+        assert result is message
+        mock_interaction.fetch_message.assert_not_called()
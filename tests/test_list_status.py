@@ -32,15 +32,25 @@
 # pyright: reportUnknownMemberType=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
 import datetime
+import json
+import pathlib
+import random
+import time
+from collections import abc as collections
 from unittest import mock
 
+import aiohttp
 import hikari
 import pytest
+import pytest_asyncio
 
 from yuyo import _internal
 from yuyo import list_status
 
+from . import _list_status_stub
+
 try:
     import tanjun
 
@@ -48,6 +58,21 @@ except ModuleNotFoundError:
     tanjun = None
 
 
+@pytest_asyncio.fixture()  # pyright: ignore[reportUntypedFunctionDecorator]
+async def stub_server() -> collections.AsyncIterator[_list_status_stub.StubListServer]:
+    async with _list_status_stub.StubListServer() as server:
+        yield server
+
+
+def _stub_manager(session: aiohttp.ClientSession, counts: int | dict[int, int], /) -> mock.Mock:
+    manager = mock.Mock(get_me=mock.AsyncMock(), user_agent="stub")
+    manager.counter.count = mock.AsyncMock(return_value=counts)
+    manager.get_me.return_value.id = hikari.Snowflake(123)
+    manager.get_session.return_value = session
+    manager.shards.shard_count = 4
+    return manager
+
+
 class TestCacheStrategy:
     def test_is_shard_bound_property(self) -> None:
         assert list_status.CacheStrategy(mock.Mock(), mock.AsyncMock()).is_shard_bound is True
@@ -77,6 +102,25 @@ class TestCacheStrategy:
 
         assert await strategy.count() == {0: 0, 1: 0, 2: 3, 3: 2}
 
+    @pytest.mark.asyncio
+    async def test_count_reuses_recent_count(self) -> None:
+        mock_cache = mock.Mock()
+        mock_cache.get_guilds_view.return_value = {342343242301298764: mock.Mock()}
+        mock_shards = mock.AsyncMock(shard_count=1, shards={0: mock.Mock()})
+        strategy = list_status.CacheStrategy(mock_cache, mock_shards, max_age=30)
+
+        with mock.patch.object(time, "monotonic", return_value=100.0) as monotonic:
+            assert await strategy.count() == {0: 1}
+
+            mock_cache.get_guilds_view.return_value = {342343242301298764: mock.Mock(), 123: mock.Mock()}
+            monotonic.return_value = 130.0
+            assert await strategy.count() == {0: 1}
+
+            monotonic.return_value = 130.1
+            assert await strategy.count() == {0: 2}
+
+        assert mock_cache.get_guilds_view.call_count == 2
+
     def test_spawn(self) -> None:
         mock_cache = mock.Mock()
         mock_cache.settings = hikari.impl.CacheSettings(
@@ -173,6 +217,163 @@ class TestSakeStrategy:
         with pytest.raises(list_status.CountUnknownError):
             await strategy.count()
 
+    @pytest.mark.asyncio
+    async def test_count_reuses_count_within_max_age(self) -> None:
+        mock_cache = mock.Mock()
+        mock_cache.iter_guilds.return_value.len = mock.AsyncMock(side_effect=[123, 456])
+        strategy = list_status.SakeStrategy(mock_cache, max_age=datetime.timedelta(seconds=30))
+
+        with mock.patch.object(time, "monotonic", return_value=100.0) as monotonic:
+            assert await strategy.count() == 123
+            monotonic.return_value = 129.0
+            assert await strategy.count() == 123
+            monotonic.return_value = 130.0
+            assert await strategy.count() == 456
+
+        assert mock_cache.iter_guilds.return_value.len.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_count_shares_in_flight_fetch(self) -> None:
+        event = asyncio.Event()
+        calls = 0
+
+        async def len_() -> int:
+            nonlocal calls
+            calls += 1
+            await event.wait()
+            return 4321
+
+        mock_cache = mock.Mock()
+        mock_cache.iter_guilds.return_value.len = len_
+        strategy = list_status.SakeStrategy(mock_cache, max_age=0)
+
+        tasks = [asyncio.create_task(strategy.count()) for _ in range(5)]
+        await asyncio.sleep(0)
+        tasks[0].cancel()
+        event.set()
+
+        assert await asyncio.gather(*tasks[1:]) == [4321, 4321, 4321, 4321]
+        assert calls == 1
+        assert tasks[0].cancelled()
+
+
+class TestSharedFileStrategy:
+    def test_init_when_strategy_not_shard_bound(self) -> None:
+        with pytest.raises(ValueError, match="The local strategy must be shard bound"):
+            list_status.SharedFileStrategy(mock.Mock(is_shard_bound=False), mock.Mock(), "")
+
+    def test_is_shard_bound_property(self) -> None:
+        strategy = list_status.SharedFileStrategy(mock.Mock(is_shard_bound=True), mock.Mock(), "")
+
+        assert strategy.is_shard_bound is False
+
+    @pytest.mark.asyncio
+    async def test_count(self, tmp_path: pathlib.Path) -> None:
+        local_strategy_1 = mock.Mock(is_shard_bound=True, count=mock.AsyncMock(return_value={0: 5, 1: 7}))
+        local_strategy_2 = mock.Mock(is_shard_bound=True, count=mock.AsyncMock(return_value={2: 3, 3: 11}))
+        strategy_1 = list_status.SharedFileStrategy(
+            local_strategy_1, mock.Mock(shard_count=4, shards={0: mock.Mock(), 1: mock.Mock()}), tmp_path
+        )
+        strategy_2 = list_status.SharedFileStrategy(
+            local_strategy_2, mock.Mock(shard_count=4, shards={2: mock.Mock(), 3: mock.Mock()}), tmp_path
+        )
+        await strategy_2._publish()
+
+        assert await strategy_1.count() == 26
+
+        with pytest.raises(list_status.CountUnknownError):
+            await strategy_2.count()
+
+    @pytest.mark.asyncio
+    async def test_count_when_missing_shards(self, tmp_path: pathlib.Path) -> None:
+        local_strategy = mock.Mock(is_shard_bound=True, count=mock.AsyncMock(return_value={0: 5, 1: 7}))
+        strategy = list_status.SharedFileStrategy(
+            local_strategy, mock.Mock(shard_count=4, shards={0: mock.Mock(), 1: mock.Mock()}), tmp_path
+        )
+
+        with pytest.raises(list_status.CountUnknownError):
+            await strategy.count()
+
+    @pytest.mark.asyncio
+    async def test_count_ignores_stale_counts(self, tmp_path: pathlib.Path) -> None:
+        local_strategy_1 = mock.Mock(is_shard_bound=True, count=mock.AsyncMock(return_value={0: 5}))
+        local_strategy_2 = mock.Mock(is_shard_bound=True, count=mock.AsyncMock(return_value={1: 3}))
+        strategy_1 = list_status.SharedFileStrategy(
+            local_strategy_1, mock.Mock(shard_count=2, shards={0: mock.Mock()}), tmp_path, max_age=60
+        )
+        strategy_2 = list_status.SharedFileStrategy(
+            local_strategy_2, mock.Mock(shard_count=2, shards={1: mock.Mock()}), tmp_path
+        )
+        with mock.patch.object(time, "time", return_value=1000.0):
+            await strategy_2._publish()
+
+        with mock.patch.object(time, "time", return_value=1061.0), pytest.raises(list_status.CountUnknownError):
+            await strategy_1.count()
+
+        with mock.patch.object(time, "time", return_value=1060.0):
+            assert await strategy_1.count() == 8
+
+    @pytest.mark.asyncio
+    async def test_count_when_aggregate_passed(self, tmp_path: pathlib.Path) -> None:
+        local_strategy = mock.Mock(is_shard_bound=True, count=mock.AsyncMock(return_value={1: 3}))
+        strategy = list_status.SharedFileStrategy(
+            local_strategy, mock.Mock(shard_count=1, shards={1: mock.Mock()}), tmp_path, aggregate=True
+        )
+
+        with pytest.raises(list_status.CountUnknownError):
+            await strategy.count()
+
+        local_strategy.count.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_publish_when_no_shards(self, tmp_path: pathlib.Path) -> None:
+        local_strategy = mock.Mock(is_shard_bound=True, count=mock.AsyncMock(return_value={}))
+        strategy = list_status.SharedFileStrategy(local_strategy, mock.Mock(shard_count=4, shards={}), tmp_path)
+
+        await strategy._publish()
+
+        assert list(tmp_path.iterdir()) == []  # noqa: ASYNC240
+        local_strategy.count.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publish_when_shards_changed(self, tmp_path: pathlib.Path) -> None:
+        local_strategy = mock.Mock(is_shard_bound=True, count=mock.AsyncMock(return_value={0: 5}))
+        shards = mock.Mock(shard_count=4, shards={0: mock.Mock()})
+        strategy = list_status.SharedFileStrategy(local_strategy, shards, tmp_path)
+        await strategy._publish()
+
+        shards.shards = {1: mock.Mock(), 2: mock.Mock()}
+        local_strategy.count.return_value = {1: 3, 2: 4}
+        await strategy._publish()
+
+        assert [path.name for path in tmp_path.iterdir()] == ["shards-1-2.json"]  # noqa: ASYNC240
+
+    @pytest.mark.asyncio
+    async def test_open_and_close(self, tmp_path: pathlib.Path) -> None:
+        local_strategy = mock.AsyncMock(is_shard_bound=True)
+        local_strategy.count.return_value = {4: 3, 5: 1}
+        directory = tmp_path / "counts"
+        strategy = list_status.SharedFileStrategy(
+            local_strategy, mock.Mock(shard_count=6, shards={4: mock.Mock(), 5: mock.Mock()}), directory
+        )
+
+        await strategy.open()
+        path = directory / "shards-4-5.json"
+        # The file is written in another thread.
+        for _ in range(100):
+            if path.exists():
+                break
+
+            await asyncio.sleep(0.01)
+
+        local_strategy.open.assert_awaited_once_with()
+        assert json.loads(path.read_text())["counts"] == {"4": 3, "5": 1}
+
+        await strategy.close()
+
+        local_strategy.close.assert_awaited_once_with()
+        assert not path.exists()
+
 
 class TestEventStrategy:
     def test_is_shard_bound_property(self) -> None:
@@ -422,6 +623,40 @@ class TestEventStrategy:
 
         assert await strategy.count() == {0: 1, 1: 1}
 
+    @pytest.mark.asyncio
+    async def test_count_after_shard_count_changes(self) -> None:
+        event_manager = hikari.impl.EventManagerImpl(
+            mock.Mock(), mock.Mock(), hikari.Intents.ALL, auto_chunk_members=False
+        )
+        mock_shards = mock.AsyncMock(shard_count=1, shards={0: mock.Mock()})
+        strategy = list_status.EventStrategy(event_manager, mock_shards)
+        await strategy.open()
+        await event_manager.dispatch(
+            hikari.ShardReadyEvent(
+                shard=mock.AsyncMock(),
+                actual_gateway_version=10,
+                resume_gateway_url="yeet",
+                session_id="meow",
+                my_user=mock.Mock(),
+                unavailable_guilds=[
+                    hikari.Snowflake(634234),
+                    hikari.Snowflake(65234123),
+                    hikari.Snowflake(876547234),
+                    hikari.Snowflake(887643234),
+                    hikari.Snowflake(123),
+                    hikari.Snowflake(44532134),
+                ],
+                application_id=hikari.Snowflake(54123),
+                application_flags=hikari.ApplicationFlags(0),
+            )
+        )
+        assert await strategy.count() == {0: 6}
+
+        mock_shards.shard_count = 4
+        mock_shards.shards = {0: mock.Mock(), 1: mock.Mock(), 2: mock.Mock(), 3: mock.Mock()}
+
+        assert await strategy.count() == {0: 3, 1: 0, 2: 1, 3: 2}
+
     @pytest.mark.asyncio
     async def test_count_after_starting_event(self) -> None:
         ready_event = hikari.ShardReadyEvent(
@@ -718,6 +953,208 @@ class TestServiceManager:
             decorated_service_1,
         ]
 
+    def test_add_service_with_jitter_and_timeout(self) -> None:
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=mock.AsyncMock(is_shard_bound=False))
+        mock_service_1 = mock.AsyncMock()
+        mock_service_2 = mock.AsyncMock()
+
+        manager.add_service(mock_service_1, repeat=60, jitter=datetime.timedelta(seconds=5), timeout=10)
+        manager.add_service(mock_service_2, repeat=datetime.timedelta(minutes=2))
+
+        service_1, service_2 = manager._services
+        assert service_1.jitter == 5
+        assert service_1.timeout == 10
+        assert service_2.jitter == 0
+        assert service_2.timeout == 120
+
+    def test_service_queue(self) -> None:
+        service_1 = list_status._ServiceDescriptor(mock.AsyncMock(), 10, timeout=10)
+        service_2 = list_status._ServiceDescriptor(mock.AsyncMock(), 25, timeout=25)
+        service_3 = list_status._ServiceDescriptor(mock.AsyncMock(), 10, timeout=10)
+        queue = list_status._ServiceQueue([service_1, service_2, service_3], 100.0)
+
+        assert queue.next_deadline == 110
+        assert queue.pop_due(109.9) == []
+        assert queue.pop_due(110) == [service_1, service_3]
+        assert queue.next_deadline == 125
+
+        # A call which took longer than the interval doesn't push back the schedule.
+        queue.push(service_1, 110)
+        queue.push(service_3, 110)
+
+        assert queue.pop_due(120) == [service_1, service_3]
+        assert queue.pop_due(125) == [service_2]
+        assert queue.next_deadline is None
+
+    def test_service_queue_with_jitter(self) -> None:
+        service = list_status._ServiceDescriptor(mock.AsyncMock(), 10, jitter=4, timeout=10)
+
+        with mock.patch.object(random, "uniform", return_value=3.5) as uniform:
+            queue = list_status._ServiceQueue([service], 50.0)
+
+        uniform.assert_called_once_with(0, 4)
+        assert queue.next_deadline == 63.5
+
+    @pytest.mark.asyncio
+    async def test_call_service_when_times_out(self) -> None:
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=mock.AsyncMock(is_shard_bound=False))
+        cancelled = False
+
+        async def service(_: list_status.AbstractManager, /) -> None:
+            nonlocal cancelled
+            try:
+                await asyncio.sleep(10)
+
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+
+        await manager._call_service(list_status._ServiceDescriptor(service, 1, timeout=0.01))
+
+        assert cancelled is True
+
+    @pytest.mark.asyncio
+    async def test_call_service_skips_when_count_unchanged(self) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+        strategy.count.return_value = {0: 50, 1: 60}
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=strategy)
+        service = mock.AsyncMock()
+        descriptor = list_status._ServiceDescriptor(service, 1, min_change=5, timeout=1)
+
+        await manager._call_service(descriptor)
+        strategy.count.return_value = {0: 52, 1: 58}
+        await manager._call_service(descriptor)
+
+        service.assert_awaited_once_with(manager)
+        assert manager.skipped_calls == 1
+        assert descriptor.last_count == {0: 50, 1: 60}
+
+    @pytest.mark.asyncio
+    async def test_call_service_when_count_changed_by_min_change(self) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+        strategy.count.return_value = 100
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=strategy)
+        service = mock.AsyncMock()
+        descriptor = list_status._ServiceDescriptor(service, 1, min_change=5, timeout=1)
+
+        await manager._call_service(descriptor)
+        strategy.count.return_value = 95
+        await manager._call_service(descriptor)
+
+        assert service.await_count == 2
+        assert manager.skipped_calls == 0
+        assert descriptor.last_count == 95
+
+    @pytest.mark.asyncio
+    async def test_call_service_when_max_staleness_reached(self) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+        strategy.count.return_value = 100
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=strategy)
+        service = mock.AsyncMock()
+        descriptor = list_status._ServiceDescriptor(service, 1, max_staleness=60, min_change=1, timeout=1)
+
+        with mock.patch.object(time, "monotonic", return_value=1000.0) as monotonic:
+            await manager._call_service(descriptor)
+            monotonic.return_value = 1059.0
+            await manager._call_service(descriptor)
+            monotonic.return_value = 1060.0
+            await manager._call_service(descriptor)
+
+        assert service.await_count == 2
+        assert manager.skipped_calls == 1
+        assert descriptor.last_called_at == 1060.0
+
+    @pytest.mark.asyncio
+    async def test_call_service_doesnt_record_count_when_service_fails(self) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+        strategy.count.return_value = 100
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=strategy)
+        service = mock.AsyncMock(side_effect=RuntimeError)
+        descriptor = list_status._ServiceDescriptor(service, 1, min_change=1, timeout=1)
+
+        await manager._call_service(descriptor)
+        await manager._call_service(descriptor)
+
+        assert service.await_count == 2
+        assert descriptor.last_count is None
+
+    @pytest.mark.asyncio
+    async def test_call_service_when_count_unknown_with_min_change(self) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+        strategy.count.side_effect = list_status.CountUnknownError
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=strategy)
+        service = mock.AsyncMock()
+
+        await manager._call_service(list_status._ServiceDescriptor(service, 1, min_change=1, timeout=1))
+
+        service.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_call_service_when_count_raises_with_min_change(self, caplog: pytest.LogCaptureFixture) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+        error = RuntimeError("meow")
+        strategy.count.side_effect = error
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=strategy)
+        service = mock.AsyncMock()
+        descriptor = list_status._ServiceDescriptor(service, 1, min_change=1, timeout=1)
+
+        await manager._call_service(descriptor)
+
+        service.assert_not_called()
+        assert descriptor.stats.failures == 1
+        assert descriptor.stats.consecutive_failures == 1
+        assert any(record.exc_info and record.exc_info[1] is error for record in caplog.records)
+
+    @pytest.mark.asyncio
+    async def test_call_service_when_count_times_out_with_min_change(self) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+
+        async def count() -> int:
+            await asyncio.sleep(10)
+            return 1
+
+        strategy.count.side_effect = count
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=strategy)
+        service = mock.AsyncMock()
+        descriptor = list_status._ServiceDescriptor(service, 1, min_change=1, timeout=0.01)
+
+        await manager._call_service(descriptor)
+
+        service.assert_not_called()
+        assert descriptor.stats.failures == 1
+        assert descriptor.last_count is None
+
+    def test_count_change(self) -> None:
+        assert list_status._count_change(10, 4) == 6
+        assert list_status._count_change({0: 5, 1: 5}, 13) == 3
+        assert list_status._count_change({0: 5, 1: 5}, {1: 7, 2: 1}) == 8
+
+    @pytest.mark.asyncio
+    async def test_loop_calls_services_concurrently(self) -> None:
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=mock.AsyncMock(is_shard_bound=False))
+        hanging_event = asyncio.Event()
+        fast_calls = 0
+
+        async def hanging_service(_: list_status.AbstractManager, /) -> None:
+            await hanging_event.wait()
+
+        async def fast_service(_: list_status.AbstractManager, /) -> None:
+            nonlocal fast_calls
+            fast_calls += 1
+
+        manager._services = [
+            list_status._ServiceDescriptor(hanging_service, 0.01, timeout=10),
+            list_status._ServiceDescriptor(fast_service, 0.02, timeout=10),
+        ]
+        task = asyncio.create_task(manager._loop())
+        await asyncio.sleep(0.15)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert fast_calls >= 4
+
     @pytest.mark.skip(reason="TODO")
     @pytest.mark.asyncio
     async def test_open(self) -> None: ...
@@ -733,6 +1170,379 @@ class TestServiceManager:
     @pytest.mark.skip(reason="TODO")
     def test_get_session(self) -> None: ...
 
+    @pytest.mark.asyncio
+    async def test_call_service_records_stats(self) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+        strategy.count.return_value = 5
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=strategy)
+        service = mock.AsyncMock(side_effect=[RuntimeError, TimeoutError, None])
+        descriptor = list_status._ServiceDescriptor(service, 1, min_change=0, timeout=1)
+
+        await manager._call_service(descriptor)
+        await manager._call_service(descriptor)
+        assert descriptor.stats.consecutive_failures == 2
+
+        await manager._call_service(descriptor)
+
+        assert descriptor.stats.consecutive_failures == 0
+        assert descriptor.stats.failures == 2
+        assert descriptor.stats.successes == 1
+        assert descriptor.stats.count_calls == 3
+
+    @pytest.mark.asyncio
+    async def test_call_service_records_request_stats(self, stub_server: _list_status_stub.StubListServer) -> None:
+        stub_server.top_gg_shards = [1, 2]
+        strategy = mock.AsyncMock(is_shard_bound=True)
+        strategy.count.return_value = {0: 3}
+        service = list_status.TopGGService("token")
+
+        rest = mock.AsyncMock()
+        rest.fetch_my_user.return_value = mock.Mock(id=hikari.Snowflake(123))
+
+        async with stub_server.make_session(trace_configs=[list_status.make_trace_config()]) as session:
+            manager = list_status.ServiceManager(
+                rest, session=session, shards=mock.Mock(shard_count=2), strategy=strategy, user_agent="stub"
+            ).add_service(service)
+            manager._task = mock.Mock()
+            descriptor = manager._services[0]
+
+            await manager._call_service(descriptor)
+            stub_server.add_rule(_list_status_stub.TOP_GG, 500)
+            await manager._call_service(descriptor)
+
+        stats = manager.get_service_stats(service)
+        assert stats.status_counts == {200: 2, 500: 1}
+        assert stats.post_latency_count == 2
+        assert stats.successes == 1
+        assert stats.failures == 1
+        assert stats.consecutive_failures == 1
+        assert stats.count_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_call_service_when_post_fails_without_trace_config(
+        self, stub_server: _list_status_stub.StubListServer
+    ) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+        strategy.count.return_value = 50
+        service = list_status.BotsGGService("token")
+        rest = mock.AsyncMock()
+        rest.fetch_my_user.return_value = mock.Mock(id=hikari.Snowflake(123))
+        stub_server.add_rule(_list_status_stub.BOTS_GG, 500)
+
+        async with stub_server.make_session() as session:
+            manager = list_status.ServiceManager(
+                rest, session=session, strategy=strategy, user_agent="stub"
+            ).add_service(service, min_change=1)
+            manager._task = mock.Mock()
+            descriptor = manager._services[0]
+
+            await manager._call_service(descriptor)
+            assert descriptor.last_count is None
+
+            strategy.count.return_value = 51
+            await manager._call_service(descriptor)
+
+        assert descriptor.last_count == 51
+        stats = manager.get_service_stats(service)
+        assert stats.failures == 1
+        assert stats.successes == 1
+
+    @pytest.mark.asyncio
+    async def test_call_service_when_shard_posts_fail_without_trace_config(
+        self, stub_server: _list_status_stub.StubListServer
+    ) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=True)
+        strategy.count.return_value = {0: 5, 1: 6}
+        service = list_status.DiscordBotListService("token")
+        rest = mock.AsyncMock()
+        rest.fetch_my_user.return_value = mock.Mock(id=hikari.Snowflake(123))
+        stub_server.add_rule(_list_status_stub.DISCORD_BOT_LIST, 401, shard_id=1)
+
+        async with stub_server.make_session() as session:
+            manager = list_status.ServiceManager(
+                rest, session=session, shards=mock.Mock(shard_count=2), strategy=strategy, user_agent="stub"
+            ).add_service(service, min_change=1)
+            manager._task = mock.Mock()
+            descriptor = manager._services[0]
+
+            await manager._call_service(descriptor)
+
+        assert descriptor.last_count is None
+        assert manager.get_service_stats(service).failures == 1
+
+    @pytest.mark.asyncio
+    async def test_call_service_with_min_change_only_counts_once(
+        self, stub_server: _list_status_stub.StubListServer
+    ) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=False)
+        strategy.count.side_effect = [50, 60]
+        service = list_status.BotsGGService("token")
+        rest = mock.AsyncMock()
+        rest.fetch_my_user.return_value = mock.Mock(id=hikari.Snowflake(123))
+
+        async with stub_server.make_session() as session:
+            manager = list_status.ServiceManager(
+                rest, session=session, strategy=strategy, user_agent="stub"
+            ).add_service(service, min_change=1)
+            manager._task = mock.Mock()
+            descriptor = manager._services[0]
+
+            await manager._call_service(descriptor)
+
+        strategy.count.assert_awaited_once_with()
+        assert stub_server.posts(_list_status_stub.BOTS_GG) == [{"guildCount": 50}]
+        assert descriptor.last_count == 50
+        assert manager.get_service_stats(service).count_calls == 1
+
+    @pytest.mark.asyncio
+    async def test_call_service_when_failed_request_retried(
+        self, stub_server: _list_status_stub.StubListServer
+    ) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=True)
+        strategy.count.return_value = {0: 5}
+        service = list_status.DiscordBotListService("token")
+        rest = mock.AsyncMock()
+        rest.fetch_my_user.return_value = mock.Mock(id=hikari.Snowflake(123))
+        stub_server.add_rule(_list_status_stub.DISCORD_BOT_LIST, 500, retry_after=0)
+
+        async with stub_server.make_session(trace_configs=[list_status.make_trace_config()]) as session:
+            manager = list_status.ServiceManager(
+                rest, session=session, shards=mock.Mock(shard_count=1), strategy=strategy, user_agent="stub"
+            ).add_service(service, min_change=1)
+            manager._task = mock.Mock()
+            descriptor = manager._services[0]
+
+            # This disables the backoff's jitter.
+            with mock.patch.object(random, "random", return_value=0.0):
+                await manager._call_service(descriptor)
+
+        stats = manager.get_service_stats(service)
+        assert stats.status_counts == {500: 1, 200: 1}
+        assert stats.successes == 1
+        assert stats.failures == 0
+        assert descriptor.last_count == {0: 5}
+
+    def test_get_service_stats_when_not_found(self) -> None:
+        manager = list_status.ServiceManager(mock.AsyncMock(), strategy=mock.AsyncMock(is_shard_bound=False))
+
+        with pytest.raises(ValueError, match="Couldn't find service"):
+            manager.get_service_stats(mock.AsyncMock())
+
+    def test_render_prometheus_metrics(self) -> None:
+        async def my_service(_: list_status.AbstractManager, /) -> None: ...
+
+        manager = list_status.ServiceManager(
+            mock.AsyncMock(), strategy=mock.AsyncMock(is_shard_bound=False)
+        ).add_service(my_service)
+        stats = manager.get_service_stats(my_service)
+        stats.record_call(failed=True)
+        stats.record_response(503, 0.2, is_post=True)
+        stats.record_count(1.5)
+
+        result = manager.render_prometheus_metrics()
+
+        name = "TestServiceManager.test_render_prometheus_metrics.<locals>.my_service"
+        assert result.endswith("\n")
+        lines = result.splitlines()
+        assert "yuyo_list_status_skipped_calls_total 0" in lines
+        assert "# TYPE yuyo_list_status_post_latency_seconds histogram" in lines
+        assert f'yuyo_list_status_calls_total{{service="{name}",index="0",outcome="failure"}} 1' in lines
+        assert f'yuyo_list_status_consecutive_failures{{service="{name}",index="0"}} 1' in lines
+        assert f'yuyo_list_status_responses_total{{service="{name}",index="0",status="503"}} 1' in lines
+        assert f'yuyo_list_status_post_latency_seconds_bucket{{service="{name}",index="0",le="0.1"}} 0' in lines
+        assert f'yuyo_list_status_post_latency_seconds_bucket{{service="{name}",index="0",le="0.25"}} 1' in lines
+        assert f'yuyo_list_status_post_latency_seconds_bucket{{service="{name}",index="0",le="+Inf"}} 1' in lines
+        assert f'yuyo_list_status_post_latency_seconds_count{{service="{name}",index="0"}} 1' in lines
+        assert f'yuyo_list_status_count_seconds_total{{service="{name}",index="0"}} 1.5' in lines
+        assert not [line for line in lines if line.startswith("yuyo_list_status_last_success_timestamp_seconds")]
+
+    def test_render_prometheus_metrics_with_services_of_the_same_name(self) -> None:
+        manager = (
+            list_status.ServiceManager(mock.AsyncMock(), strategy=mock.AsyncMock(is_shard_bound=False))
+            .add_service(list_status.TopGGService("token"))
+            .add_service(list_status.TopGGService("other"))
+        )
+
+        lines = manager.render_prometheus_metrics().splitlines()
+
+        samples = [line.rsplit(" ", 1)[0] for line in lines if not line.startswith("#")]
+        assert len(samples) == len(set(samples))
+        assert 'yuyo_list_status_consecutive_failures{service="TopGGService",index="0"}' in samples
+        assert 'yuyo_list_status_consecutive_failures{service="TopGGService",index="1"}' in samples
+
+    def test_init_when_session_and_session_config_passed(self) -> None:
+        with pytest.raises(ValueError, match="session_config cannot be passed alongside session"):
+            list_status.ServiceManager(
+                mock.AsyncMock(),
+                session=mock.Mock(),
+                session_config=list_status.SessionConfig(),
+                strategy=mock.AsyncMock(is_shard_bound=False),
+            )
+
+    @pytest.mark.asyncio
+    async def test_open_and_close_with_session_config(self) -> None:
+        session_config = mock.Mock()
+        session_config.build_session.return_value.close = mock.AsyncMock()
+        session_config.build_session.return_value.closed = False
+        manager = list_status.ServiceManager(
+            mock.AsyncMock(), session_config=session_config, strategy=mock.AsyncMock(is_shard_bound=False)
+        ).add_service(mock.AsyncMock())
+
+        await manager.open()
+        session = manager.get_session()
+        await manager.close()
+
+        session_config.build_session.assert_called_once_with(trace_configs=[mock.ANY])
+        assert session is session_config.build_session.return_value
+        session_config.build_session.return_value.close.assert_awaited_once_with()
+
+    @pytest.mark.asyncio
+    async def test_open_and_close_with_shared_session(self) -> None:
+        async with aiohttp.ClientSession() as session:
+            manager = list_status.ServiceManager(
+                mock.AsyncMock(), session=session, strategy=mock.AsyncMock(is_shard_bound=False)
+            ).add_service(mock.AsyncMock())
+
+            await manager.open()
+            assert manager.get_session() is session
+            await manager.close()
+
+            assert session.closed is False
+
+    @pytest.mark.asyncio
+    async def test_get_session_when_shared_session_closed(self) -> None:
+        session = aiohttp.ClientSession()
+        manager = list_status.ServiceManager(
+            mock.AsyncMock(), session=session, strategy=mock.AsyncMock(is_shard_bound=False)
+        ).add_service(mock.AsyncMock())
+        await manager.open()
+        task = manager._task
+        assert task
+        await session.close()
+
+        try:
+            with pytest.raises(RuntimeError, match="The shared session passed to this manager has been closed"):
+                manager.get_session()
+
+        finally:
+            await manager.close()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    @pytest.mark.asyncio
+    async def test_against_stub_server(self, stub_server: _list_status_stub.StubListServer) -> None:
+        strategy = mock.AsyncMock(is_shard_bound=True)
+        strategy.count.return_value = {0: 10, 1: 20}
+        shards = mock.Mock(shard_count=2)
+        event = asyncio.Event()
+
+        async with stub_server.make_session() as session:
+            manager = list_status.ServiceManager(
+                mock.AsyncMock(), session=session, shards=shards, strategy=strategy, user_agent="stub"
+            )
+            manager.add_service(list_status.TopGGService("top"), repeat=1)
+            manager.add_service(list_status.BotsGGService("bots"), repeat=1)
+            manager.add_service(list_status.DiscordBotListService("dbl"), repeat=1)
+
+            @manager.with_service(repeat=1)
+            async def _(_: list_status.AbstractManager, /) -> None:
+                event.set()
+
+            await manager.open()
+            try:
+                await asyncio.wait_for(event.wait(), 5)
+                # Give the other services a chance to finish posting.
+                await asyncio.sleep(0.1)
+
+            finally:
+                await manager.close()
+
+        assert stub_server.posts(_list_status_stub.TOP_GG) == [{"shards": [10, 20], "shard_count": 2}]
+        assert stub_server.posts(_list_status_stub.BOTS_GG) == [
+            {"shards": [{"shardId": 0, "guildCount": 10}, {"shardId": 1, "guildCount": 20}], "shardCount": 2}
+        ]
+        assert stub_server.posts(_list_status_stub.DISCORD_BOT_LIST) == [
+            {"guilds": 10, "shard_id": 0},
+            {"guilds": 20, "shard_id": 1},
+        ]
+
+
+class TestServiceStats:
+    def test_record_call(self) -> None:
+        stats = list_status.ServiceStats()
+
+        stats.record_call(failed=True)
+        stats.record_call(failed=True)
+        assert stats.consecutive_failures == 2
+        assert stats.last_success_at is None
+
+        stats.record_call(failed=False)
+
+        assert stats.consecutive_failures == 0
+        assert stats.failures == 2
+        assert stats.successes == 1
+        assert stats.last_success_at is not None
+
+    def test_record_response(self) -> None:
+        stats = list_status.ServiceStats()
+
+        stats.record_response(200, 0.07, is_post=True)
+        stats.record_response(429, 0.3, is_post=True)
+        stats.record_response(200, 20, is_post=False)
+
+        assert stats.status_counts == {200: 2, 429: 1}
+        assert stats.post_latency_count == 2
+        assert stats.post_latency_sum == pytest.approx(0.37)
+        assert stats.post_latency_buckets == {
+            0.05: 0,
+            0.1: 1,
+            0.25: 1,
+            0.5: 2,
+            1.0: 2,
+            2.5: 2,
+            5.0: 2,
+            10.0: 2,
+            float("inf"): 2,
+        }
+
+    def test_record_count(self) -> None:
+        stats = list_status.ServiceStats()
+
+        stats.record_count(0.5)
+        stats.record_count(0.25)
+
+        assert stats.count_calls == 2
+        assert stats.count_time == 0.75
+
+
+class TestSessionConfig:
+    def test_build_session(self) -> None:
+        config = list_status.SessionConfig(
+            connection_limit=4,
+            dns_ttl=datetime.timedelta(minutes=2),
+            keepalive_timeout=datetime.timedelta(seconds=45),
+            timeout=12.5,
+        )
+
+        with (
+            mock.patch.object(aiohttp, "TCPConnector") as tcp_connector,
+            mock.patch.object(aiohttp, "ClientSession") as client_session,
+        ):
+            session = config.build_session()
+
+        assert session is client_session.return_value
+        tcp_connector.assert_called_once_with(keepalive_timeout=45, limit=4, ttl_dns_cache=120)
+        client_session.assert_called_once_with(
+            connector=tcp_connector.return_value, timeout=aiohttp.ClientTimeout(total=12.5), trace_configs=[]
+        )
+
+    @pytest.mark.asyncio
+    async def test_build_session_with_defaults(self) -> None:
+        async with list_status.SessionConfig().build_session() as session:
+            assert session.connector
+            assert session.connector.limit == 10
+            assert session.timeout.total == 30
+
 
 @pytest.mark.asyncio
 class TestTopGGService:
@@ -828,6 +1638,86 @@ class TestTopGGService:
 
         mock_session.post.assert_not_called()
 
+    async def test_call_when_shard_specific_reuses_posted_shards(self) -> None:
+        mock_session = mock.Mock()
+        mock_session.post.return_value = mock.Mock(__aenter__=mock.AsyncMock(), __aexit__=mock.AsyncMock())
+        mock_session.post.return_value.__aenter__.return_value.status = 200
+        mock_session.get.return_value = mock.Mock(__aenter__=mock.AsyncMock(), __aexit__=mock.AsyncMock())
+        mock_session.get.return_value.__aenter__.return_value.json.return_value = {"shards": [11, 22, 33, 44]}
+        mock_session.get.return_value.__aenter__.return_value.raise_for_status = mock.Mock()
+        mock_manager = mock.Mock(get_me=mock.AsyncMock(), user_agent="echo meow")
+        mock_manager.counter.count = mock.AsyncMock(return_value={1: 100})
+        mock_manager.get_me.return_value.id = hikari.Snowflake(432123)
+        mock_manager.get_session.return_value = mock_session
+        mock_manager.shards.shard_count = 4
+        service = list_status.TopGGService("meow meow")
+
+        await service(mock_manager)
+        mock_manager.counter.count.return_value = {1: 120, 2: 50}
+        await service(mock_manager)
+
+        mock_session.get.assert_called_once()
+        assert mock_session.post.call_args_list == [
+            mock.call(
+                "https://top.gg/api/bots/432123/stats",
+                headers={"Authorization": "meow meow", "User-Agent": "echo meow"},
+                json={"shards": [11, 100, 33, 44], "shard_count": 4},
+            ),
+            mock.call(
+                "https://top.gg/api/bots/432123/stats",
+                headers={"Authorization": "meow meow", "User-Agent": "echo meow"},
+                json={"shards": [11, 120, 50, 44], "shard_count": 4},
+            ),
+        ]
+
+    async def test_call_when_shard_specific_refetches_after_failed_post(self) -> None:
+        mock_session = mock.Mock()
+        mock_session.post.return_value = mock.Mock(__aenter__=mock.AsyncMock(), __aexit__=mock.AsyncMock())
+        mock_session.post.return_value.__aenter__.return_value.status = 500
+        mock_session.post.return_value.__aenter__.return_value.read = mock.AsyncMock(return_value=b"")
+        mock_session.get.return_value = mock.Mock(__aenter__=mock.AsyncMock(), __aexit__=mock.AsyncMock())
+        mock_session.get.return_value.__aenter__.return_value.json.return_value = {"shards": [1, 2]}
+        mock_session.get.return_value.__aenter__.return_value.raise_for_status = mock.Mock()
+        mock_manager = mock.Mock(get_me=mock.AsyncMock(), user_agent="echo meow")
+        mock_manager.counter.count = mock.AsyncMock(return_value={0: 5})
+        mock_manager.get_me.return_value.id = hikari.Snowflake(432123)
+        mock_manager.get_session.return_value = mock_session
+        mock_manager.shards.shard_count = 2
+        service = list_status.TopGGService("meow meow")
+
+        await service(mock_manager)
+        mock_session.post.return_value.__aenter__.return_value.status = 200
+        await service(mock_manager)
+        await service(mock_manager)
+
+        assert mock_session.get.call_count == 2
+        assert mock_session.post.call_count == 3
+
+    async def test_call_when_shard_specific_refetches_after_remote_ttl(self) -> None:
+        mock_session = mock.Mock()
+        mock_session.post.return_value = mock.Mock(__aenter__=mock.AsyncMock(), __aexit__=mock.AsyncMock())
+        mock_session.post.return_value.__aenter__.return_value.status = 200
+        mock_session.get.return_value = mock.Mock(__aenter__=mock.AsyncMock(), __aexit__=mock.AsyncMock())
+        mock_session.get.return_value.__aenter__.return_value.json.return_value = {"shards": [1, 2]}
+        mock_session.get.return_value.__aenter__.return_value.raise_for_status = mock.Mock()
+        mock_manager = mock.Mock(get_me=mock.AsyncMock(), user_agent="echo meow")
+        mock_manager.counter.count = mock.AsyncMock(return_value={0: 5})
+        mock_manager.get_me.return_value.id = hikari.Snowflake(432123)
+        mock_manager.get_session.return_value = mock_session
+        mock_manager.shards.shard_count = 2
+        service = list_status.TopGGService("meow meow", remote_ttl=datetime.timedelta(minutes=5))
+
+        with mock.patch.object(time, "monotonic", return_value=1000.0) as monotonic:
+            await service(mock_manager)
+            monotonic.return_value = 1299.0
+            await service(mock_manager)
+            assert mock_session.get.call_count == 1
+
+            monotonic.return_value = 1300.0
+            await service(mock_manager)
+
+        assert mock_session.get.call_count == 2
+
 
 @pytest.mark.asyncio
 class TestBotsGGService:
@@ -952,3 +1842,64 @@ class TestDiscordBotListService:
                 mock.call(None, None, None),
             ]
         )
+
+    async def test_call_against_stub_server(self, stub_server: _list_status_stub.StubListServer) -> None:
+        stub_server.latency = 0.01
+        stub_server.add_rule(_list_status_stub.DISCORD_BOT_LIST, 429, retry_after=0.2, shard_id=4)
+        stub_server.add_rule(_list_status_stub.DISCORD_BOT_LIST, 401, shard_id=7, times=-1)
+        counts = {shard_id: shard_id * 10 for shard_id in range(20)}
+        service = list_status.DiscordBotListService("token", max_concurrency=3)
+
+        async with stub_server.make_session() as session:
+            await service(_stub_manager(session, counts))
+
+        posts = stub_server.posts(_list_status_stub.DISCORD_BOT_LIST)
+        assert {post["shard_id"]: post["guilds"] for post in posts} == {
+            shard_id: count for shard_id, count in counts.items() if shard_id != 7
+        }
+        assert len(posts) == 19
+        assert stub_server.peak_in_flight <= 3
+
+        # Requests which were already in-flight when the 429 was returned are
+        # fine but no new requests should've been started until it expired.
+        limited_at = next(request.finished_at for request in stub_server.requests if request.status == 429)
+        assert not [r for r in stub_server.requests if limited_at + 0.01 < r.started_at < limited_at + 0.19]
+
+    async def test_call_against_stub_server_when_timeout_reached(
+        self, stub_server: _list_status_stub.StubListServer
+    ) -> None:
+        stub_server.add_rule(_list_status_stub.DISCORD_BOT_LIST, 429, retry_after=10, times=-1)
+        service = list_status.DiscordBotListService("token", max_concurrency=2, timeout=0.2)
+        started_at = time.monotonic()
+
+        async with stub_server.make_session() as session:
+            await service(_stub_manager(session, {0: 1, 1: 2, 2: 3, 3: 4}))
+
+        assert time.monotonic() - started_at < 1
+        assert len(stub_server.requests) == 2
+
+    async def test_call_against_stub_server_retries_until_timeout_by_default(
+        self, stub_server: _list_status_stub.StubListServer
+    ) -> None:
+        stub_server.add_rule(_list_status_stub.DISCORD_BOT_LIST, 429, retry_after=0.01, times=-1)
+        service = list_status.DiscordBotListService("token", timeout=0.3)
+
+        # This disables the backoff's jitter.
+        with mock.patch.object(random, "random", return_value=0.0):
+            async with stub_server.make_session() as session:
+                await service(_stub_manager(session, {0: 1}))
+
+        assert len(stub_server.requests) > 6
+
+    async def test_call_against_stub_server_when_max_retries_reached(
+        self, stub_server: _list_status_stub.StubListServer
+    ) -> None:
+        stub_server.add_rule(_list_status_stub.DISCORD_BOT_LIST, 429, retry_after=0.01, times=-1)
+        service = list_status.DiscordBotListService("token", max_retries=2, timeout=1)
+
+        # This disables the backoff's jitter.
+        with mock.patch.object(random, "random", return_value=0.0):
+            async with stub_server.make_session() as session:
+                await service(_stub_manager(session, {0: 1}))
+
+        assert len(stub_server.requests) == 3
@@ -32,6 +32,8 @@
 # pyright: reportPrivateUsage=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
+import datetime
 from unittest import mock
 
 import alluka
@@ -39,6 +41,7 @@ import alluka.local
 import hikari
 import pytest
 
+from yuyo import interactions
 from yuyo import modals
 
 try:
@@ -109,6 +112,10 @@ class TestModalClient:
     @pytest.mark.asyncio
     async def test_context_manager(self) -> None: ...
 
+    def test___init___when_deletion_store_passed_without_rest(self) -> None:
+        with pytest.raises(ValueError, match="A REST client must be provided to load stored deletions"):
+            modals.ModalClient(deletion_store=mock.Mock(interactions.AbstractDeletionStore))
+
     def test_alluka_property(self) -> None:
         client = modals.ModalClient()
 
@@ -252,6 +259,53 @@ class TestModalClient:
     def test_remove_modal_when_not_registered(self) -> None: ...
 
 
+class TestMultiWaitForModal:
+    @pytest.mark.asyncio
+    async def test_wait_for(self) -> None:
+        ctx = modals.ModalContext(
+            mock.Mock(), mock.Mock(user=mock.Mock(id=hikari.Snowflake(123))), "meow", "", {}, mock.Mock()
+        )
+        executor = modals.MultiWaitForModal(ephemeral_default=True)
+
+        task = asyncio.create_task(executor.wait_for("meow:metadata", 123))
+        await asyncio.sleep(0)
+        assert executor.is_waiting("meow", 123)
+
+        await executor.execute(ctx)
+
+        assert await task is ctx
+        assert ctx._ephemeral_default is True
+        assert not executor.is_waiting("meow", 123)
+
+    @pytest.mark.asyncio
+    async def test_execute_when_not_waiting(self) -> None:
+        ctx = modals.ModalContext(
+            mock.Mock(), mock.Mock(user=mock.Mock(id=hikari.Snowflake(321))), "meow", "", {}, mock.Mock()
+        )
+        executor = modals.MultiWaitForModal()
+
+        with pytest.raises(modals.InteractionError, match="This modal has timed out"):
+            await executor.execute(ctx)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_times_out(self) -> None:
+        executor = modals.MultiWaitForModal(timeout=datetime.timedelta(seconds=0.01))
+
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.wait_for("meow", 123)
+
+        assert not executor.is_waiting("meow", 123)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_when_timeout_is_zero(self) -> None:
+        executor = modals.MultiWaitForModal(timeout=datetime.timedelta())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await executor.wait_for("meow", 123)
+
+        assert not executor.is_waiting("meow", 123)
+
+
 class TestModal:
     @pytest.mark.skip(reason="TODO")
     def test_subclassing_behaviour(self) -> None: ...
@@ -287,6 +341,263 @@ class TestModal:
     @pytest.mark.asyncio
     async def test_execute_when_field_defaults(self) -> None: ...
 
+    @pytest.mark.asyncio
+    async def test_execute_applies_converters(self) -> None:
+        mock_callback = mock.AsyncMock()
+
+        @modals.as_modal_template
+        async def modal_template(
+            ctx: modals.ModalContext,
+            number: int = modals.text_input("Number", converter=int),
+            snowflake: int | None = modals.text_input(
+                "Snowflake", custom_id="snow", converter=hikari.Snowflake, default=None
+            ),
+            text: str = modals.text_input("Text", custom_id="text"),
+        ) -> None:
+            await mock_callback(ctx, number=number, snowflake=snowflake, text=text)
+
+        row = mock.Mock(
+            components=[
+                mock.Mock(custom_id="number:meta", type=hikari.ComponentType.TEXT_INPUT, value="123"),
+                mock.Mock(custom_id="snow", type=hikari.ComponentType.TEXT_INPUT, value="4321"),
+                mock.Mock(custom_id="text", type=hikari.ComponentType.TEXT_INPUT, value="meow"),
+            ]
+        )
+        ctx = modals.ModalContext(modals.ModalClient(), mock.Mock(components=[row]), "", "", {}, mock.Mock())
+
+        await modal_template().execute(ctx)
+
+        mock_callback.assert_awaited_once_with(ctx, number=123, snowflake=hikari.Snowflake(4321), text="meow")
+        assert ctx.component_ids == {"number": "meta", "snow": "", "text": ""}
+
+    @pytest.mark.asyncio
+    async def test_execute_when_converter_raises_value_error(self) -> None:
+        mock_callback = mock.AsyncMock()
+        converter = modals.regex_converter("#[0-9a-f]{6}")
+
+        @modals.as_modal_template
+        async def modal_template(
+            ctx: modals.ModalContext, colour: str = modals.text_input("Colour", converter=converter)
+        ) -> None:
+            await mock_callback(ctx, colour=colour)
+
+        row = mock.Mock(components=[mock.Mock(custom_id="colour", type=hikari.ComponentType.TEXT_INPUT, value="red")])
+        ctx = modals.ModalContext(modals.ModalClient(), mock.Mock(components=[row]), "", "", {}, mock.Mock())
+
+        with pytest.raises(modals.InteractionError, match="Invalid value provided for `Colour`"):
+            await modal_template().execute(ctx)
+
+        mock_callback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_with_modal_options(self) -> None:
+        mock_callback = mock.AsyncMock()
+
+        class Options(modals.ModalOptions):
+            number: int = modals.text_input("Number", converter=int)
+            note: str | None = modals.text_input("Note", default=None)
+
+        @modals.as_modal_template
+        async def modal_template(
+            ctx: modals.ModalContext, options: Options, text: str = modals.text_input("Text", default="meow")
+        ) -> None:
+            await mock_callback(ctx, options=options, text=text)
+
+        row = mock.Mock(
+            components=[
+                mock.Mock(custom_id="number", type=hikari.ComponentType.TEXT_INPUT, value="42"),
+                mock.Mock(custom_id="note", type=hikari.ComponentType.TEXT_INPUT, value=""),
+                mock.Mock(custom_id="text", type=hikari.ComponentType.TEXT_INPUT, value=""),
+                mock.Mock(custom_id="other:data", type=hikari.ComponentType.TEXT_INPUT, value="nyaa"),
+            ]
+        )
+        ctx = modals.ModalContext(modals.ModalClient(), mock.Mock(components=[row]), "", "", {}, mock.Mock())
+
+        await modal_template().execute(ctx)
+
+        mock_callback.assert_awaited_once_with(ctx, options=mock.ANY, text="meow")
+        options = mock_callback.call_args.kwargs["options"]
+        assert isinstance(options, Options)
+        assert options.number == 42
+        assert options.note is None
+        assert ctx.component_ids == {"number": "", "note": "", "text": "", "other": "data"}
+
+    @pytest.mark.asyncio
+    async def test_execute_when_required_field_missing(self) -> None:
+        mock_callback = mock.AsyncMock()
+
+        @modals.as_modal_template
+        async def modal_template(ctx: modals.ModalContext, field: str = modals.text_input("Field")) -> None:
+            await mock_callback(ctx, field=field)
+
+        row = mock.Mock(components=[mock.Mock(custom_id="field", type=hikari.ComponentType.TEXT_INPUT, value="")])
+        ctx = modals.ModalContext(modals.ModalClient(), mock.Mock(components=[row]), "", "", {}, mock.Mock())
+
+        with pytest.raises(RuntimeError, match="Missing required component `field`"):
+            await modal_template().execute(ctx)
+
+        mock_callback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_when_component_type_mismatched(self) -> None:
+        mock_callback = mock.AsyncMock()
+
+        @modals.as_modal_template
+        async def modal_template(ctx: modals.ModalContext, field: str = modals.text_input("Field")) -> None:
+            await mock_callback(ctx, field=field)
+
+        row = mock.Mock(components=[mock.Mock(custom_id="field", type=hikari.ComponentType.BUTTON, value="meow")])
+        ctx = modals.ModalContext(modals.ModalClient(), mock.Mock(components=[row]), "", "", {}, mock.Mock())
+
+        with pytest.raises(RuntimeError, match=r"Mismatched component type, expected .* for `field`"):
+            await modal_template().execute(ctx)
+
+        mock_callback.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_calls_simple_callback_directly(self) -> None:
+        mock_callback = mock.AsyncMock()
+        mock_alluka = mock.AsyncMock()
+
+        class Modal(modals.Modal):
+            async def callback(self, ctx: modals.ModalContext, field: str = modals.text_input("Field")) -> None:
+                await mock_callback(ctx, field=field)
+
+        row = mock.Mock(components=[mock.Mock(custom_id="field", type=hikari.ComponentType.TEXT_INPUT, value="meow")])
+        ctx = mock.Mock(client=mock.Mock(alluka=mock_alluka), component_ids={}, interaction=mock.Mock(components=[row]))
+
+        await Modal().execute(ctx)
+
+        mock_callback.assert_awaited_once_with(ctx, field="meow")
+        mock_alluka.call_with_async_di.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_when_callback_needs_injection(self) -> None:
+        mock_alluka = mock.AsyncMock()
+
+        @modals.as_modal_template
+        async def modal_template(
+            ctx: modals.ModalContext, value: alluka.Injected[int], field: str = modals.text_input("Field")
+        ) -> None: ...
+
+        modal = modal_template()
+        row = mock.Mock(components=[mock.Mock(custom_id="field", type=hikari.ComponentType.TEXT_INPUT, value="meow")])
+        ctx = mock.Mock(client=mock.Mock(alluka=mock_alluka), component_ids={}, interaction=mock.Mock(components=[row]))
+
+        await modal.execute(ctx)
+
+        mock_alluka.call_with_async_di.assert_awaited_once_with(modal_template.callback, modal, ctx, field="meow")
+
+    @pytest.mark.asyncio
+    async def test_execute_when_method_callback_needs_injection(self) -> None:
+        mock_callback = mock.AsyncMock()
+        client = modals.ModalClient(alluka=alluka.Client().set_type_dependency(int, 123))
+
+        class Modal(modals.Modal):
+            async def callback(
+                self, ctx: modals.ModalContext, value: alluka.Injected[int], field: str = modals.text_input("Field")
+            ) -> None:
+                await mock_callback(self, ctx, value=value, field=field)
+
+        row = mock.Mock(components=[mock.Mock(custom_id="field", type=hikari.ComponentType.TEXT_INPUT, value="meow")])
+        ctx = modals.ModalContext(client, mock.Mock(components=[row]), "", "", {}, mock.Mock())
+        modal = Modal()
+
+        await modal.execute(ctx)
+
+        mock_callback.assert_awaited_once_with(modal, ctx, value=123, field="meow")
+
+    def test_rows_build_from_cached_payload(self) -> None:
+        @modals.as_modal_template
+        async def modal_template(
+            ctx: modals.ModalContext,
+            field: str = modals.text_input("Field", custom_id="field:default"),
+            other: str = modals.text_input("Other", style=hikari.TextInputStyle.PARAGRAPH, default="meow"),
+        ) -> None: ...
+
+        modal = modal_template(id_metadata={"field": "meta"})
+
+        assert [row.build() for row in modal.rows] == [
+            {
+                "type": hikari.ComponentType.ACTION_ROW,
+                "components": [
+                    {
+                        "type": hikari.ComponentType.TEXT_INPUT,
+                        "style": hikari.TextInputStyle.SHORT,
+                        "custom_id": "field:meta",
+                        "label": "Field",
+                        "required": True,
+                        "min_length": 0,
+                        "max_length": 4000,
+                    }
+                ],
+            },
+            {
+                "type": hikari.ComponentType.ACTION_ROW,
+                "components": [
+                    {
+                        "type": hikari.ComponentType.TEXT_INPUT,
+                        "style": hikari.TextInputStyle.PARAGRAPH,
+                        "custom_id": "other",
+                        "label": "Other",
+                        "value": "meow",
+                        "required": False,
+                        "min_length": 0,
+                        "max_length": 4000,
+                    }
+                ],
+            },
+        ]
+        assert modal_template._static_payloads is modal_template()._get_static_payloads()
+
+    def test_rows_when_row_modified(self) -> None:
+        @modals.as_modal_template
+        async def modal_template(ctx: modals.ModalContext, field: str = modals.text_input("Field")) -> None: ...
+
+        modal = modal_template(id_metadata={"field": "meta"})
+        component = modal.rows[0].components[0]
+        assert isinstance(component, hikari.impl.TextInputBuilder)
+
+        component.set_label("New label")
+
+        assert modal.rows[0].build()["components"][0]["label"] == "New label"
+        assert modal.rows[0].build()["components"][0]["custom_id"] == "field:meta"
+        assert modal_template().rows[0].build()["components"][0]["label"] == "Field"
+
+    def test_static_payloads_are_reset_when_static_field_added(self) -> None:
+        @modals.as_modal_template
+        async def modal_template(ctx: modals.ModalContext, field: str = modals.text_input("Field")) -> None: ...
+
+        assert len(modal_template().rows) == 1
+
+        modal_template.add_static_text_input("Other")
+
+        assert modal_template._static_payloads is None
+        assert len(modal_template().rows) == 2
+
+    def test_extraction_plan_is_shared_between_instances_with_only_static_fields(self) -> None:
+        @modals.as_modal_template
+        async def modal_template(ctx: modals.ModalContext, field: str = modals.text_input("Field")) -> None: ...
+
+        modal_1 = modal_template()
+        modal_2 = modal_template()
+        modal_3 = modal_template().add_text_input("Other", parameter="other")
+
+        assert modal_1._get_plan() is modal_2._get_plan()
+        assert modal_1._get_plan() is modal_template._static_plan
+        assert modal_3._get_plan() is not modal_1._get_plan()
+
+    def test_extraction_plan_is_recompiled_when_static_field_added(self) -> None:
+        @modals.as_modal_template
+        async def modal_template(ctx: modals.ModalContext, field: str = modals.text_input("Field")) -> None: ...
+
+        plan = modal_template()._get_plan()
+
+        modal_template.add_static_text_input("Other", parameter="other")
+
+        assert modal_template._static_plan is None
+        assert modal_template()._get_plan() is not plan
+
     def test_with_text_input_descriptor(self) -> None:
         @modals.as_modal_template()
         async def modal_template(
@@ -493,18 +804,18 @@ class TestModal:
         assert len(modal._tracked_fields) == 1
         tracked = modal._tracked_fields[0]
         assert isinstance(tracked, modals._TrackedDataclass)
-        assert tracked._dataclass is ModalOptions
+        assert tracked.dataclass is ModalOptions
         assert tracked.parameter == "options"
 
-        assert len(tracked._fields) == 2
-        field = tracked._fields[0]
+        assert len(tracked.fields) == 2
+        field = tracked.fields[0]
         assert isinstance(field, modals._TrackedField)
         assert field.id_match == custom_id_1
         assert field.default is modals.NO_DEFAULT
         assert field.parameter == "fieldy"
         assert field.type is hikari.ComponentType.TEXT_INPUT
 
-        field = tracked._fields[1]
+        field = tracked.fields[1]
         assert isinstance(field, modals._TrackedField)
         assert field.id_match == "nyeep"
         assert field.default is None
@@ -551,21 +862,21 @@ class TestModal:
         assert len(modal._tracked_fields) == 1
         tracked = modal._tracked_fields[0]
         assert isinstance(tracked, modals._TrackedDataclass)
-        assert tracked._dataclass is FinalModalOptions
+        assert tracked.dataclass is FinalModalOptions
         assert tracked.parameter == "banana"
 
-        assert len(tracked._fields) == 3
-        field = tracked._fields[0]
+        assert len(tracked.fields) == 3
+        field = tracked.fields[0]
         assert isinstance(field, modals._TrackedField)
         assert field.parameter == "fieldy"
         assert field.id_match == custom_id_1
 
-        field = tracked._fields[1]
+        field = tracked.fields[1]
         assert isinstance(field, modals._TrackedField)
         assert field.parameter == "meowy"
         assert field.id_match == custom_id_2
 
-        field = tracked._fields[2]
+        field = tracked.fields[2]
         assert isinstance(field, modals._TrackedField)
         assert field.parameter == "booy"
         assert field.id_match == custom_id_3
@@ -621,26 +932,26 @@ class TestModal:
         assert len(modal._tracked_fields) == 1
         tracked = modal._tracked_fields[0]
         assert isinstance(tracked, modals._TrackedDataclass)
-        assert tracked._dataclass is Both
+        assert tracked.dataclass is Both
         assert tracked.parameter == "extra"
 
-        assert len(tracked._fields) == 4
-        field = tracked._fields[0]
+        assert len(tracked.fields) == 4
+        field = tracked.fields[0]
         assert isinstance(field, modals._TrackedField)
         assert field.parameter == "fallen"
         assert field.id_match == custom_id_1
 
-        field = tracked._fields[1]
+        field = tracked.fields[1]
         assert isinstance(field, modals._TrackedField)
         assert field.parameter == "felen"
         assert field.id_match == custom_id_2
 
-        field = tracked._fields[2]
+        field = tracked.fields[2]
         assert isinstance(field, modals._TrackedField)
         assert field.parameter == "patman"
         assert field.id_match == custom_id_3
 
-        field = tracked._fields[3]
+        field = tracked.fields[3]
         assert isinstance(field, modals._TrackedField)
         assert field.parameter == "me"
         assert field.id_match == custom_id_4
@@ -796,6 +1107,15 @@ async def test_as_modal_template_when_config_overriden_in_init_call() -> None:
     mock_callback.assert_awaited_once_with(mock_ctx, "why don't we", other_thing="keep it coming back")
 
 
+def test_regex_converter() -> None:
+    converter = modals.regex_converter(r"\d+")
+
+    assert converter("123") == "123"
+
+    with pytest.raises(ValueError, match="doesn't match the pattern"):
+        converter("123a")
+
+
 def test_with_static_text_input() -> None:
     modal_cls = modals.as_modal_template(mock.Mock())
     modal_cls.add_static_text_input = mock.Mock()
@@ -813,6 +1133,7 @@ def test_with_static_text_input() -> None:
         min_length=0,
         max_length=4000,
         parameter=None,
+        converter=None,
     )
 
 
@@ -830,6 +1151,7 @@ def test_with_static_text_input_with_defaults() -> None:
         min_length=50,
         max_length=70,
         parameter="param",
+        converter=int,
     )(modal_cls)
 
     assert result is modal_cls.add_static_text_input.return_value
@@ -843,6 +1165,7 @@ def test_with_static_text_input_with_defaults() -> None:
         min_length=50,
         max_length=70,
         parameter="param",
+        converter=int,
     )
 
 
@@ -865,6 +1188,7 @@ def test_with_text_input() -> None:
         min_length=0,
         max_length=4000,
         parameter=None,
+        converter=None,
     )
 
 
@@ -884,6 +1208,7 @@ def test_with_text_input_with_defaults() -> None:
         min_length=6,
         max_length=9,
         parameter="arg",
+        converter=float,
     )(modal)
 
     assert result is mock_add_text_input.return_value
@@ -897,4 +1222,5 @@ def test_with_text_input_with_defaults() -> None:
         min_length=6,
         max_length=9,
         parameter="arg",
+        converter=float,
     )
@@ -365,6 +365,21 @@ class TestPaginator:
         assert paginator.jump_to_first() is None
         assert paginator.jump_to_first() is None
 
+    @pytest.mark.asyncio
+    async def test_buffer_all(self) -> None:
+        expected_page_1 = pagination.Page("eee")
+        expected_page_2 = pagination.Page("Charlie")
+        expected_page_3 = pagination.Page("yeet")
+        paginator = pagination.Paginator(iter([expected_page_1, expected_page_2, expected_page_3]))
+        assert await paginator.step_forward() is expected_page_1
+
+        await paginator.buffer_all()
+
+        assert paginator.has_finished_iterating is True
+        assert paginator.index == 0
+        assert paginator.pages == [expected_page_1, expected_page_2, expected_page_3]
+        assert await paginator.step_forward() is expected_page_2
+
     @pytest.mark.asyncio
     async def test_jump_to_last(self) -> None:
         expected_page_1 = pagination.Page("eee")
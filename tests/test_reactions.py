@@ -29,16 +29,81 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 # pyright: reportUnknownMemberType=none
+# pyright: reportPrivateUsage=none
 # This leads to too many false-positives around mocks.
 
+import asyncio
+import datetime
+import time
+import typing
 from unittest import mock
 
 import alluka
 import alluka.local
+import hikari
+import pytest
 
+from yuyo import pagination
 from yuyo import reactions
 
 
+class _PersistedHandler(reactions.AbstractReactionHandler):
+    __slots__ = ("closed", "events", "expired", "message", "state")
+
+    def __init__(self, state: bytes | None = b"state", /) -> None:
+        self.closed = False
+        self.events: list[typing.Any] = []
+        self.expired = False
+        self.message: hikari.Message | None = None
+        self.state = state
+
+    @property
+    def has_expired(self) -> bool:
+        return self.expired
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def open(self, message: hikari.Message, /) -> None:
+        self.message = message
+
+    async def on_reaction_event(
+        self, event: reactions.ReactionEventT, /, *, alluka: alluka.abc.Client | None = None  # noqa: ARG002
+    ) -> None:
+        self.events.append(event)
+
+    def dump(self) -> bytes | None:
+        return self.state
+
+    @classmethod
+    async def load(cls, data: bytes, message: hikari.Message, /) -> typing.Self:
+        self = cls(data)
+        await self.open(message)
+        return self
+
+
+class TestSQLiteHandlerStore:
+    def test_round_trip(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+
+        store.set(hikari.Snowflake(123), "name", b"data")
+        store.set(hikari.Snowflake(124), "other", b"other")
+        store.set(hikari.Snowflake(124), "other", b"new")
+        store.delete(hikari.Snowflake(125))
+
+        assert store.get(hikari.Snowflake(123)) == ("name", b"data")
+        assert store.get(hikari.Snowflake(124)) == ("other", b"new")
+        assert store.get(hikari.Snowflake(125)) is None
+
+        assert sorted(store.load_ids()) == [123, 124]
+
+        store.delete(hikari.Snowflake(123))
+
+        assert store.get(hikari.Snowflake(123)) is None
+        assert store.load_ids() == [124]
+        store.close()
+
+
 class TestReactionClient:
     def test_alluka(self) -> None:
         client = reactions.ReactionClient(rest=mock.AsyncMock(), event_manager=mock.Mock())
@@ -60,9 +125,586 @@ class TestReactionClient:
         assert client.alluka is mock_alluka
         mock_alluka.set_type_dependency.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_open_and_close_when_event_factory(self) -> None:
+        mock_event_manager = mock.Mock()
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock_event_manager, event_factory=mock.Mock(), event_managed=False
+        )
+
+        await client.open()
+
+        mock_event_manager.subscribe.assert_called_once_with(hikari.ShardPayloadEvent, client._on_payload_event)
+
+        await client.close()
+
+        mock_event_manager.unsubscribe.assert_called_once_with(hikari.ShardPayloadEvent, client._on_payload_event)
+
+    @pytest.mark.parametrize(
+        ("name", "method_name"),
+        [
+            ("MESSAGE_REACTION_ADD", "deserialize_message_reaction_add_event"),
+            ("MESSAGE_REACTION_REMOVE", "deserialize_message_reaction_remove_event"),
+        ],
+    )
+    @pytest.mark.asyncio
+    async def test_on_payload_event(self, name: str, method_name: str) -> None:
+        mock_event_factory = mock.Mock()
+        getattr(mock_event_factory, method_name).return_value.message_id = hikari.Snowflake(123)
+        mock_handler = mock.AsyncMock()
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), event_factory=mock_event_factory
+        ).set_handler(hikari.Snowflake(123), mock_handler)
+        payload = {"message_id": "123", "user_id": "321"}
+        event = mock.Mock(hikari.ShardPayloadEvent, payload=payload)
+        event.name = name
+
+        await client._on_payload_event(event)
+
+        deserialize = getattr(mock_event_factory, method_name)
+        deserialize.assert_called_once_with(event.shard, payload)
+        mock_handler.on_reaction_event.assert_awaited_once_with(deserialize.return_value, alluka=client.alluka)
+
+    @pytest.mark.asyncio
+    async def test_on_payload_event_when_message_not_tracked(self) -> None:
+        mock_event_factory = mock.Mock()
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), event_factory=mock_event_factory
+        ).set_handler(hikari.Snowflake(123), mock.AsyncMock())
+        event = mock.Mock(hikari.ShardPayloadEvent, payload={"message_id": "124", "user_id": "321"})
+        event.name = "MESSAGE_REACTION_ADD"
+
+        await client._on_payload_event(event)
+
+        mock_event_factory.deserialize_message_reaction_add_event.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_payload_event_when_message_not_tracked_doesnt_query_store(self) -> None:
+        mock_event_factory = mock.Mock()
+        mock_store = mock.Mock(reactions.AbstractHandlerStore)
+        mock_store.load_ids.return_value = [hikari.Snowflake(125)]
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), event_factory=mock_event_factory, handler_store=mock_store
+        )
+        await client.open()
+        event = mock.Mock(hikari.ShardPayloadEvent, payload={"message_id": "124", "user_id": "321"})
+        event.name = "MESSAGE_REACTION_ADD"
+
+        await client._on_payload_event(event)
+
+        mock_event_factory.deserialize_message_reaction_add_event.assert_not_called()
+        mock_store.get.assert_not_called()
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_on_payload_event_when_user_blacklisted(self) -> None:
+        mock_event_factory = mock.Mock()
+        mock_handler = mock.AsyncMock()
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), event_factory=mock_event_factory
+        ).set_handler(hikari.Snowflake(123), mock_handler)
+        client.blacklist.add(hikari.Snowflake(321))
+        event = mock.Mock(hikari.ShardPayloadEvent, payload={"message_id": "123", "user_id": "321"})
+        event.name = "MESSAGE_REACTION_ADD"
+
+        await client._on_payload_event(event)
+
+        mock_event_factory.deserialize_message_reaction_add_event.assert_not_called()
+        mock_handler.on_reaction_event.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_payload_event_when_other_event(self) -> None:
+        mock_event_factory = mock.Mock()
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), event_factory=mock_event_factory
+        )
+        event = mock.Mock(hikari.ShardPayloadEvent, payload={})
+        event.name = "MESSAGE_CREATE"
+
+        await client._on_payload_event(event)
+
+        mock_event_factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_on_reaction_event_when_user_blacklisted(self) -> None:
+        mock_handler = mock.AsyncMock()
+        client = reactions.ReactionClient(rest=mock.AsyncMock(), event_manager=mock.Mock()).set_handler(
+            hikari.Snowflake(123), mock_handler
+        )
+        client.blacklist.add(hikari.Snowflake(321))
+
+        await client._on_reaction_event(mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321)))
+
+        mock_handler.on_reaction_event.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("user_rate_limit", "error_message"),
+        [
+            ((0, 60), "user_rate_limit uses must be greater than or equal to 1"),
+            ((-1, 60), "user_rate_limit uses must be greater than or equal to 1"),
+            ((2, 0), "user_rate_limit period must be greater than 0"),
+            ((2, -5.0), "user_rate_limit period must be greater than 0"),
+            ((2, datetime.timedelta()), "user_rate_limit period must be greater than 0"),
+        ],
+    )
+    def test_init_with_invalid_user_rate_limit(
+        self, user_rate_limit: tuple[int, float | datetime.timedelta], error_message: str
+    ) -> None:
+        with pytest.raises(ValueError, match=error_message):
+            reactions.ReactionClient(rest=mock.AsyncMock(), event_manager=mock.Mock(), user_rate_limit=user_rate_limit)
+
+    @pytest.mark.asyncio
+    async def test_on_reaction_event_with_user_rate_limit(self) -> None:
+        mock_handler = mock.AsyncMock()
+        mock_other_handler = mock.AsyncMock()
+        client = (
+            reactions.ReactionClient(rest=mock.AsyncMock(), event_manager=mock.Mock(), user_rate_limit=(2, 60))
+            .set_handler(hikari.Snowflake(123), mock_handler)
+            .set_handler(hikari.Snowflake(124), mock_other_handler)
+        )
+        event = mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321))
+        other_user_event = mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(322))
+        other_message_event = mock.Mock(message_id=hikari.Snowflake(124), user_id=hikari.Snowflake(321))
+
+        for _ in range(3):
+            await client._on_reaction_event(event)
+
+        await client._on_reaction_event(other_user_event)
+        await client._on_reaction_event(other_message_event)
+
+        assert mock_handler.on_reaction_event.await_args_list == [
+            mock.call(event, alluka=client.alluka),
+            mock.call(event, alluka=client.alluka),
+            mock.call(other_user_event, alluka=client.alluka),
+        ]
+        mock_other_handler.on_reaction_event.assert_awaited_once_with(other_message_event, alluka=client.alluka)
+
+    @pytest.mark.asyncio
+    async def test_on_reaction_event_with_user_rate_limit_refills(self) -> None:
+        mock_handler = mock.AsyncMock()
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), user_rate_limit=(1, datetime.timedelta(seconds=10))
+        ).set_handler(hikari.Snowflake(123), mock_handler)
+        event = mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321))
+
+        with mock.patch.object(time, "monotonic", return_value=100.0) as monotonic:
+            await client._on_reaction_event(event)
+            await client._on_reaction_event(event)
+            monotonic.return_value = 110.0
+            await client._on_reaction_event(event)
+
+        assert mock_handler.on_reaction_event.await_count == 2
+
+    def test_gc_buckets(self) -> None:
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), user_rate_limit=(2, 10)
+        ).set_handler(hikari.Snowflake(123), mock.Mock())
+        client._buckets = {
+            (hikari.Snowflake(123), hikari.Snowflake(1)): (0.0, 100.0),
+            (hikari.Snowflake(123), hikari.Snowflake(2)): (1.0, 96.0),
+            (hikari.Snowflake(124), hikari.Snowflake(1)): (0.0, 100.0),
+        }
+
+        with mock.patch.object(time, "monotonic", return_value=101.0):
+            client._gc_buckets((2, 0.2))
+
+        assert client._buckets == {(hikari.Snowflake(123), hikari.Snowflake(1)): (0.0, 100.0)}
+
+    @pytest.mark.asyncio
+    async def test_set_handler_persists_registered_types(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), handler_store=store
+        ).add_handler_type(_PersistedHandler, name="persisted")
+
+        client.set_handler(hikari.Snowflake(123), _PersistedHandler())
+        client.set_handler(hikari.Snowflake(124), mock.Mock(reactions.AbstractReactionHandler))
+
+        # Writes are made in a thread by the gc task rather than blocking the event loop.
+        assert store.get(hikari.Snowflake(123)) is None
+
+        await client._flush_store()
+
+        assert store.get(hikari.Snowflake(123)) == ("persisted", b"state")
+        assert store.get(hikari.Snowflake(124)) is None
+
+    @pytest.mark.asyncio
+    async def test_remove_handler_deletes_from_store(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), handler_store=store
+        ).add_handler_type(_PersistedHandler)
+        handler = _PersistedHandler()
+        client.set_handler(hikari.Snowflake(123), handler)
+        await client._flush_store()
+
+        assert client.remove_handler(hikari.Snowflake(123)) is handler
+
+        await client._flush_store()
+        assert store.get(hikari.Snowflake(123)) is None
+
+    @pytest.mark.asyncio
+    async def test_remove_handler_when_stored_handler_not_loaded(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        store.set(hikari.Snowflake(123), "persisted", b"stored")
+        mock_rest = mock.AsyncMock()
+        client = reactions.ReactionClient(
+            rest=mock_rest, event_manager=mock.Mock(), handler_store=store, event_managed=False
+        ).add_handler_type(_PersistedHandler, name="persisted")
+        await client.open()
+
+        assert client.get_handler(hikari.Snowflake(123)) is None
+        assert client.remove_handler(hikari.Snowflake(123)) is None
+
+        await client._on_reaction_event(mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321)))
+        await client.close()
+        assert store.get(hikari.Snowflake(123)) is None
+        mock_rest.fetch_message.assert_not_called()
+
+    def test_remove_handler_when_not_found(self) -> None:
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), handler_store=reactions.SQLiteHandlerStore(":memory:")
+        )
+
+        assert client.remove_handler(hikari.Snowflake(123)) is None
+
+    @pytest.mark.asyncio
+    async def test_on_reaction_event_loads_stored_handler(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        store.set(hikari.Snowflake(123), "persisted", b"stored")
+        mock_rest = mock.AsyncMock()
+        client = reactions.ReactionClient(
+            rest=mock_rest, event_manager=mock.Mock(), handler_store=store
+        ).add_handler_type(_PersistedHandler, name="persisted")
+        await client.open()
+        event = mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321))
+
+        await client._on_reaction_event(event)
+        await client._on_reaction_event(event)
+
+        handler = client.get_handler(hikari.Snowflake(123))
+        assert isinstance(handler, _PersistedHandler)
+        assert handler.state == b"stored"
+        assert handler.message is mock_rest.fetch_message.return_value
+        assert handler.events == [event, event]
+        mock_rest.fetch_message.assert_awaited_once_with(event.channel_id, hikari.Snowflake(123))
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_on_reaction_event_when_stored_handler_loaded_concurrently(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        store.set(hikari.Snowflake(123), "persisted", b"stored")
+        mock_rest = mock.AsyncMock()
+        client = reactions.ReactionClient(
+            rest=mock_rest, event_manager=mock.Mock(), handler_store=store
+        ).add_handler_type(_PersistedHandler, name="persisted")
+        await client.open()
+        existing = _PersistedHandler()
+        loaded: list[_PersistedHandler] = []
+
+        async def load(data: bytes, message: hikari.Message, /) -> _PersistedHandler:
+            handler = _PersistedHandler(data)
+            await handler.open(message)
+            loaded.append(handler)
+            client._handlers[hikari.Snowflake(123)] = existing
+            return handler
+
+        event = mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321))
+        with mock.patch.object(_PersistedHandler, "load", side_effect=load):
+            await client._on_reaction_event(event)
+
+        [handler] = loaded
+        assert handler.closed
+        assert client.get_handler(hikari.Snowflake(123)) is existing
+        assert existing.events == [event]
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_on_reaction_event_when_stored_message_not_found(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        store.set(hikari.Snowflake(123), "persisted", b"stored")
+        mock_rest = mock.AsyncMock()
+        mock_rest.fetch_message.side_effect = hikari.NotFoundError(url="", headers={}, raw_body="")
+        client = reactions.ReactionClient(
+            rest=mock_rest, event_manager=mock.Mock(), handler_store=store
+        ).add_handler_type(_PersistedHandler, name="persisted")
+        await client.open()
+
+        await client._on_reaction_event(mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321)))
+
+        assert client.get_handler(hikari.Snowflake(123)) is None
+        await client.close()
+        assert store.get(hikari.Snowflake(123)) is None
+
+    @pytest.mark.asyncio
+    async def test_on_reaction_event_when_stored_handler_fails_to_load(self, caplog: pytest.LogCaptureFixture) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        store.set(hikari.Snowflake(123), "persisted", b"stored")
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), handler_store=store
+        ).add_handler_type(_PersistedHandler, name="persisted")
+        await client.open()
+
+        with mock.patch.object(_PersistedHandler, "load", side_effect=ValueError("bad state")):
+            await client._on_reaction_event(mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321)))
+
+        assert client.get_handler(hikari.Snowflake(123)) is None
+        assert hikari.Snowflake(123) not in client._stored_ids
+        assert "Failed to load stored reaction handler for message 123" in caplog.text
+        await client.close()
+        assert store.get(hikari.Snowflake(123)) == ("persisted", b"stored")
+
+    @pytest.mark.asyncio
+    async def test_on_reaction_event_when_stored_type_not_registered(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        store.set(hikari.Snowflake(123), "unknown", b"stored")
+        mock_rest = mock.AsyncMock()
+        client = reactions.ReactionClient(rest=mock_rest, event_manager=mock.Mock(), handler_store=store)
+        await client.open()
+
+        await client._on_reaction_event(mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321)))
+
+        assert client.get_handler(hikari.Snowflake(123)) is None
+        assert store.get(hikari.Snowflake(123)) == ("unknown", b"stored")
+        assert hikari.Snowflake(123) not in client._stored_ids
+        mock_rest.fetch_message.assert_not_called()
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_gc_unloads_idle_persisted_handlers(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), handler_idle_timeout=60, handler_store=store
+        ).add_handler_type(_PersistedHandler, name="persisted")
+        handler = _PersistedHandler()
+        expired_handler = _PersistedHandler()
+        with mock.patch.object(time, "monotonic", return_value=100.0):
+            client.set_handler(hikari.Snowflake(123), handler)
+            client.set_handler(hikari.Snowflake(124), expired_handler)
+            client.set_handler(hikari.Snowflake(125), mock.Mock(reactions.AbstractReactionHandler, has_expired=False))
+
+        handler.state = b"new"
+        expired_handler.expired = True
+
+        with (
+            mock.patch.object(time, "monotonic", return_value=161.0),
+            mock.patch.object(asyncio, "sleep", side_effect=asyncio.CancelledError),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await client._gc()
+
+        assert client.get_handler(hikari.Snowflake(123)) is None
+        assert client.get_handler(hikari.Snowflake(124)) is None
+        assert client.get_handler(hikari.Snowflake(125)) is not None
+        assert not handler.closed
+        assert expired_handler.closed
+        assert store.get(hikari.Snowflake(123)) == ("persisted", b"new")
+        assert store.get(hikari.Snowflake(124)) is None
+
+    @pytest.mark.asyncio
+    async def test_gc_persists_dirty_handlers(self) -> None:
+        store = mock.Mock(reactions.AbstractHandlerStore)
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), handler_store=store
+        ).add_handler_type(_PersistedHandler, name="persisted")
+        handler = _PersistedHandler()
+        client.set_handler(hikari.Snowflake(123), handler)
+        store.set.reset_mock()
+        handler.state = b"new"
+
+        await client._on_reaction_event(mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321)))
+        await client._on_reaction_event(mock.Mock(message_id=hikari.Snowflake(123), user_id=hikari.Snowflake(321)))
+
+        store.set.assert_not_called()
+
+        with (
+            mock.patch.object(asyncio, "sleep", side_effect=asyncio.CancelledError),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await client._gc()
+
+        store.set.assert_called_once_with(hikari.Snowflake(123), "persisted", b"new")
+        assert not client._dirty_ids
+
+    @pytest.mark.asyncio
+    async def test_gc_persists_handlers_once_they_can_be_dumped(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), handler_idle_timeout=60, handler_store=store
+        ).add_handler_type(_PersistedHandler, name="persisted")
+        handler = _PersistedHandler(None)
+        with mock.patch.object(time, "monotonic", return_value=100.0):
+            client.set_handler(hikari.Snowflake(123), handler)
+
+        assert store.get(hikari.Snowflake(123)) is None
+
+        with (
+            mock.patch.object(time, "monotonic", return_value=161.0),
+            mock.patch.object(asyncio, "sleep", side_effect=asyncio.CancelledError),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await client._gc()
+
+        # Idle handlers are kept in memory until they can be persisted.
+        assert client.get_handler(hikari.Snowflake(123)) is handler
+        handler.state = b"ready"
+
+        with (
+            mock.patch.object(time, "monotonic", return_value=162.0),
+            mock.patch.object(asyncio, "sleep", side_effect=asyncio.CancelledError),
+            pytest.raises(asyncio.CancelledError),
+        ):
+            await client._gc()
+
+        assert client.get_handler(hikari.Snowflake(123)) is None
+        assert store.get(hikari.Snowflake(123)) == ("persisted", b"ready")
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_persisted_handlers(self) -> None:
+        store = reactions.SQLiteHandlerStore(":memory:")
+        client = reactions.ReactionClient(
+            rest=mock.AsyncMock(), event_manager=mock.Mock(), handler_store=store, event_managed=False
+        ).add_handler_type(_PersistedHandler, name="persisted")
+        await client.open()
+        handler = _PersistedHandler()
+        client.set_handler(hikari.Snowflake(123), handler)
+        handler.state = b"new"
+
+        await client.close()
+
+        assert handler.closed
+        assert store.get(hikari.Snowflake(123)) == ("persisted", b"new")
+
 
 class TestReactionHandler:
     def test_authors_property(self) -> None:
         handler = reactions.ReactionHandler(authors=[123, 321, 543, 1234])
 
         assert handler.authors == {123, 321, 543, 1234}
+
+
+class TestReactionPaginator:
+    @pytest.mark.asyncio
+    async def test_close_when_remove_reactions(self) -> None:
+        mock_message = mock.AsyncMock()
+        paginator = reactions.ReactionPaginator(iter([pagination.Page("a"), pagination.Page("b")]))
+        await paginator.open(mock_message, add_reactions=False)
+
+        await paginator.close(remove_reactions=True)
+
+        mock_message.remove_all_reactions.assert_awaited_once_with()
+        mock_message.remove_reaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_when_remove_reactions_and_missing_permissions(self) -> None:
+        mock_message = mock.AsyncMock()
+        mock_message.remove_all_reactions.side_effect = hikari.ForbiddenError(url="", headers={}, raw_body="")
+        mock_message.remove_reaction.side_effect = [None, hikari.NotFoundError(url="", headers={}, raw_body=""), None]
+        paginator = reactions.ReactionPaginator(iter([pagination.Page("a"), pagination.Page("b")]))
+        await paginator.open(mock_message, add_reactions=False)
+
+        await paginator.close(remove_reactions=True)
+
+        mock_message.remove_all_reactions.assert_awaited_once_with()
+        assert mock_message.remove_reaction.await_args_list == [
+            mock.call(pagination.LEFT_TRIANGLE),
+            mock.call(pagination.STOP_SQUARE),
+            mock.call(pagination.RIGHT_TRIANGLE),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_close_when_remove_reactions_and_message_not_found(self) -> None:
+        mock_message = mock.AsyncMock()
+        mock_message.remove_all_reactions.side_effect = hikari.NotFoundError(url="", headers={}, raw_body="")
+        paginator = reactions.ReactionPaginator(iter([pagination.Page("a"), pagination.Page("b")]))
+        await paginator.open(mock_message, add_reactions=False)
+
+        await paginator.close(remove_reactions=True)
+
+        mock_message.remove_reaction.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dump_and_load(self) -> None:
+        paginator = reactions.ReactionPaginator(
+            iter([pagination.Page("a"), pagination.Page("b"), pagination.Page("c")]),
+            authors=[hikari.Snowflake(321)],
+            triggers=[pagination.LEFT_TRIANGLE, pagination.RIGHT_TRIANGLE],
+            timeout=datetime.timedelta(seconds=60),
+        ).add_last_button(emoji=hikari.CustomEmoji(id=hikari.Snowflake(123), name="last", is_animated=False))
+        await paginator.get_next_entry()
+        await paginator.get_next_entry()
+        await paginator.buffer_all()
+        mock_message = mock.AsyncMock()
+
+        data = paginator.dump()
+        assert data is not None
+        loaded = await reactions.ReactionPaginator.load(data, mock_message)
+
+        assert loaded._message is mock_message
+        assert loaded.authors == {hikari.Snowflake(321)}
+        assert loaded.has_expired is False
+        assert loaded._expires_at == paginator._expires_at
+        assert [page.to_kwargs().get("content") for page in loaded._paginator.pages] == ["a", "b", "c"]
+        assert loaded._paginator.index == 1
+        assert loaded._paginator.has_finished_iterating is True
+        assert loaded._callbacks == {
+            pagination.LEFT_TRIANGLE: loaded._on_previous,
+            pagination.RIGHT_TRIANGLE: loaded._on_next,
+            123: loaded._on_last,
+        }
+        mock_message.add_reaction.assert_not_called()
+
+        await loaded._on_next(mock.Mock())
+
+        mock_message.edit.assert_awaited_once()
+        assert mock_message.edit.call_args.kwargs["content"] == "c"
+
+    @pytest.mark.asyncio
+    async def test_load_when_expired(self) -> None:
+        paginator = reactions.ReactionPaginator(iter([pagination.Page("a")]), timeout=datetime.timedelta(seconds=60))
+        await paginator.buffer_all()
+        paginator._expires_at = time.time() - 5
+        data = paginator.dump()
+        assert data is not None
+
+        loaded = await reactions.ReactionPaginator.load(data, mock.AsyncMock())
+
+        await asyncio.sleep(0.001)
+        assert loaded.has_expired is True
+
+    @pytest.mark.asyncio
+    async def test_dump_and_load_without_timeout(self) -> None:
+        paginator = reactions.ReactionPaginator(iter([pagination.Page("a")]), timeout=None)
+        await paginator.buffer_all()
+        data = paginator.dump()
+        assert data is not None
+
+        loaded = await reactions.ReactionPaginator.load(data, mock.AsyncMock())
+
+        assert loaded._expires_at is None
+        assert loaded.has_expired is False
+
+    def test_dump_when_iterator_not_exhausted(self) -> None:
+        paginator = reactions.ReactionPaginator(iter([pagination.Page("a")]))
+
+        assert paginator.dump() is None
+
+    @pytest.mark.asyncio
+    async def test_dump_when_custom_callback(self) -> None:
+        paginator = reactions.ReactionPaginator(iter([pagination.Page("a")])).set_callback("x", mock.AsyncMock())
+        await paginator.buffer_all()
+
+        assert paginator.dump() is None
+
+    @pytest.mark.asyncio
+    async def test_open_adds_reactions_in_order(self) -> None:
+        mock_message = mock.AsyncMock()
+        paginator = reactions.ReactionPaginator(iter([pagination.Page("a"), pagination.Page("b")]))
+
+        await paginator.open(mock_message)
+
+        assert mock_message.add_reaction.await_args_list == [
+            mock.call(pagination.LEFT_TRIANGLE),
+            mock.call(pagination.STOP_SQUARE),
+            mock.call(pagination.RIGHT_TRIANGLE),
+        ]
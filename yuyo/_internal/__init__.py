@@ -32,11 +32,16 @@ from __future__ import annotations
 
 __all__: list[str] = []
 
+import asyncio
 import enum
+import heapq
+import inspect
+import itertools
 import typing
 import uuid
 from collections import abc as collections
 
+import alluka
 import hikari
 
 if typing.TYPE_CHECKING:
@@ -44,6 +49,7 @@ if typing.TYPE_CHECKING:
     _OtherT = typing.TypeVar("_OtherT")
 
 _T = typing.TypeVar("_T")
+_KeyT = typing.TypeVar("_KeyT", bound=collections.Hashable)
 IterableT = collections.AsyncIterable[_T] | collections.Iterable[_T]
 IteratorT = collections.AsyncIterator[_T] | collections.Iterator[_T]
 
@@ -95,6 +101,63 @@ def random_custom_id() -> str:
     return uuid.uuid4().hex
 
 
+_INJECTED_MARKERS = typing.get_args(alluka.Injected[object])[1:]
+
+
+def _is_injected_annotation(annotation: typing.Any, /) -> bool:
+    if typing.get_origin(annotation) is not typing.Annotated:
+        return False
+
+    return any(
+        arg in _INJECTED_MARKERS or isinstance(arg, alluka.InjectedDescriptor)
+        for arg in typing.get_args(annotation)[1:]
+    )
+
+
+def needs_injection(callback: collections.Callable[..., typing.Any], /) -> bool:
+    """Check whether a callback has any parameters which are dependency injected.
+
+    This mirrors how Alluka detects injected parameters and should be called
+    once when a callback is registered rather than on every call.
+
+    Returns
+    -------
+    bool
+        Whether the callback has to be called through Alluka.
+
+        This will be [True][] if the callback's signature couldn't be parsed.
+    """
+    try:
+        signature = inspect.signature(callback)
+
+    except ValueError:
+        return True
+
+    resolved = False
+    for name, parameter in signature.parameters.items():
+        if isinstance(parameter.default, alluka.InjectedDescriptor):
+            return True
+
+        annotation = parameter.annotation
+        if isinstance(annotation, str):
+            if not resolved:
+                try:
+                    signature = inspect.signature(callback, eval_str=True)
+
+                except Exception:  # noqa: BLE001
+                    # Leave the error to be raised by Alluka when it's called.
+                    return True
+
+                resolved = True
+
+            annotation = signature.parameters[name].annotation
+
+        if _is_injected_annotation(annotation):
+            return True
+
+    return False
+
+
 class SplitId(typing.NamedTuple):
     """Represents a split custom ID."""
 
@@ -110,15 +173,8 @@ def split_custom_id(custom_id: str) -> SplitId:
     tuple[str, str]
         Tuple of the ID's match part and the ID's metadata part.
     """
-    parts = custom_id.split(":", 1)
-
-    try:
-        id_metadata = parts[1]
-
-    except IndexError:
-        id_metadata = ""
-
-    return SplitId(id_match=parts[0], id_metadata=id_metadata)
+    id_match, _, id_metadata = custom_id.partition(":")
+    return SplitId(id_match, id_metadata)
 
 
 class MatchId(typing.NamedTuple):
@@ -166,3 +222,109 @@ def to_list(
         return [other], hikari.UNDEFINED
 
     return hikari.UNDEFINED, other
+
+
+class WaiterRegistry(typing.Generic[_KeyT, _T]):
+    """Multiplexed registry of pending futures keyed by a hashable key.
+
+    Every pending wait costs a dict entry and a heap entry; expiry is handled
+    by a single timer handle scheduled for the earliest deadline rather than a
+    timer task per waiter.
+    """
+
+    __slots__ = ("_counter", "_deadlines", "_timer", "_waiters")
+
+    def __init__(self) -> None:
+        """Initialise a waiter registry."""
+        self._counter = itertools.count()
+        self._deadlines: list[tuple[float, int, _KeyT, asyncio.Future[_T]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._waiters: dict[_KeyT, asyncio.Future[_T]] = {}
+
+    def __contains__(self, key: object, /) -> bool:
+        return key in self._waiters
+
+    def __len__(self) -> int:
+        return len(self._waiters)
+
+    def add(self, key: _KeyT, timeout: float | None, /) -> asyncio.Future[_T]:
+        """Register a new pending wait.
+
+        Parameters
+        ----------
+        key
+            The key to register the wait under.
+        timeout
+            How many seconds this should wait before it's failed with
+            [asyncio.TimeoutError][].
+
+            If this is [None][] then the wait will never expire.
+
+        Returns
+        -------
+        asyncio.Future[T]
+            The future which will be resolved for this wait.
+
+        Raises
+        ------
+        RuntimeError
+            If the key is already being waited for.
+        """
+        if key in self._waiters:
+            error_message = f"{key!r} is already being waited for"
+            raise RuntimeError(error_message)
+
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[_T] = loop.create_future()
+        self._waiters[key] = future
+        if timeout is not None:
+            deadline = loop.time() + timeout
+            heapq.heappush(self._deadlines, (deadline, next(self._counter), key, future))
+            if self._deadlines[0][3] is future:
+                self._schedule(loop)
+
+        return future
+
+    def discard(self, key: _KeyT, future: asyncio.Future[_T], /) -> None:
+        """Remove a pending wait if it's still registered.
+
+        Heap entries are invalidated lazily when their deadline is reached.
+        """
+        if self._waiters.get(key) is future:
+            del self._waiters[key]
+
+    def resolve(self, key: _KeyT, value: _T, /) -> bool:
+        """Resolve a pending wait.
+
+        Returns
+        -------
+        bool
+            Whether a pending wait was found and resolved.
+        """
+        future = self._waiters.pop(key, None)
+        if future is None or future.done():
+            return False
+
+        future.set_result(value)
+        return True
+
+    def _schedule(self, loop: asyncio.AbstractEventLoop, /) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._deadlines:
+            self._timer = loop.call_at(self._deadlines[0][0], self._expire, loop)
+
+    def _expire(self, loop: asyncio.AbstractEventLoop, /) -> None:
+        self._timer = None
+        now = loop.time()
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, _, key, future = heapq.heappop(self._deadlines)
+            # Entries for resolved or discarded waits are stale and skipped here.
+            if self._waiters.get(key) is future:
+                del self._waiters[key]
+                if not future.done():
+                    future.set_exception(asyncio.TimeoutError)
+
+        self._schedule(loop)
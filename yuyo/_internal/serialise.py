@@ -0,0 +1,231 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2020-2025, Faster Speeding
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Serialisation of pagination pages."""
+from __future__ import annotations
+
+__all__: list[str] = ["decode_page", "deserialise_page", "encode_page", "serialise_page"]
+
+import base64
+import datetime
+import io
+import json
+import pathlib
+import typing
+
+import hikari
+
+from yuyo import pagination
+
+
+def _serialise_resource(resource: hikari.Resourceish, /, *, strict: bool = False) -> dict[str, typing.Any]:
+    if isinstance(resource, hikari.files.RAWISH_TYPES):
+        # Resolving these to a resource would generate a random filename and
+        # unwrap_bytes would consume any stream, so streams are read with getvalue.
+        if isinstance(resource, io.BytesIO):
+            data = resource.getvalue()
+
+        elif isinstance(resource, io.StringIO):
+            data = resource.getvalue().encode()
+
+        else:
+            data = hikari.files.unwrap_bytes(resource)
+
+        return {"data": base64.b64encode(data).decode()}
+
+    resource = hikari.files.ensure_resource(resource)
+    if isinstance(resource, hikari.File):
+        result: dict[str, typing.Any] = {
+            "path": str(resource.path),
+            "filename": resource.filename,
+            "spoiler": resource.is_spoiler,
+        }
+        # The file's stat is included so that content hashes change when it's modified.
+        try:
+            stat = pathlib.Path(resource.path).stat()
+
+        except OSError:
+            pass
+
+        else:
+            result["modified_at"] = stat.st_mtime_ns
+            result["size"] = stat.st_size
+
+        return result
+
+    if isinstance(resource, hikari.Bytes) and isinstance(resource.data, bytes):
+        return {
+            "data": base64.b64encode(resource.data).decode(),
+            "filename": resource.filename,
+            "mimetype": resource.mimetype,
+            "spoiler": resource.is_spoiler,
+        }
+
+    if strict and isinstance(resource, hikari.Bytes):
+        # A stream's data can't be read without consuming it, so it can't be
+        # round-tripped and would otherwise be exported as a useless URL.
+        error_message = f"Cannot serialise stream-backed attachment {resource.filename!r}"
+        raise ValueError(error_message)
+
+    return {"url": resource.url, "filename": resource.filename}
+
+
+def _serialise_embed(embed: hikari.Embed, /, *, strict: bool = False) -> dict[str, typing.Any]:
+    footer: dict[str, typing.Any] | None = None
+    if embed.footer:
+        footer = {
+            "text": embed.footer.text,
+            "icon": _serialise_resource(embed.footer.icon.resource, strict=strict) if embed.footer.icon else None,
+        }
+
+    author: dict[str, typing.Any] | None = None
+    if embed.author:
+        author = {
+            "name": embed.author.name,
+            "url": embed.author.url,
+            "icon": _serialise_resource(embed.author.icon.resource, strict=strict) if embed.author.icon else None,
+        }
+
+    return {
+        "title": embed.title,
+        "description": embed.description,
+        "url": embed.url,
+        "timestamp": embed.timestamp.isoformat() if embed.timestamp else None,
+        "colour": int(embed.colour) if embed.colour is not None else None,
+        "footer": footer,
+        "image": _serialise_resource(embed.image.resource, strict=strict) if embed.image else None,
+        "thumbnail": _serialise_resource(embed.thumbnail.resource, strict=strict) if embed.thumbnail else None,
+        "author": author,
+        "fields": [[field.name, field.value, field.is_inline] for field in embed.fields],
+    }
+
+
+def serialise_page(page: pagination.AbstractPage, /, *, strict: bool = False) -> dict[str, typing.Any]:
+    """Serialise a page to a JSON compatible dict.
+
+    If `strict` is [True][] then [ValueError][] is raised for pages which
+    can't be round-tripped rather than serialising them lossily.
+    """
+    if isinstance(page, pagination.LocalisedPage):
+        pages = page._pages  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        return {
+            "default": serialise_page(pages.value, strict=strict),
+            "localisations": {
+                str(locale): serialise_page(value, strict=strict) for locale, value in pages.localisations.items()
+            },
+        }
+
+    kwargs = page.to_kwargs()
+    content = kwargs.get("content", hikari.UNDEFINED)
+    attachments = kwargs.get("attachments", hikari.UNDEFINED)
+    embeds = kwargs.get("embeds", hikari.UNDEFINED)
+    return {
+        "content": content if content is not hikari.UNDEFINED else None,
+        "attachments": (
+            [_serialise_resource(attachment, strict=strict) for attachment in attachments]
+            if attachments is not hikari.UNDEFINED
+            else None
+        ),
+        "embeds": (
+            [_serialise_embed(embed, strict=strict) for embed in embeds] if embeds is not hikari.UNDEFINED else None
+        ),
+    }
+
+
+def encode_page(page: pagination.AbstractPage, /, *, strict: bool = False) -> bytes:
+    """Serialise a page to deterministic JSON bytes."""
+    return json.dumps(serialise_page(page, strict=strict), separators=(",", ":"), sort_keys=True).encode()
+
+
+def _deserialise_resource(data: dict[str, typing.Any], /) -> hikari.Resourceish:
+    if "path" in data:
+        return hikari.File(data["path"], data["filename"], spoiler=data["spoiler"])
+
+    if "filename" not in data:
+        return base64.b64decode(data["data"])
+
+    if "data" in data:
+        return hikari.Bytes(
+            base64.b64decode(data["data"]), data["filename"], mimetype=data["mimetype"], spoiler=data["spoiler"]
+        )
+
+    return hikari.URL(data["url"], data["filename"])
+
+
+def _deserialise_embed(data: dict[str, typing.Any], /) -> hikari.Embed:
+    embed = hikari.Embed(
+        title=data["title"],
+        description=data["description"],
+        url=data["url"],
+        colour=data["colour"],
+        timestamp=datetime.datetime.fromisoformat(data["timestamp"]) if data["timestamp"] else None,
+    )
+    if footer := data["footer"]:
+        icon = _deserialise_resource(footer["icon"]) if footer["icon"] else None
+        embed.set_footer(footer["text"], icon=icon)
+
+    if data["image"]:
+        embed.set_image(_deserialise_resource(data["image"]))
+
+    if data["thumbnail"]:
+        embed.set_thumbnail(_deserialise_resource(data["thumbnail"]))
+
+    if author := data["author"]:
+        icon = _deserialise_resource(author["icon"]) if author["icon"] else None
+        embed.set_author(name=author["name"], url=author["url"], icon=icon)
+
+    for name, value, inline in data["fields"]:
+        embed.add_field(name, value, inline=inline)
+
+    return embed
+
+
+def deserialise_page(data: dict[str, typing.Any], /) -> pagination.AbstractPage:
+    """Rebuild a page from the output of `serialise_page`."""
+    if "default" in data:
+        pages = {locale: deserialise_page(value) for locale, value in data["localisations"].items()}
+        pages["default"] = deserialise_page(data["default"])
+        return pagination.LocalisedPage(pages)
+
+    attachments = data["attachments"]
+    embeds = data["embeds"]
+    return pagination.Page(
+        data["content"] if data["content"] is not None else hikari.UNDEFINED,
+        attachments=(
+            [_deserialise_resource(attachment) for attachment in attachments]
+            if attachments is not None
+            else hikari.UNDEFINED
+        ),
+        embeds=[_deserialise_embed(embed) for embed in embeds] if embeds is not None else hikari.UNDEFINED,
+    )
+
+
+def decode_page(data: bytes, /) -> pagination.AbstractPage:
+    """Rebuild a page from the output of `encode_page`."""
+    return deserialise_page(json.loads(data))
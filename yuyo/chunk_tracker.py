@@ -41,8 +41,11 @@ import asyncio
 import base64
 import datetime
 import functools
+import heapq
+import itertools
 import logging
 import random
+import time
 import typing
 
 import hikari
@@ -228,6 +231,7 @@ def _random_nonce() -> str:
 class _RequestData:
     __slots__ = (
         "chunk_count",
+        "deadline",
         "first_received_at",
         "guild_id",
         "last_received_at",
@@ -243,12 +247,14 @@ class _RequestData:
         /,
         *,
         chunk_count: int | None = None,
+        deadline: float,
         first_received_at: datetime.datetime,
         last_received_at: datetime.datetime,
         missing_chunks: set[int] | None = None,
         not_found_ids: set[hikari.Snowflake] | None = None,
     ) -> None:
         self.chunk_count: int | None = chunk_count
+        self.deadline: float = deadline
         self.first_received_at: datetime.datetime = first_received_at
         self.guild_id: hikari.Snowflake = guild_id
         self.last_received_at: datetime.datetime = last_received_at
@@ -262,7 +268,15 @@ def _now() -> datetime.datetime:
 
 
 class _ShardInfo:
-    __slots__ = ("any_received", "guild_ids", "incomplete_guild_ids", "known_nonces", "last_received_at", "shard")
+    __slots__ = (
+        "any_received",
+        "deadline",
+        "guild_ids",
+        "incomplete_guild_ids",
+        "known_nonces",
+        "last_received_at",
+        "shard",
+    )
 
     def __init__(
         self,
@@ -270,9 +284,11 @@ class _ShardInfo:
         guild_ids: collections.Sequence[hikari.Snowflake],
         /,
         *,
+        deadline: float,
         known_nonces: dict[hikari.Snowflake, str] | None = None,
     ) -> None:
         self.any_received = False
+        self.deadline = deadline
         self.guild_ids = set(guild_ids)
         self.incomplete_guild_ids: list[hikari.Snowflake] = []
         self.known_nonces: dict[hikari.Snowflake, str] = known_nonces or {}
@@ -313,6 +329,8 @@ class ChunkTracker:
     __slots__ = (
         "_auto_chunk_members",
         "_chunk_presences",
+        "_deadline_counter",
+        "_deadlines",
         "_event_manager",
         "_is_starting",
         "_requests",
@@ -355,6 +373,12 @@ class ChunkTracker:
 
         self._auto_chunk_members = False
         self._chunk_presences = False
+        self._deadline_counter = itertools.count()
+        # Heap of when tracked requests and identifies are due to time-out.
+        # Entries are lazily invalidated: an entry is skipped if its tracker has
+        # since been removed and re-pushed if its tracker's deadline was pushed
+        # back by newer chunks.
+        self._deadlines: list[tuple[float, int, str | None, _RequestData | _ShardInfo]] = []
         self._event_manager = event_manager
         self._is_starting: bool = False
         self._requests: dict[str, _RequestData] = {}
@@ -468,29 +492,56 @@ class ChunkTracker:
     def _unset_task(self, _: asyncio.Task[None], /) -> None:
         self._task = None
 
+    def _next_deadline(self) -> float:
+        return time.monotonic() + self._timeout.total_seconds()
+
+    def _push_deadline(self, nonce: str | None, tracker: _RequestData | _ShardInfo, /) -> None:
+        heapq.heappush(self._deadlines, (tracker.deadline, next(self._deadline_counter), nonce, tracker))
+
     @_log_task_exc("Chunk tracker crashed")
     async def _loop(self) -> None:
         timed_out_requests: list[_RequestData] = []
         timed_out_shards: list[_ShardInfo] = []
+        due_shards: list[_ShardInfo] = []
+
+        while self._deadlines:
+            await asyncio.sleep(max(self._deadlines[0][0] - time.monotonic(), 0))
+            now = time.monotonic()
 
-        while self._tracked_identifies or self._requests:
-            await asyncio.sleep(1)
-            date = _now()
+            while self._deadlines and self._deadlines[0][0] <= now:
+                _, _, nonce, tracker = heapq.heappop(self._deadlines)
+                if isinstance(tracker, _ShardInfo):
+                    if self._tracked_identifies.get(tracker.shard.id) is not tracker:
+                        continue
 
-            for nonce, request_info in self._requests.copy().items():
-                if date - request_info.last_received_at < self._timeout:
+                    if tracker.deadline > now:
+                        self._push_deadline(None, tracker)
+
+                    else:
+                        due_shards.append(tracker)
+
+                    continue
+
+                assert nonce is not None
+                if self._requests.get(nonce) is not tracker:
                     continue
 
-                if shard_info := self._tracked_identifies.get(request_info.shard.id):
-                    shard_info.mark_incomplete(request_info.guild_id)
+                if tracker.deadline > now:
+                    self._push_deadline(nonce, tracker)
+                    continue
 
-                timed_out_requests.append(request_info)
                 del self._requests[nonce]
-
-            for shard_info in self._tracked_identifies.copy().values():
-                # The previous loop may have depleted an identify tracker so we handle
-                # that here.
-                if date - shard_info.last_received_at < self._timeout and shard_info.guild_ids:
+                timed_out_requests.append(tracker)
+                if shard_info := self._tracked_identifies.get(tracker.shard.id):
+                    shard_info.mark_incomplete(tracker.guild_id)
+                    # Timing out this request may have depleted the identify tracker.
+                    if not shard_info.guild_ids:
+                        due_shards.append(shard_info)
+
+            # Requests are handled before identify trackers so that any timed-out
+            # requests are marked as incomplete before their identify tracker is.
+            for shard_info in due_shards:
+                if self._tracked_identifies.get(shard_info.shard.id) is not shard_info:
                     continue
 
                 del self._tracked_identifies[shard_info.shard.id]
@@ -504,6 +555,7 @@ class ChunkTracker:
             await asyncio.gather(*map(self._dispatch_shard_finished, timed_out_shards))
             timed_out_requests.clear()
             timed_out_shards.clear()
+            due_shards.clear()
 
     async def _dispatch_finished(self, data: _RequestData, /, *, nonce: str | None = None) -> None:
         await self._event_manager.dispatch(ChunkRequestFinishedEvent(self._rest, data.shard, data))
@@ -586,6 +638,7 @@ class ChunkTracker:
         chunk_count = int(event.payload["chunk_count"])
         chunk_index = int(event.payload["chunk_index"])
         date = _now()
+        deadline = self._next_deadline()
         guild_id = hikari.Snowflake(event.payload["guild_id"])
         nonce = str(nonce)
         not_found_ids = event.payload.get("not_found")
@@ -593,6 +646,7 @@ class ChunkTracker:
         shard_info = self._tracked_identifies.get(event.shard.id)
         if shard_info and shard_info.check_nonce(guild_id, nonce):
             shard_info.any_received = True
+            shard_info.deadline = deadline
             shard_info.last_received_at = date
 
         data = self._requests.get(nonce)
@@ -602,6 +656,7 @@ class ChunkTracker:
                 data.first_received_at = date
                 data.missing_chunks = set(range(chunk_count))
 
+            data.deadline = deadline
             data.last_received_at = date
             data.missing_chunks.remove(chunk_index)
 
@@ -624,6 +679,7 @@ class ChunkTracker:
             event.shard,
             guild_id,
             chunk_count=chunk_count,
+            deadline=deadline,
             first_received_at=date,
             last_received_at=date,
             missing_chunks=chunks,
@@ -631,6 +687,7 @@ class ChunkTracker:
         )
         if data.missing_chunks:
             self._requests[nonce] = data
+            self._push_deadline(nonce, data)
             self._ensure_loop()
 
         else:
@@ -644,13 +701,16 @@ class ChunkTracker:
         else:
             known_nonces = None
 
-        self._tracked_identifies[event.shard.id] = _ShardInfo(event.shard, guild_ids, known_nonces=known_nonces)
+        shard_info = _ShardInfo(event.shard, guild_ids, deadline=self._next_deadline(), known_nonces=known_nonces)
+        self._tracked_identifies[event.shard.id] = shard_info
+        self._push_deadline(None, shard_info)
 
     async def _on_starting_event(self, _: hikari.StartingEvent, /) -> None:
         self._is_starting = True
 
     async def _on_stopping_event(self, _: hikari.StoppedEvent, /) -> None:
         self._is_starting = False
+        self._deadlines.clear()
         self._requests.clear()
         self._tracked_identifies.clear()
 
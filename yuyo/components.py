@@ -36,6 +36,7 @@ __all__: list[str] = [
     "ComponentContext",
     "ComponentExecutor",
     "ComponentPaginator",
+    "MultiWaitForExecutor",
     "StaticComponentPaginator",
     "StaticPaginatorIndex",
     "StreamExecutor",
@@ -63,6 +64,11 @@ import enum
 import functools
 import hashlib
 import itertools
+import json
+import mmap
+import pathlib
+import struct
+import tempfile
 import types
 import typing
 import urllib.parse
@@ -79,10 +85,12 @@ from . import modals
 from . import pagination
 from . import timeouts
 from ._internal import localise
+from ._internal import serialise
 
 _T = typing.TypeVar("_T")
 
 if typing.TYPE_CHECKING:
+    import os
     from typing import Self
 
     import tanjun
@@ -137,7 +145,7 @@ def _decorate(value: _T | None, callback: collections.Callable[[_T], object], /)
 class ComponentContext(interactions.BaseContext[hikari.ComponentInteraction]):
     """The context used for message component triggers."""
 
-    __slots__ = ("_client",)
+    __slots__ = ("_client", "_selected_ids")
 
     def __init__(
         self,
@@ -147,6 +155,7 @@ class ComponentContext(interactions.BaseContext[hikari.ComponentInteraction]):
         id_metadata: str,
         register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
         *,
+        deletion_scheduler: interactions.DeletionScheduler | None = None,
         ephemeral_default: bool = False,
         response_future: asyncio.Future[_ComponentResponseT] | None = None,
     ) -> None:
@@ -155,17 +164,41 @@ class ComponentContext(interactions.BaseContext[hikari.ComponentInteraction]):
             id_match=id_match,
             id_metadata=id_metadata,
             register_task=register_task,
+            deletion_scheduler=deletion_scheduler,
             ephemeral_default=ephemeral_default,
             response_future=response_future,
         )
         self._client = client
         self._response_future = response_future
+        self._selected_ids: collections.Sequence[hikari.Snowflake] | None = None
 
     @property
     def alluka(self) -> alluka_.abc.Client:
         """The Alluka client being used for callback dependency injection."""
         return self._client.alluka
 
+    @property
+    def selected_ids(self) -> collections.Sequence[hikari.Snowflake]:
+        """Sequence of the IDs passed for a user, role, channel or mentionable select menu.
+
+        This is parsed from the interaction's raw values on first access and
+        doesn't touch the interaction's resolved entities, making it the
+        cheapest way to handle selections when only their IDs are needed.
+
+        Raises
+        ------
+        ValueError
+            If this is accessed for a text select menu interaction.
+        """
+        if self._selected_ids is None:
+            if self._interaction.component_type == hikari.ComponentType.TEXT_SELECT_MENU:
+                error_message = "Cannot get the selected IDs for a text select menu"
+                raise ValueError(error_message)
+
+            self._selected_ids = tuple(map(hikari.Snowflake, self._interaction.values))
+
+        return self._selected_ids
+
     @property
     def selected_channels(self) -> collections.Mapping[hikari.Snowflake, hikari.InteractionChannel]:
         """Sequence of the users passed for a channel select menu."""
@@ -355,6 +388,7 @@ class ComponentClient:
     __slots__ = (
         "_alluka",
         "_cache",
+        "_deletion_scheduler",
         "_event_manager",
         "_executors",
         "_gc_task",
@@ -371,6 +405,7 @@ class ComponentClient:
         *,
         alluka: alluka_.abc.Client | None = None,
         cache: hikari.api.Cache | None = None,
+        deletion_store: interactions.AbstractDeletionStore | None = None,
         event_manager: hikari.api.EventManager | None = None,
         event_managed: bool | None = None,
         rest: hikari.api.RESTClient | None = None,
@@ -395,6 +430,11 @@ class ComponentClient:
             The Alluka client to use for callback dependency injection in this client.
 
             If not provided then this will initialise its own Alluka client.
+        deletion_store
+            Local store used to persist pending `delete_after` deletions so
+            they survive restarts.
+
+            This requires `rest` to be passed.
         event_manager
             The event manager this client should listen to dispatched component
             interactions from if applicable.
@@ -410,7 +450,8 @@ class ComponentClient:
         Raises
         ------
         ValueError
-            If `event_managed` is passed as [True][] when `event_manager` is [None][].
+            * If `event_managed` is passed as [True][] when `event_manager` is [None][].
+            * If `deletion_store` is passed without `rest`.
         """
         if alluka is None:
             alluka = alluka_local.get_client(default=None) or alluka_.Client()
@@ -419,6 +460,7 @@ class ComponentClient:
         self._alluka = alluka
 
         self._cache = cache
+        self._deletion_scheduler = interactions.DeletionScheduler(rest=rest, store=deletion_store)
         self._executors: dict[str, tuple[timeouts.AbstractTimeout, AbstractComponentExecutor]] = {}
         """Dict of custom IDs to executors."""
 
@@ -430,7 +472,7 @@ class ComponentClient:
         self._rest = rest
         self._server = server
         self._shards = shards
-        self._tasks: list[asyncio.Task[typing.Any]] = []
+        self._tasks: set[asyncio.Task[typing.Any]] = set()
         self._voice = voice
 
         if event_managed or (event_managed is None and event_manager):
@@ -459,6 +501,11 @@ class ComponentClient:
         """Hikari cache instance this client was initialised with."""
         return self._cache
 
+    @property
+    def deletion_scheduler(self) -> interactions.DeletionScheduler:
+        """The scheduler used to handle `delete_after` for this client's responses."""
+        return self._deletion_scheduler
+
     @property
     def events(self) -> hikari.api.EventManager | None:
         """Object of the event manager this client was initialised with."""
@@ -602,11 +649,11 @@ class ComponentClient:
         alluka.set_type_dependency(Client, self)
 
     def _remove_task(self, task: asyncio.Task[typing.Any], /) -> None:
-        self._tasks.remove(task)
+        self._tasks.discard(task)
 
     def _add_task(self, task: asyncio.Task[typing.Any], /) -> None:
         if not task.done():
-            self._tasks.append(task)
+            self._tasks.add(task)
             task.add_done_callback(self._remove_task)
 
     async def _on_starting(self, _: hikari.StartingEvent | hikari.RESTBotAware, /) -> None:
@@ -628,6 +675,7 @@ class ComponentClient:
 
         self._gc_task.cancel()
         self._gc_task = None
+        self._deletion_scheduler.close()
         if self._server:
             self._server.set_listener(hikari.ComponentInteraction, None)
 
@@ -644,6 +692,7 @@ class ComponentClient:
             return
 
         self._gc_task = asyncio.get_running_loop().create_task(self._gc())
+        self._deletion_scheduler.open()
 
         if self._server:
             self._server.set_listener(hikari.ComponentInteraction, self.on_rest_request)
@@ -677,6 +726,7 @@ class ComponentClient:
             id_match=id_match,
             id_metadata=id_metadata,
             register_task=self._add_task,
+            deletion_scheduler=self._deletion_scheduler,
             response_future=future,
         )
         if timeout.increment_uses():
@@ -971,7 +1021,7 @@ class AbstractComponentExecutor(abc.ABC):
 class SingleExecutor(AbstractComponentExecutor):
     """Component executor with a single callback."""
 
-    __slots__ = ("_callback", "_custom_id", "_ephemeral_default")
+    __slots__ = ("_callback", "_custom_id", "_ephemeral_default", "_needs_injection")
 
     def __init__(self, custom_id: str, callback: CallbackSig, /, *, ephemeral_default: bool = False) -> None:
         """Initialise an executor with a single callback.
@@ -1000,6 +1050,7 @@ class SingleExecutor(AbstractComponentExecutor):
         self._callback = callback
         self._custom_id = custom_id
         self._ephemeral_default = ephemeral_default
+        self._needs_injection = _internal.needs_injection(callback)
 
     @property
     def custom_ids(self) -> collections.Collection[str]:
@@ -1007,7 +1058,11 @@ class SingleExecutor(AbstractComponentExecutor):
 
     async def execute(self, ctx: Context, /) -> None:
         ctx.set_ephemeral_default(self._ephemeral_default)
-        await ctx.client.alluka.call_with_async_di(self._callback, ctx)
+        if self._needs_injection:
+            await ctx.client.alluka.call_with_async_di(self._callback, ctx)
+
+        else:
+            await self._callback(ctx)
 
 
 def as_single_executor(
@@ -1036,7 +1091,7 @@ def as_single_executor(
 class ComponentExecutor(AbstractComponentExecutor):  # TODO: Not found action?
     """implementation of a component executor with per-custom ID callbacks."""
 
-    __slots__ = ("_ephemeral_default", "_id_to_callback")
+    __slots__ = ("_ephemeral_default", "_id_to_callback", "_injected_ids")
 
     def __init__(self, *, ephemeral_default: bool = False) -> None:
         """Initialise a component executor.
@@ -1048,6 +1103,8 @@ class ComponentExecutor(AbstractComponentExecutor):  # TODO: Not found action?
         """
         self._ephemeral_default = ephemeral_default
         self._id_to_callback: dict[str, CallbackSig] = {}
+        self._injected_ids: set[str] = set()
+        """Set of the custom IDs with callbacks which need dependency injection."""
 
     @property
     def callbacks(self) -> collections.Mapping[str, CallbackSig]:
@@ -1063,7 +1120,11 @@ class ComponentExecutor(AbstractComponentExecutor):  # TODO: Not found action?
         # <<inherited docstring from AbstractComponentExecutor>>.
         ctx.set_ephemeral_default(self._ephemeral_default)
         callback = self._id_to_callback[ctx.id_match]
-        await ctx.client.alluka.call_with_async_di(callback, ctx)
+        if ctx.id_match in self._injected_ids:
+            await ctx.client.alluka.call_with_async_di(callback, ctx)
+
+        else:
+            await callback(ctx)
 
     def set_callback(self, custom_id: str, callback: CallbackSig, /) -> Self:
         """Set the callback for a custom ID.
@@ -1088,6 +1149,7 @@ class ComponentExecutor(AbstractComponentExecutor):  # TODO: Not found action?
             raise RuntimeError(error_message)
 
         self._id_to_callback[custom_id] = callback
+        _track_injection(self._injected_ids, custom_id, callback)
         return self
 
     def with_callback(self, custom_id: str, /) -> collections.Callable[[_CallbackSigT], _CallbackSigT]:
@@ -1245,6 +1307,120 @@ WaitFor = WaitForExecutor
 """Alias of [WaitForExecutor][yuyo.components.WaitForExecutor]."""
 
 
+class MultiWaitForExecutor(AbstractComponentExecutor):
+    """Component executor used to multiplex waits for component interactions.
+
+    Unlike [WaitForExecutor][yuyo.components.WaitForExecutor], this is
+    registered once and then serves any number of concurrent waits, each keyed
+    by the custom ID's match part and the ID of the user who's expected to use
+    it. Pending waits are expired through a single shared deadline structure.
+
+    Examples
+    --------
+    ```py
+    waiter = yuyo.components.MultiWaitForExecutor(["confirm", "cancel"], timeout=datetime.timedelta(seconds=30))
+    component_client.register_executor(waiter, timeout=None)
+
+    ...
+
+    await ctx.respond("are you sure?", components=[...])  # Components with the "confirm" and "cancel" IDs.
+
+    try:
+        result = await waiter.wait_for("confirm", ctx.author)
+    except asyncio.TimeoutError:
+        await ctx.respond("timed out")
+    else:
+        await result.respond("...")
+    ```
+    """
+
+    __slots__ = ("_custom_ids", "_ephemeral_default", "_timeout", "_waiters")
+
+    def __init__(
+        self,
+        custom_ids: collections.Collection[str],
+        /,
+        *,
+        ephemeral_default: bool = False,
+        timeout: datetime.timedelta | None,
+    ) -> None:
+        """Initialise a multiplexed wait for executor.
+
+        Parameters
+        ----------
+        custom_ids
+            Collection of the custom IDs this executor should be triggered by when
+            registered globally.
+        ephemeral_default
+            Whether or not the responses made on contexts spawned from this executor
+            should default to ephemeral (meaning only the author can see them) unless
+            `flags` is specified on the response method.
+        timeout
+            How long each wait should last for before it times-out.
+
+            If this is [None][] then waits will never time-out.
+        """
+        self._custom_ids = custom_ids
+        self._ephemeral_default = ephemeral_default
+        self._timeout = timeout.total_seconds() if timeout is not None else None
+        self._waiters: _internal.WaiterRegistry[tuple[str, hikari.Snowflake], Context] = _internal.WaiterRegistry()
+
+    @property
+    def custom_ids(self) -> collections.Collection[str]:
+        # <<inherited docstring from AbstractComponentExecutor>>.
+        return self._custom_ids
+
+    def is_waiting(self, custom_id: str, user: hikari.SnowflakeishOr[hikari.User], /) -> bool:
+        """Whether a wait is pending for a custom ID and user.
+
+        Parameters
+        ----------
+        custom_id
+            The custom ID to check. Only the match part of this is used.
+        user
+            The user to check.
+        """
+        return (_internal.split_custom_id(custom_id).id_match, hikari.Snowflake(user)) in self._waiters
+
+    async def wait_for(self, custom_id: str, user: hikari.SnowflakeishOr[hikari.User], /) -> Context:
+        """Wait for a user to use a component.
+
+        Parameters
+        ----------
+        custom_id
+            The custom ID of the component to wait for.
+
+            Only the match part of this (the part before any ":") is used.
+        user
+            The user to wait for.
+
+        Returns
+        -------
+        Context
+            The matching interaction.
+
+        Raises
+        ------
+        RuntimeError
+            If this custom ID and user pair is already being waited for.
+        asyncio.TimeoutError
+            If the timeout is reached.
+        """
+        key = (_internal.split_custom_id(custom_id).id_match, hikari.Snowflake(user))
+        future = self._waiters.add(key, self._timeout)
+        try:
+            return await future
+
+        finally:
+            self._waiters.discard(key, future)
+
+    async def execute(self, ctx: Context, /) -> None:
+        # <<inherited docstring from AbstractComponentExecutor>>.
+        ctx.set_ephemeral_default(self._ephemeral_default)
+        if not self._waiters.resolve((ctx.id_match, ctx.interaction.user.id), ctx):
+            await ctx.create_initial_response("You are not allowed to use this component", ephemeral=True)
+
+
 class StreamExecutor(AbstractComponentExecutor, timeouts.AbstractTimeout):
     """Stream over the received component interactions.
 
@@ -2300,8 +2476,16 @@ def builder(builder: hikari.api.ComponentBuilder, /) -> _BuilderDescriptor:
     return _BuilderDescriptor(builder)
 
 
+def _track_injection(injected_ids: set[str], id_match: str, callback: CallbackSig, /) -> None:
+    if _internal.needs_injection(callback):
+        injected_ids.add(id_match)
+
+    else:
+        injected_ids.discard(id_match)
+
+
 class _StaticField:
-    __slots__ = ("builder", "callback", "id_match", "is_self_bound", "name")
+    __slots__ = ("builder", "callback", "id_match", "is_self_bound", "name", "needs_injection")
 
     def __init__(
         self,
@@ -2318,6 +2502,7 @@ class _StaticField:
         self.id_match: str = id_match
         self.is_self_bound: bool = self_bound
         self.name: str = name
+        self.needs_injection: bool = bool(callback and _internal.needs_injection(callback))
 
 
 class _CustomIdProto(typing.Protocol):
@@ -2431,7 +2616,7 @@ class ActionColumnExecutor(AbstractComponentExecutor):
     ```
     """
 
-    __slots__ = ("_authors", "_callbacks", "_ephemeral_default", "_rows")
+    __slots__ = ("_authors", "_callbacks", "_ephemeral_default", "_injected_ids", "_rows")
 
     _added_static_fields: typing.ClassVar[dict[str, _StaticField]] = {}
     """Dict of match IDs to the static fields added to this class through add method calls.
@@ -2475,6 +2660,9 @@ class ActionColumnExecutor(AbstractComponentExecutor):
         self._authors = set(map(hikari.Snowflake, authors)) if authors else None
         self._callbacks: dict[str, CallbackSig] = {}
         self._ephemeral_default = ephemeral_default
+        self._injected_ids: set[str] = set()
+        """Set of the match IDs with callbacks which need dependency injection."""
+
         self._rows: list[hikari.api.MessageActionRowBuilder] = []
 
         for field in self._static_fields.values():
@@ -2492,6 +2680,8 @@ class ActionColumnExecutor(AbstractComponentExecutor):
                 self._callbacks[field.id_match] = (
                     types.MethodType(field.callback, self) if field.is_self_bound else field.callback
                 )
+                if field.needs_injection:
+                    self._injected_ids.add(field.id_match)
 
     def __init_subclass__(cls, *args: typing.Any, **kwargs: typing.Any) -> None:
         super().__init_subclass__(*args, **kwargs)
@@ -2533,7 +2723,11 @@ class ActionColumnExecutor(AbstractComponentExecutor):
             return
 
         callback = self._callbacks[ctx.id_match]
-        await ctx.client.alluka.call_with_async_di(callback, ctx)
+        if ctx.id_match in self._injected_ids:
+            await ctx.client.alluka.call_with_async_di(callback, ctx)
+
+        else:
+            await callback(ctx)
 
     def add_builder(self, builder: hikari.api.ComponentBuilder, /) -> Self:
         """Add a raw component builder to this action column.
@@ -2615,6 +2809,7 @@ class ActionColumnExecutor(AbstractComponentExecutor):
             style, custom_id, emoji=emoji, label=label, is_disabled=is_disabled
         )
         self._callbacks[id_match] = callback
+        _track_injection(self._injected_ids, id_match, callback)
         return self
 
     def with_interactive_button(
@@ -2886,6 +3081,7 @@ class ActionColumnExecutor(AbstractComponentExecutor):
             is_disabled=is_disabled,
         )
         self._callbacks[id_match] = callback
+        _track_injection(self._injected_ids, id_match, callback)
         return self
 
     @classmethod
@@ -3667,6 +3863,7 @@ class ActionColumnExecutor(AbstractComponentExecutor):
             is_disabled=is_disabled,
         )
         self._callbacks[id_match] = callback
+        _track_injection(self._injected_ids, id_match, callback)
         return self
 
     @typing.overload
@@ -3935,6 +4132,7 @@ class ActionColumnExecutor(AbstractComponentExecutor):
         )
         _append_row(self._rows).add_component(menu)
         self._callbacks[id_match] = callback
+        _track_injection(self._injected_ids, id_match, callback)
         return menu
 
     @typing.overload
@@ -5220,6 +5418,53 @@ class StaticComponentPaginator(ActionColumnExecutor):
         await index.callback(ctx, -1)
 
 
+_EXPORT_MAGIC = b"YUYOPAG1"
+_EXPORT_HEADER = struct.Struct("<8sQQ")
+"""Struct of an exported index's magic bytes, JSON paginator table length and total page count."""
+_EXPORT_PAGE_ENTRY = struct.Struct("<QQ")
+"""Struct of an exported page's offset (relative to the start of the page blobs) and length."""
+
+
+class _MappedPages(collections.Sequence[pagination.AbstractPage]):
+    """Sequence of static paginator pages which are decoded from a memory-mapped file on demand."""
+
+    __slots__ = ("_blobs_offset", "_count", "_data", "_entries_offset")
+
+    def __init__(self, data: mmap.mmap, entries_offset: int, blobs_offset: int, count: int, /) -> None:
+        self._blobs_offset = blobs_offset
+        self._count = count
+        self._data = data
+        self._entries_offset = entries_offset
+
+    @typing.overload
+    def __getitem__(self, index: int, /) -> pagination.AbstractPage: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice, /) -> collections.Sequence[pagination.AbstractPage]: ...
+
+    def __getitem__(
+        self, index: int | slice, /
+    ) -> pagination.AbstractPage | collections.Sequence[pagination.AbstractPage]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            error_message = "Page index out of range"
+            raise IndexError(error_message)
+
+        offset, length = _EXPORT_PAGE_ENTRY.unpack_from(
+            self._data, self._entries_offset + index * _EXPORT_PAGE_ENTRY.size
+        )
+        offset += self._blobs_offset
+        return serialise.decode_page(self._data[offset : offset + length])
+
+    def __len__(self) -> int:
+        return self._count
+
+
 def _noop(ctx: Context, /) -> _CoroT:
     """Create a noop initial response to a component context."""
     return ctx.create_initial_response(response_type=hikari.ResponseType.MESSAGE_UPDATE)
@@ -5231,6 +5476,7 @@ class StaticPaginatorIndex:
     __slots__ = (
         "_make_components",
         "_make_modal",
+        "_mapping",
         "_modal_title",
         "_not_found_response",
         "_out_of_date_response",
@@ -5270,6 +5516,7 @@ class StaticPaginatorIndex:
         """
         self._make_components = make_components
         self._make_modal = make_modal
+        self._mapping: mmap.mmap | None = None
         self._modal_title = localise.MaybeLocalised[str].parse("Modal title", modal_title)
         self._not_found_response = not_found_response or pagination.Page("Page not found")
         self._out_of_date_response = out_of_date_response or pagination.Page("This response is out of date")
@@ -5335,6 +5582,193 @@ class StaticPaginatorIndex:
         )
         return self
 
+    async def replace_paginators(
+        self,
+        paginators: collections.Mapping[str, collections.Sequence[pagination.AbstractPage]],
+        /,
+        *,
+        yield_every: int = 100,
+    ) -> None:
+        """Atomically replace all the static paginators in this index.
+
+        A content hash is calculated for each paginator from its serialised
+        pages (using BLAKE2b) and paginators whose hash hasn't changed keep
+        their existing data. Any paginators which aren't included in
+        `paginators` are removed.
+
+        Hashing yields to the event loop periodically and the stored
+        paginators are only swapped out once every hash has been calculated,
+        so interactions keep being handled against the old data until then.
+
+        !!! warning
+            Paginators set with
+            [StaticPaginatorIndex.set_paginator][yuyo.components.StaticPaginatorIndex.set_paginator]
+            while this is running will be discarded.
+
+        Parameters
+        ----------
+        paginators
+            Mapping of paginator IDs to sequences of the paginators' built pages.
+        yield_every
+            How many pages should be hashed between yields to the event loop.
+
+        Raises
+        ------
+        ValueError
+            If `yield_every` is less than 1.
+        """
+        if yield_every < 1:
+            error_message = "yield_every must be greater than 0"
+            raise ValueError(error_message)
+
+        old_paginators = self._paginators
+        new_paginators: dict[str, StaticPaginatorData] = {}
+        hashed_count = 0
+
+        for paginator_id, pages in paginators.items():
+            hasher = hashlib.blake2b(digest_size=8)
+            for page in pages:
+                hasher.update(serialise.encode_page(page))
+                hashed_count += 1
+                if hashed_count % yield_every == 0:
+                    await asyncio.sleep(0)
+
+            content_hash = hasher.hexdigest()
+            old_paginator = old_paginators.get(paginator_id)
+            if old_paginator and old_paginator.content_hash == content_hash:
+                new_paginators[paginator_id] = old_paginator
+
+            else:
+                new_paginators[paginator_id] = StaticPaginatorData(
+                    paginator_id, pages, content_hash=content_hash, make_components=self._make_components
+                )
+
+        self._paginators = new_paginators
+        # An attached file's memory map is kept open while unchanged paginators are still reading from it.
+        still_mapped = any(isinstance(paginator.pages, _MappedPages) for paginator in new_paginators.values())
+        if self._mapping and not still_mapped:
+            self._mapping.close()
+            self._mapping = None
+
+    def export_to_file(self, path: str | os.PathLike[str], /) -> Self:
+        """Export the static paginators in this index to a file.
+
+        This file can then be attached to by other processes on the same host
+        using [StaticPaginatorIndex.attach_file][yuyo.components.StaticPaginatorIndex.attach_file]
+        to share one copy of the static paginator data between them.
+
+        The file is written to a temporary path before being moved into place,
+        so processes won't attach to a partially written export.
+
+        Parameters
+        ----------
+        path
+            Path of the file to export the paginators to.
+
+            This will be overwritten if it already exists.
+
+        Returns
+        -------
+        Self
+            The index to enable chained calls.
+
+        Raises
+        ------
+        ValueError
+            If any of the pages have a stream-backed attachment, as these
+            can't be exported.
+        """
+        path = pathlib.Path(path)
+        table: dict[str, dict[str, typing.Any]] = {}
+        page_entries = bytearray()
+        blobs: list[bytes] = []
+        page_count = 0
+        blob_offset = 0
+
+        for paginator_id, paginator in self._paginators.items():
+            table[paginator_id] = {"hash": paginator.content_hash, "start": page_count, "count": len(paginator.pages)}
+            for page in paginator.pages:
+                blob = serialise.encode_page(page, strict=True)
+                page_entries += _EXPORT_PAGE_ENTRY.pack(blob_offset, len(blob))
+                blobs.append(blob)
+                blob_offset += len(blob)
+                page_count += 1
+
+        raw_table = json.dumps(table, separators=(",", ":")).encode()
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", delete=False) as file:
+            try:
+                file.write(_EXPORT_HEADER.pack(_EXPORT_MAGIC, len(raw_table), page_count))
+                file.write(raw_table)
+                file.write(page_entries)
+                file.writelines(blobs)
+
+            except BaseException:
+                file.close()
+                pathlib.Path(file.name).unlink()
+                raise
+
+        pathlib.Path(file.name).replace(path)
+        return self
+
+    def attach_file(self, path: str | os.PathLike[str], /) -> Self:
+        """Replace the static paginators in this index with those from an exported file.
+
+        The file is memory-mapped read-only and pages are only decoded when
+        they're accessed, so this doesn't load the paginators' content into
+        this process' memory.
+
+        Any file which was previously attached to this index is closed.
+
+        Parameters
+        ----------
+        path
+            Path to a file created by
+            [StaticPaginatorIndex.export_to_file][yuyo.components.StaticPaginatorIndex.export_to_file].
+
+        Returns
+        -------
+        Self
+            The index to enable chained calls.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't a valid static paginator export.
+        """
+        with pathlib.Path(path).open("rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, table_length, page_count = _EXPORT_HEADER.unpack_from(data)
+
+        except struct.error:
+            magic = table_length = page_count = None
+
+        if magic != _EXPORT_MAGIC or table_length is None or page_count is None:
+            data.close()
+            error_message = "Not a valid static paginator export"
+            raise ValueError(error_message)
+
+        entries_start = _EXPORT_HEADER.size + table_length
+        blobs_start = entries_start + page_count * _EXPORT_PAGE_ENTRY.size
+        table = json.loads(data[_EXPORT_HEADER.size : entries_start])
+        self._paginators = {
+            paginator_id: StaticPaginatorData(
+                paginator_id,
+                _MappedPages(
+                    data, entries_start + entry["start"] * _EXPORT_PAGE_ENTRY.size, blobs_start, entry["count"]
+                ),
+                content_hash=entry["hash"],
+                make_components=self._make_components,
+            )
+            for paginator_id, entry in table.items()
+        }
+        if self._mapping:
+            self._mapping.close()
+
+        self._mapping = data
+        return self
+
     def get_paginator(self, paginator_id: str, /) -> StaticPaginatorData:
         """Get a paginator.
 
@@ -30,13 +30,25 @@
 """Base classes used for interaction handling."""
 from __future__ import annotations
 
-__all__ = ["BaseContext", "InteractionError"]
+__all__ = [
+    "AbstractDeletionStore",
+    "BaseContext",
+    "CoalescingEditor",
+    "DeletionScheduler",
+    "InteractionError",
+    "PendingDeletion",
+    "SQLiteDeletionStore",
+]
 
 import abc
 import asyncio
 import datetime
+import heapq
+import itertools
 import logging
 import os
+import sqlite3
+import time
 import typing
 from collections import abc as collections
 
@@ -46,6 +58,7 @@ from hikari import snowflakes
 from . import _internal
 
 if typing.TYPE_CHECKING:
+    import types
     from typing import Self
 
     import alluka as alluka_
@@ -61,6 +74,14 @@ _ComponentResponseT = (
 _LOGGER = logging.getLogger("hikari.yuyo.components")
 
 _MAX_MENTIONS = 100
+_EXCLUSIVE_EDIT_FIELDS: typing.Final[dict[str, str]] = {
+    "attachment": "attachments",
+    "attachments": "attachment",
+    "component": "components",
+    "components": "component",
+    "embed": "embeds",
+    "embeds": "embed",
+}
 
 
 def _delete_after_to_float(delete_after: datetime.timedelta | float | int, /) -> float:
@@ -70,10 +91,323 @@ def _delete_after_to_float(delete_after: datetime.timedelta | float | int, /) ->
 _ATTACHMENT_TYPES: tuple[type[typing.Any], ...] = (hikari.files.Resource, *hikari.files.RAWISH_TYPES, os.PathLike)
 
 
+class PendingDeletion(typing.NamedTuple):
+    """Represents an interaction response which is scheduled to be deleted."""
+
+    delete_at: float
+    """Unix timestamp of when this response should be deleted."""
+
+    application_id: hikari.Snowflake
+    """ID of the application the interaction belongs to."""
+
+    token: str
+    """The interaction's token."""
+
+    message_id: hikari.Snowflake | None
+    """ID of the followup message to delete.
+
+    This will be [None][] for the initial response.
+    """
+
+
+class AbstractDeletionStore(abc.ABC):
+    """Abstract interface of a local store used to persist pending deletions.
+
+    This lets scheduled `delete_after` deletions survive restarts.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def load(self) -> collections.Sequence[PendingDeletion]:
+        """Load all the stored pending deletions.
+
+        Returns
+        -------
+        collections.abc.Sequence[PendingDeletion]
+            The stored pending deletions.
+        """
+
+    @abc.abstractmethod
+    def add(self, deletions: collections.Sequence[PendingDeletion], /) -> None:
+        """Store pending deletions.
+
+        Parameters
+        ----------
+        deletions
+            The pending deletions to store.
+        """
+
+    @abc.abstractmethod
+    def remove(self, deletions: collections.Sequence[PendingDeletion], /) -> None:
+        """Remove pending deletions from the store.
+
+        Parameters
+        ----------
+        deletions
+            The pending deletions to remove.
+        """
+
+
+class SQLiteDeletionStore(AbstractDeletionStore):
+    """SQLite implementation of [AbstractDeletionStore][yuyo.interactions.AbstractDeletionStore]."""
+
+    __slots__ = ("_connection",)
+
+    def __init__(self, path: str | os.PathLike[str], /) -> None:
+        """Initialise an SQLite deletion store.
+
+        Parameters
+        ----------
+        path
+            Path of the SQLite database file to use.
+
+            `":memory:"` may be passed to use an in-memory database.
+        """
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pending_deletions "
+                "(delete_at REAL NOT NULL, application_id INTEGER NOT NULL, token TEXT NOT NULL, message_id INTEGER)"
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._connection.close()
+
+    def load(self) -> collections.Sequence[PendingDeletion]:
+        # <<inherited docstring from AbstractDeletionStore>>.
+        cursor = self._connection.execute("SELECT delete_at, application_id, token, message_id FROM pending_deletions")
+        return [
+            PendingDeletion(
+                delete_at,
+                hikari.Snowflake(application_id),
+                token,
+                None if message_id is None else hikari.Snowflake(message_id),
+            )
+            for delete_at, application_id, token, message_id in cursor
+        ]
+
+    def add(self, deletions: collections.Sequence[PendingDeletion], /) -> None:
+        # <<inherited docstring from AbstractDeletionStore>>.
+        with self._connection:
+            self._connection.executemany("INSERT INTO pending_deletions VALUES (?, ?, ?, ?)", deletions)
+
+    def remove(self, deletions: collections.Sequence[PendingDeletion], /) -> None:
+        # <<inherited docstring from AbstractDeletionStore>>.
+        with self._connection:
+            self._connection.executemany(
+                "DELETE FROM pending_deletions WHERE token = ? AND message_id IS ?",
+                ((deletion.token, deletion.message_id) for deletion in deletions),
+            )
+
+
+class DeletionScheduler:
+    """Shared scheduler used to delete interaction responses after a delay.
+
+    Pending deletions are kept in a heap which is processed by a single task,
+    with deletions which are due within `batch_window` of each other being
+    made together. This means that each scheduled deletion costs a heap entry
+    rather than its own sleeping task.
+
+    Writes to the store are similarly batched, with deletions scheduled within
+    `batch_window` of each other being stored in the same transaction.
+    """
+
+    __slots__ = (
+        "_batch_window",
+        "_counter",
+        "_entries",
+        "_flush_handle",
+        "_rest",
+        "_store",
+        "_task",
+        "_unsaved",
+        "_wake",
+    )
+
+    def __init__(
+        self,
+        *,
+        batch_window: datetime.timedelta | float = 0.5,
+        rest: hikari.api.RESTClient | None = None,
+        store: AbstractDeletionStore | None = None,
+    ) -> None:
+        """Initialise a deletion scheduler.
+
+        Parameters
+        ----------
+        batch_window
+            How close together (in seconds) deletions can be due to be made
+            in the same batch.
+        rest
+            The REST client to use for deletions.
+
+            If this isn't provided then the REST client of the relevant interaction
+            will be used.
+
+            This must be provided if `store` is as it's used to make the
+            deletions loaded by [DeletionScheduler.open][yuyo.interactions.DeletionScheduler.open].
+        store
+            Local store to persist pending deletions to, allowing them to survive
+            restarts.
+
+        Raises
+        ------
+        ValueError
+            If `store` is passed without `rest`.
+        """
+        if store and not rest:
+            error_message = "A REST client must be provided to load stored deletions"
+            raise ValueError(error_message)
+
+        self._batch_window = _delete_after_to_float(batch_window)
+        self._counter = itertools.count()
+        self._entries: list[tuple[float, int, PendingDeletion, hikari.api.RESTClient]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._rest = rest
+        self._store = store
+        self._task: asyncio.Task[None] | None = None
+        self._unsaved: list[PendingDeletion] = []
+        self._wake = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def open(self) -> None:
+        """Load any stored pending deletions.
+
+        This must be called within an active event loop.
+        """
+        if not self._store:
+            return
+
+        assert self._rest
+        for deletion in self._store.load():
+            self._push(deletion, self._rest, persist=False)
+
+    def close(self) -> None:
+        """Stop processing pending deletions.
+
+        If this scheduler has a store then its pending deletions are left in
+        the store to be loaded by the next call to
+        [DeletionScheduler.open][yuyo.interactions.DeletionScheduler.open].
+        Otherwise pending deletions will still be made, as they can't be
+        recovered later.
+        """
+        if not self._store:
+            return
+
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+        self._flush_store()
+        self._entries.clear()
+
+    def schedule(
+        self,
+        interaction: hikari.PartialInteraction,
+        delete_after: float,
+        /,
+        *,
+        message: hikari.SnowflakeishOr[hikari.Message] | None = None,
+    ) -> None:
+        """Schedule an interaction response to be deleted.
+
+        Parameters
+        ----------
+        interaction
+            The interaction to delete a response for.
+        delete_after
+            How many seconds from now the response should be deleted after.
+        message
+            The followup message to delete.
+
+            If this isn't provided then the initial response will be deleted.
+        """
+        deletion = PendingDeletion(
+            delete_at=time.time() + delete_after,
+            application_id=interaction.application_id,
+            token=interaction.token,
+            message_id=None if message is None else hikari.Snowflake(message),
+        )
+        self._push(deletion, self._rest or interaction.app.rest)
+
+    def _push(self, deletion: PendingDeletion, rest: hikari.api.RESTClient, /, *, persist: bool = True) -> None:
+        if persist and self._store:
+            self._unsaved.append(deletion)
+            if not self._flush_handle:
+                self._flush_handle = asyncio.get_running_loop().call_later(self._batch_window, self._flush_store)
+
+        entry = (deletion.delete_at, next(self._counter), deletion, rest)
+        heapq.heappush(self._entries, entry)
+        if not self._task:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+        elif self._entries[0] is entry:
+            self._wake.set()
+
+    async def _loop(self) -> None:
+        while self._entries:
+            delay = self._entries[0][0] - time.time()
+            if delay > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+
+                except TimeoutError:
+                    pass
+
+                continue
+
+            cutoff = time.time() + self._batch_window
+            batch: list[tuple[PendingDeletion, hikari.api.RESTClient]] = []
+            while self._entries and self._entries[0][0] <= cutoff:
+                _, _, deletion, rest = heapq.heappop(self._entries)
+                batch.append((deletion, rest))
+
+            results = await asyncio.gather(*(_delete(*entry) for entry in batch), return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    _LOGGER.error("Failed to delete response message", exc_info=result)
+
+            if self._store:
+                self._flush_store()
+                self._store.remove([deletion for deletion, _ in batch])
+
+        self._task = None
+
+    def _flush_store(self) -> None:
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self._store and self._unsaved:
+            unsaved = self._unsaved
+            self._unsaved = []
+            self._store.add(unsaved)
+
+
+async def _delete(deletion: PendingDeletion, rest: hikari.api.RESTClient, /) -> None:
+    try:
+        if deletion.message_id is None:
+            await rest.delete_interaction_response(deletion.application_id, deletion.token)
+
+        else:
+            await rest.delete_webhook_message(deletion.application_id, deletion.token, deletion.message_id)
+
+    except hikari.NotFoundError as exc:
+        _LOGGER.debug("Failed to delete response message", exc_info=exc)
+
+
 class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
     """Base class for components contexts."""
 
     __slots__ = (
+        "_cached_initial_response",
+        "_cached_last_response",
+        "_deletion_scheduler",
         "_ephemeral_default",
         "_has_been_deferred",
         "_has_responded",
@@ -81,9 +415,9 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         "_id_metadata",
         "_interaction",
         "_last_response_id",
+        "_lock",
         "_register_task",
         "_response_future",
-        "_response_lock",
     )
 
     def __init__(
@@ -93,6 +427,7 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         id_metadata: str,
         register_task: collections.Callable[[asyncio.Task[typing.Any]], None],
         *,
+        deletion_scheduler: DeletionScheduler | None = None,
         ephemeral_default: bool = False,
         response_future: (
             # _ModalResponseT
@@ -102,6 +437,9 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         ) = None,
     ) -> None:
         """Initialise a base context."""
+        self._cached_initial_response: hikari.Message | None = None
+        self._cached_last_response: hikari.Message | None = None
+        self._deletion_scheduler = deletion_scheduler
         self._ephemeral_default = ephemeral_default
         self._has_responded = False
         self._has_been_deferred = False
@@ -110,8 +448,8 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         self._interaction: _InteractionT = interaction
         self._last_response_id: hikari.Snowflake | None = None
         self._register_task = register_task
+        self._lock: asyncio.Lock | None = None
         self._response_future = response_future
-        self._response_lock = asyncio.Lock()
 
     @property
     @abc.abstractmethod
@@ -119,6 +457,14 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         """The Alluka client being used for callback dependency injection."""
         raise NotImplementedError
 
+    @property
+    def _response_lock(self) -> asyncio.Lock:
+        # This is created lazily as most contexts never need to lock around a response.
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        return self._lock
+
     @property
     def author(self) -> hikari.User:
         """Author of this interaction."""
@@ -254,6 +600,22 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         self._ephemeral_default = state
         return self
 
+    def _cache_initial_response(self, message: hikari.Message | None, /) -> None:
+        # When a followup completes a deferral the last response is also the
+        # initial response, so both caches have to be kept in sync.
+        if self._last_response_id is not None:
+            initial = message or self._cached_initial_response
+            if initial is None or initial.id == self._last_response_id:
+                self._cached_last_response = message
+
+        self._cached_initial_response = message
+
+    def _cache_last_response(self, message: hikari.Message | None, /) -> None:
+        if self._cached_initial_response and self._cached_initial_response.id == self._last_response_id:
+            self._cached_initial_response = message
+
+        self._cached_last_response = message
+
     def _validate_delete_after(self, delete_after: float | int | datetime.timedelta, /) -> float:
         delete_after = _delete_after_to_float(delete_after)
         time_left = (
@@ -333,6 +695,7 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
                 raise RuntimeError(error_message)
 
             self._has_been_deferred = True
+            self._cache_initial_response(None)
             if self._response_future:
                 # TODO: ModalInteraction.build_deferred_response needs to support defer_type
                 self._response_future.set_result(hikari.impl.InteractionDeferredBuilder(defer_type, flags=flags))
@@ -340,6 +703,13 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
             else:
                 await self._interaction.create_initial_response(defer_type, flags=flags)
 
+    def _schedule_followup_deletion(self, delete_after: float, message: hikari.Message, /) -> None:
+        if self._deletion_scheduler:
+            self._deletion_scheduler.schedule(self._interaction, delete_after, message=message)
+
+        else:
+            self._register_task(asyncio.create_task(self._delete_followup_after(delete_after, message)))
+
     async def _delete_followup_after(self, delete_after: float, message: hikari.Message, /) -> None:
         await asyncio.sleep(delete_after)
         try:
@@ -381,6 +751,7 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
             role_mentions=role_mentions,
         )
         self._last_response_id = message.id
+        self._cache_last_response(message)
         # This behaviour is undocumented and only kept by Discord for "backwards compatibility"
         # but the followup endpoint can be used to create the initial response for interactions
         # or edit in a deferred response and (while this does lead to some unexpected behaviour
@@ -388,7 +759,7 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         self._has_responded = True
 
         if delete_after is not None:
-            self._register_task(asyncio.create_task(self._delete_followup_after(delete_after, message)))
+            self._schedule_followup_deletion(delete_after, message)
 
         return message
 
@@ -524,6 +895,13 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
                 flags=flags,
             )
 
+    def _schedule_initial_response_deletion(self, delete_after: float, /) -> None:
+        if self._deletion_scheduler:
+            self._deletion_scheduler.schedule(self._interaction, delete_after)
+
+        else:
+            self._register_task(asyncio.create_task(self._delete_initial_response_after(delete_after)))
+
     async def _delete_initial_response_after(self, delete_after: float, /) -> None:
         await asyncio.sleep(delete_after)
         try:
@@ -605,9 +983,10 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
 
             self._response_future.set_result(result)
 
+        self._cache_initial_response(None)
         self._has_responded = True
         if delete_after is not None:
-            self._register_task(asyncio.create_task(self._delete_initial_response_after(delete_after)))
+            self._schedule_initial_response_deletion(delete_after)
 
     async def create_initial_response(
         self,
@@ -758,6 +1137,7 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
             The last context has no initial response.
         """
         await self._interaction.delete_initial_response()
+        self._cache_initial_response(None)
         # If they defer then delete the initial response, this should be treated as having
         # an initial response to allow for followup responses.
         self._has_responded = True
@@ -773,6 +1153,7 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         if self._last_response_id is None:
             if self._has_responded or self._has_been_deferred:
                 await self._interaction.delete_initial_response()
+                self._cache_initial_response(None)
                 # If they defer then delete the initial response then this should be treated as having
                 # an initial response to allow for followup responses.
                 self._has_responded = True
@@ -782,6 +1163,7 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
             raise LookupError(error_message)
 
         await self._interaction.delete_message(self._last_response_id)
+        self._cache_last_response(None)
 
     async def edit_initial_response(
         self,
@@ -902,11 +1284,12 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
             user_mentions=user_mentions,
             role_mentions=role_mentions,
         )
+        self._cache_initial_response(message)
         # This will be False if the initial response was deferred with this finishing the referral.
         self._has_responded = True
 
         if delete_after is not None:
-            self._register_task(asyncio.create_task(self._delete_initial_response_after(delete_after)))
+            self._schedule_initial_response_deletion(delete_after)
 
         return message
 
@@ -1031,8 +1414,9 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
                 user_mentions=user_mentions,
                 role_mentions=role_mentions,
             )
+            self._cache_last_response(message)
             if delete_after is not None:
-                self._register_task(asyncio.create_task(self._delete_followup_after(delete_after, message)))
+                self._schedule_followup_deletion(delete_after, message)
 
             return message
 
@@ -1054,9 +1438,51 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         error_message = "Context has no previous responses"
         raise LookupError(error_message)
 
-    async def fetch_initial_response(self) -> hikari.Message:
+    def coalesce_edits(
+        self, *, interval: datetime.timedelta | float = 1.0, last_response: bool = False
+    ) -> CoalescingEditor:
+        """Create a rate limited editor for this context's response.
+
+        This is useful for responses which are repeatedly edited to show
+        progress, with only the latest state being sent at most once every
+        `interval`.
+
+        Parameters
+        ----------
+        interval
+            The minimum time (in seconds) between edits being made.
+        last_response
+            Whether this should edit the last response rather than the initial
+            response.
+
+        Returns
+        -------
+        CoalescingEditor
+            The coalescing editor.
+
+            This should be closed (or used as an async context manager) to
+            ensure the final state is applied.
+        """
+        return CoalescingEditor(self, interval=interval, last_response=last_response)
+
+    async def fetch_initial_response(self, *, force: bool = False) -> hikari.Message:
         """Fetch the initial response for this context.
 
+        The message returned by the last call to
+        [BaseContext.edit_initial_response][yuyo.interactions.BaseContext.edit_initial_response]
+        or this method is cached and returned here rather than making a REST
+        request, until the initial response is otherwise created, deferred or
+        deleted through this context.
+
+        Parameters
+        ----------
+        force
+            Whether to always make a REST request rather than using the cached
+            message.
+
+            This should be used when the message may have been changed outside
+            of this context.
+
         Returns
         -------
         hikari.messages.Message
@@ -1067,11 +1493,31 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
         LookupError, hikari.errors.NotFoundError
             The response was not found.
         """
-        return await self._interaction.fetch_initial_response()
+        message = self._cached_initial_response
+        if force or message is None:
+            message = await self._interaction.fetch_initial_response()
+            self._cache_initial_response(message)
+
+        return message
 
-    async def fetch_last_response(self) -> hikari.Message:
+    async def fetch_last_response(self, *, force: bool = False) -> hikari.Message:
         """Fetch the last response for this context.
 
+        The message returned by the last call to
+        [BaseContext.create_followup][yuyo.interactions.BaseContext.create_followup],
+        [BaseContext.edit_last_response][yuyo.interactions.BaseContext.edit_last_response]
+        or this method is cached and returned here rather than making a REST
+        request, until the response is deleted through this context.
+
+        Parameters
+        ----------
+        force
+            Whether to always make a REST request rather than using the cached
+            message.
+
+            This should be used when the message may have been changed outside
+            of this context.
+
         Returns
         -------
         hikari.messages.Message
@@ -1083,10 +1529,15 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
             The response was not found.
         """
         if self._last_response_id is not None:
-            return await self._interaction.fetch_message(self._last_response_id)
+            message = self._cached_last_response
+            if force or message is None:
+                message = await self._interaction.fetch_message(self._last_response_id)
+                self._cache_last_response(message)
+
+            return message
 
         if self._has_responded:
-            return await self.fetch_initial_response()
+            return await self.fetch_initial_response(force=force)
 
         error_message = "Context has no previous known responses"
         raise LookupError(error_message)
@@ -1289,11 +1740,206 @@ class BaseContext(abc.ABC, typing.Generic[_InteractionT]):
             )
 
         if ensure_result:
-            return await self._interaction.fetch_initial_response()
+            return await self.fetch_initial_response()
 
         return None  # MyPy
 
 
+class CoalescingEditor:
+    """Rate limited editor for an interaction response.
+
+    This accepts edits at any rate but only keeps the latest pending state of
+    the message, with it being applied at most once every `interval`. This
+    makes it cheap to repeatedly update a response with progress.
+
+    The final state is always applied when the editor is flushed or closed and
+    this can be used as an async context manager which closes it on exit.
+    Errors raised while applying edits are logged and re-raised by the next
+    flush, except on a context manager exit which is already raising.
+
+    Examples
+    --------
+    ```py
+    async with ctx.coalesce_edits(interval=2) as editor:
+        for index, item in enumerate(items):
+            await process(item)
+            editor.edit(f"Processed {index + 1}/{len(items)}")
+    ```
+    """
+
+    __slots__ = ("_closed", "_edit", "_error", "_interval", "_last_edit", "_message", "_pending", "_task")
+
+    def __init__(
+        self,
+        ctx: BaseContext[typing.Any],
+        /,
+        *,
+        interval: datetime.timedelta | float = 1.0,
+        last_response: bool = False,
+    ) -> None:
+        """Initialise a coalescing editor.
+
+        Parameters
+        ----------
+        ctx
+            The context to edit a response for.
+        interval
+            The minimum time (in seconds) between edits being made.
+        last_response
+            Whether this should edit the context's last response rather than
+            its initial response.
+        """
+        self._closed = False
+        self._edit = ctx.edit_last_response if last_response else ctx.edit_initial_response
+        self._error: Exception | None = None
+        self._interval = _delete_after_to_float(interval)
+        self._last_edit = -self._interval
+        self._message: hikari.Message | None = None
+        self._pending: dict[str, typing.Any] | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, exc_traceback: types.TracebackType | None
+    ) -> None:
+        if exc is None:
+            await self.close()
+            return
+
+        # Edit errors are already logged by the edit loop and shouldn't mask
+        # the error which was raised inside the context.
+        try:
+            await self.close()
+
+        except Exception:  # noqa: BLE001, S110
+            pass
+
+    @property
+    def is_pending(self) -> bool:
+        """Whether this has edits which haven't been applied yet."""
+        return self._pending is not None or self._task is not None
+
+    @property
+    def message(self) -> hikari.Message | None:
+        """The message returned by the last edit this made."""
+        return self._message
+
+    def edit(
+        self,
+        content: hikari.UndefinedOr[typing.Any] = hikari.UNDEFINED,
+        *,
+        attachment: hikari.UndefinedNoneOr[hikari.Resourceish] = hikari.UNDEFINED,
+        attachments: hikari.UndefinedNoneOr[collections.Sequence[hikari.Resourceish]] = hikari.UNDEFINED,
+        component: hikari.UndefinedNoneOr[hikari.api.ComponentBuilder] = hikari.UNDEFINED,
+        components: hikari.UndefinedNoneOr[collections.Sequence[hikari.api.ComponentBuilder]] = hikari.UNDEFINED,
+        embed: hikari.UndefinedNoneOr[hikari.Embed] = hikari.UNDEFINED,
+        embeds: hikari.UndefinedNoneOr[collections.Sequence[hikari.Embed]] = hikari.UNDEFINED,
+        mentions_everyone: hikari.UndefinedOr[bool] = hikari.UNDEFINED,
+        user_mentions: hikari.SnowflakeishSequence[hikari.PartialUser] | bool | hikari.UndefinedType = hikari.UNDEFINED,
+        role_mentions: hikari.SnowflakeishSequence[hikari.PartialRole] | bool | hikari.UndefinedType = hikari.UNDEFINED,
+    ) -> None:
+        """Queue an edit for the response.
+
+        This is merged with any edits which haven't been applied yet, with
+        later values overriding earlier ones.
+
+        For more information on this method's parameters see
+        [BaseContext.edit_initial_response][yuyo.interactions.BaseContext.edit_initial_response].
+
+        Raises
+        ------
+        RuntimeError
+            If this editor has been closed.
+        """
+        if self._closed:
+            error_message = "Editor has been closed"
+            raise RuntimeError(error_message)
+
+        fields = {
+            "content": content,
+            "attachment": attachment,
+            "attachments": attachments,
+            "component": component,
+            "components": components,
+            "embed": embed,
+            "embeds": embeds,
+            "mentions_everyone": mentions_everyone,
+            "user_mentions": user_mentions,
+            "role_mentions": role_mentions,
+        }
+        pending = self._pending if self._pending is not None else {}
+        for name, value in fields.items():
+            if value is hikari.UNDEFINED:
+                continue
+
+            pending[name] = value
+            if other := _EXCLUSIVE_EDIT_FIELDS.get(name):
+                pending.pop(other, None)
+
+        self._pending = pending
+        if not self._task:
+            self._task = asyncio.get_running_loop().create_task(self._loop())
+
+    async def flush(self) -> hikari.Message | None:
+        """Wait for all the queued edits to be applied.
+
+        Returns
+        -------
+        hikari.messages.Message | None
+            The message returned by the last edit this made.
+
+        Raises
+        ------
+        Exception
+            Any error raised while applying an edit since the last flush.
+        """
+        while self._task:
+            await asyncio.shield(self._task)
+
+        if error := self._error:
+            self._error = None
+            raise error
+
+        return self._message
+
+    async def close(self) -> hikari.Message | None:
+        """Apply any queued edits and stop accepting new edits.
+
+        Returns
+        -------
+        hikari.messages.Message | None
+            The message returned by the last edit this made.
+
+        Raises
+        ------
+        Exception
+            Any error raised while applying an edit since the last flush.
+        """
+        self._closed = True
+        return await self.flush()
+
+    async def _loop(self) -> None:
+        while self._pending is not None:
+            delay = self._last_edit + self._interval - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            pending = self._pending
+            self._pending = None
+            try:
+                self._message = await self._edit(**pending)
+
+            except Exception as exc:
+                _LOGGER.warning("Failed to apply coalesced edit", exc_info=exc)
+                self._error = exc
+
+            self._last_edit = time.monotonic()
+
+        self._task = None
+
+
 class InteractionError(Exception):
     """Error which is sent as a response to a modal or component call."""
 
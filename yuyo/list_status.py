@@ -37,14 +37,26 @@ __all__: list[str] = [
     "EventStrategy",
     "SakeStrategy",
     "ServiceManager",
+    "ServiceStats",
+    "SessionConfig",
+    "SharedFileStrategy",
     "TopGGService",
+    "make_trace_config",
 ]
 
 import abc
 import asyncio
+import bisect
+import contextvars
 import datetime
+import functools
+import heapq
 import http
+import itertools
+import json
 import logging
+import pathlib
+import random
 import time
 import typing
 from collections import abc as collections
@@ -57,6 +69,8 @@ import hikari.snowflakes
 from . import backoff
 
 if typing.TYPE_CHECKING:
+    import os
+    import types
     from typing import Self
 
     import sake
@@ -65,7 +79,6 @@ if typing.TYPE_CHECKING:
 
     from . import _internal
 
-    _T = typing.TypeVar("_T")
     _EventT = typing.TypeVar("_EventT", bound=hikari.Event)
     _ServiceSigT = typing.TypeVar("_ServiceSigT", bound="ServiceSig")
     _LoadableStrategyT = typing.TypeVar("_LoadableStrategyT", bound="_LoadableStrategy")
@@ -85,6 +98,7 @@ _RETRY_ERROR_CODES = frozenset(
     )
 )
 _USER_AGENT = _DEFAULT_USER_AGENT + " (Bot:{})"
+_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, float("inf"))
 
 ServiceSig = collections.Callable[["AbstractManager"], collections.Coroutine[typing.Any, typing.Any, None]]
 """Signature of a callback used to update a service."""
@@ -179,9 +193,16 @@ class CacheStrategy(_LoadableStrategy):
         and the guild cache resource is enabled.
     """
 
-    __slots__ = ("_cache", "_shards")
+    __slots__ = ("_cache", "_counted_at", "_counts", "_max_age", "_shards")
 
-    def __init__(self, cache: hikari.api.Cache, shards: hikari.ShardAware, /) -> None:
+    def __init__(
+        self,
+        cache: hikari.api.Cache,
+        shards: hikari.ShardAware,
+        /,
+        *,
+        max_age: datetime.timedelta | float = datetime.timedelta(minutes=1),
+    ) -> None:
         """Initialise a cache strategy.
 
         Parameters
@@ -190,8 +211,17 @@ class CacheStrategy(_LoadableStrategy):
             The cache object this should use for getting the guild count.
         shards
             The shard aware client this should use for grouping counts per-shard.
+        max_age
+            How long (in seconds) the counts calculated from the cache should
+            be reused for before they're recalculated.
+
+            This avoids counting every cached guild again for each service which
+            is called around the same time.
         """
         self._cache = cache
+        self._counted_at = 0.0
+        self._counts: dict[int, int] | None = None
+        self._max_age = _to_seconds(max_age)
         self._shards = shards
 
     @property
@@ -205,7 +235,12 @@ class CacheStrategy(_LoadableStrategy):
         return None
 
     async def count(self) -> collections.Mapping[int, int]:
-        return _shard_guild_ids(self._shards, self._cache.get_guilds_view().keys())
+        now = time.monotonic()
+        if self._counts is None or now - self._counted_at > self._max_age:
+            self._counts = _shard_guild_ids(self._shards, self._cache.get_guilds_view().keys())
+            self._counted_at = now
+
+        return self._counts.copy()
 
     @classmethod
     def spawn(cls, manager: AbstractManager, /) -> CacheStrategy:
@@ -226,9 +261,11 @@ class SakeStrategy(AbstractCountStrategy):
     This relies on [Sake][sake] and tracks the global guild count.
     """
 
-    __slots__ = ("_cache", "_is_shard_bound")
+    __slots__ = ("_cache", "_count", "_counted_at", "_max_age", "_pending")
 
-    def __init__(self, cache: sake.abc.GuildCache, /) -> None:
+    def __init__(
+        self, cache: sake.abc.GuildCache, /, *, max_age: datetime.timedelta | float = datetime.timedelta(minutes=1)
+    ) -> None:
         r"""Initialise a Sake strategy.
 
         Unlike [CacheStrategy][yuyo.list_status.CacheStrategy] and
@@ -240,27 +277,229 @@ class SakeStrategy(AbstractCountStrategy):
         ----------
         cache
             The Sake guild cache to use to get the guild count.
+        max_age
+            How long (in seconds) the guild count fetched from the cache should
+            be reused for before it's fetched again.
+
+            Concurrent calls to [SakeStrategy.count][yuyo.list_status.SakeStrategy.count]
+            always share a single in-flight fetch, even if this is `0`.
         """
         self._cache = cache
+        self._count: int | None = None
+        self._counted_at = 0.0
+        self._max_age = _to_seconds(max_age)
+        self._pending: asyncio.Task[int] | None = None
 
     @property
     def is_shard_bound(self) -> bool:
         return False
 
     async def close(self) -> None:
-        return None
+        self._count = None
 
     async def open(self) -> None:
         return None
 
     async def count(self) -> int:
+        if self._count is not None and time.monotonic() - self._counted_at < self._max_age:
+            return self._count
+
+        if not self._pending:
+            self._pending = asyncio.create_task(self._fetch_count())
+
+        # This is shielded so one caller being cancelled doesn't cancel the
+        # fetch for every other caller.
+        return await asyncio.shield(self._pending)
+
+    async def _fetch_count(self) -> int:
         import sake
 
         try:
-            return await self._cache.iter_guilds().len()
+            count = await self._cache.iter_guilds().len()
         except sake.ClosedClient:
             _LOGGER.warning("Couldn't get guild count from closed Sake cache")
             raise CountUnknownError from None
+        finally:
+            self._pending = None
+
+        self._count = count
+        self._counted_at = time.monotonic()
+        return count
+
+
+class SharedFileStrategy(AbstractCountStrategy):
+    """Cross-process implementation of [AbstractCountStrategy][yuyo.list_status.AbstractCountStrategy].
+
+    This is for bots which are split between several processes which each own
+    a slice of the shards. Every process periodically publishes the per-shard
+    counts from its local strategy to a file in a shared directory, and the
+    aggregating process merges these into a global count.
+
+    Only the aggregating process returns a count; the others raise
+    [CountUnknownError][yuyo.list_status.CountUnknownError], which means
+    that only one process posts to each bot list service.
+    """
+
+    __slots__ = (
+        "_aggregate",
+        "_max_age",
+        "_path",
+        "_publish_interval",
+        "_published_file",
+        "_shards",
+        "_strategy",
+        "_task",
+    )
+
+    def __init__(
+        self,
+        strategy: AbstractCountStrategy,
+        shards: hikari.ShardAware,
+        directory: str | os.PathLike[str],
+        /,
+        *,
+        aggregate: bool | None = None,
+        max_age: datetime.timedelta | float = datetime.timedelta(minutes=5),
+        publish_interval: datetime.timedelta | float = datetime.timedelta(minutes=1),
+    ) -> None:
+        r"""Initialise a shared file strategy.
+
+        Like [SakeStrategy][yuyo.list_status.SakeStrategy], this strategy must
+        be directly initialised and passed to
+        [ServiceManager.\_\_init\_\_][yuyo.list_status.ServiceManager] as `strategy=`.
+
+        Parameters
+        ----------
+        strategy
+            The shard bound strategy to use to count this process's guilds.
+        shards
+            The shard aware client of this process.
+        directory
+            Path of the directory shared between the processes to publish counts in.
+        aggregate
+            Whether this process should aggregate and return the global count.
+
+            Defaults to whether this process owns shard 0.
+        max_age
+            How long (in seconds) after a process last published its counts
+            they should still be used for.
+        publish_interval
+            How often (in seconds) this process should publish its counts.
+
+        Raises
+        ------
+        ValueError
+            If `strategy` isn't shard bound.
+        """
+        if not strategy.is_shard_bound:
+            error_message = "The local strategy must be shard bound"
+            raise ValueError(error_message)
+
+        self._aggregate = aggregate
+        self._max_age = _to_seconds(max_age)
+        self._path = pathlib.Path(directory)
+        self._publish_interval = _to_seconds(publish_interval)
+        self._published_file: pathlib.Path | None = None
+        self._shards = shards
+        self._strategy = strategy
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_shard_bound(self) -> bool:
+        return False
+
+    async def _publish(self) -> None:
+        # Until this process's shards are known there's no file name which
+        # can't collide with another process's file.
+        if not (shard_ids := self._shards.shards.keys()):
+            return
+
+        counts = await self._strategy.count()
+        assert not isinstance(counts, int)
+        data = {
+            "counts": {str(shard_id): count for shard_id, count in counts.items()},
+            "shard_count": self._shards.shard_count,
+            "updated_at": time.time(),
+        }
+        path = self._path / f"shards-{min(shard_ids)}-{max(shard_ids)}.json"
+        await asyncio.to_thread(_write_shared_file, path, json.dumps(data), self._published_file)
+        self._published_file = path
+
+    async def _publish_loop(self) -> None:
+        while True:
+            try:
+                await self._publish()
+
+            except CountUnknownError:
+                pass
+
+            except Exception as exc:
+                _LOGGER.exception("Failed to publish guild counts", exc_info=exc)
+
+            await asyncio.sleep(self._publish_interval)
+
+    async def close(self) -> None:
+        if not self._task:
+            return
+
+        self._task.cancel()
+        self._task = None
+        if self._published_file:
+            await asyncio.to_thread(self._published_file.unlink, missing_ok=True)
+            self._published_file = None
+
+        await self._strategy.close()
+
+    async def open(self) -> None:
+        if self._task:
+            return
+
+        await self._strategy.open()
+        await asyncio.to_thread(self._path.mkdir, parents=True, exist_ok=True)
+        self._task = asyncio.create_task(self._publish_loop())
+
+    async def count(self) -> int:
+        aggregate = self._aggregate
+        if aggregate is None:
+            aggregate = 0 in self._shards.shards
+
+        if not aggregate:
+            raise CountUnknownError
+
+        await self._publish()
+        shard_count = self._shards.shard_count
+        counts = await asyncio.to_thread(_read_shared_files, self._path, shard_count, time.time() - self._max_age)
+        # Posting a partial count would be worse than skipping this post.
+        if any(shard_id not in counts for shard_id in range(shard_count)):
+            _LOGGER.warning("Missing guild counts for some shards, skipping post")
+            raise CountUnknownError
+
+        return sum(counts.values())
+
+
+def _write_shared_file(path: pathlib.Path, data: str, old_path: pathlib.Path | None, /) -> None:
+    temp_path = path.with_suffix(".tmp")
+    temp_path.write_text(data)
+    # Replacing the file means that readers will never see a partial write.
+    temp_path.replace(path)
+    # This process's old file is stale if its shards have changed.
+    if old_path and old_path != path:
+        old_path.unlink(missing_ok=True)
+
+
+def _read_shared_files(directory: pathlib.Path, shard_count: int, oldest: float, /) -> dict[int, int]:
+    counts: dict[int, int] = {}
+    for path in directory.glob("shards-*.json"):
+        try:
+            data = json.loads(path.read_text())
+
+        except (OSError, ValueError):
+            continue
+
+        if data["updated_at"] >= oldest and data["shard_count"] == shard_count:
+            counts.update((int(shard_id), count) for shard_id, count in data["counts"].items())
+
+    return counts
 
 
 @_as_strategy
@@ -291,7 +530,7 @@ class EventStrategy(_LoadableStrategy):
             The shard manager this should use to track shard guild counts.
         """
         self._event_manager = event_manager
-        self._guild_ids: set[hikari.Snowflake] = set()
+        self._guild_ids = _ShardGuildIds(shards)
         self._shards = shards
         self._started = False
 
@@ -310,10 +549,7 @@ class EventStrategy(_LoadableStrategy):
         self._guild_ids.add(event.guild_id)
 
     async def _on_guild_leave_event(self, event: hikari.GuildLeaveEvent) -> None:
-        try:
-            self._guild_ids.remove(event.guild_id)
-        except KeyError:
-            pass
+        self._guild_ids.discard(event.guild_id)
 
     async def _on_guild_update_event(self, event: hikari.GuildUpdateEvent, /) -> None:
         self._guild_ids.add(event.guild_id)
@@ -353,7 +589,7 @@ class EventStrategy(_LoadableStrategy):
         self._event_manager.subscribe(hikari.GuildUpdateEvent, self._on_guild_update_event)
 
     async def count(self) -> collections.Mapping[int, int]:
-        return _shard_guild_ids(self._shards, self._guild_ids)
+        return self._guild_ids.count()
 
     @classmethod
     def spawn(cls, manager: AbstractManager, /) -> EventStrategy:
@@ -365,6 +601,58 @@ class EventStrategy(_LoadableStrategy):
         return cls(events, shards)
 
 
+class _ShardGuildIds:
+    """Guild IDs grouped by the shard they belong to.
+
+    This lets the per-shard guild counts be calculated without going over
+    every guild ID.
+    """
+
+    __slots__ = ("_guild_ids", "_shard_count", "_shards")
+
+    def __init__(self, shards: hikari.ShardAware, /) -> None:
+        self._guild_ids: dict[int, set[int]] = {}
+        self._shard_count = shards.shard_count
+        self._shards = shards
+
+    def _rebucket(self) -> None:
+        guild_ids = [guild_id for shard_guild_ids in self._guild_ids.values() for guild_id in shard_guild_ids]
+        self._guild_ids.clear()
+        self._shard_count = self._shards.shard_count
+        for guild_id in guild_ids:
+            self.add(guild_id)
+
+    def add(self, guild_id: int, /) -> None:
+        if self._shard_count != self._shards.shard_count:
+            self._rebucket()
+
+        shard_id = hikari.snowflakes.calculate_shard_id(self._shard_count, guild_id)
+        try:
+            self._guild_ids[shard_id].add(guild_id)
+
+        except KeyError:
+            self._guild_ids[shard_id] = {guild_id}
+
+    def clear(self) -> None:
+        self._guild_ids.clear()
+
+    def count(self) -> dict[int, int]:
+        if self._shard_count != self._shards.shard_count:
+            self._rebucket()
+
+        counts = dict.fromkeys(self._shards.shards.keys(), 0)
+        counts.update((shard_id, len(guild_ids)) for shard_id, guild_ids in self._guild_ids.items() if guild_ids)
+        return counts
+
+    def discard(self, guild_id: int, /) -> None:
+        if self._shard_count != self._shards.shard_count:
+            self._rebucket()
+
+        shard_id = hikari.snowflakes.calculate_shard_id(self._shard_count, guild_id)
+        if shard_guild_ids := self._guild_ids.get(shard_id):
+            shard_guild_ids.discard(guild_id)
+
+
 def _shard_guild_ids(shards: hikari.ShardAware, guild_ids: collections.Iterable[hikari.Snowflake], /) -> dict[int, int]:
     counts = dict.fromkeys(shards.shards.keys(), 0)
 
@@ -441,16 +729,353 @@ class AbstractManager(typing.Protocol):
         """
 
 
+class ServiceStats:
+    """Metrics recorded for a service registered with a [ServiceManager][yuyo.list_status.ServiceManager].
+
+    Request metrics are recorded through the trace config returned by
+    [make_trace_config][yuyo.list_status.make_trace_config] and count
+    timings are only recorded automatically for the standard services and
+    the manager's own change checks; custom services can use the `record_`
+    methods to record their own.
+    """
+
+    __slots__ = (
+        "_consecutive_failures",
+        "_count_calls",
+        "_count_time",
+        "_failures",
+        "_last_success_at",
+        "_latency_buckets",
+        "_latency_sum",
+        "_status_counts",
+        "_successes",
+    )
+
+    def __init__(self) -> None:
+        """Initialise a service stats object."""
+        self._consecutive_failures = 0
+        self._count_calls = 0
+        self._count_time = 0.0
+        self._failures = 0
+        self._last_success_at: datetime.datetime | None = None
+        self._latency_buckets = [0] * len(_LATENCY_BUCKETS)
+        self._latency_sum = 0.0
+        self._status_counts: dict[int, int] = {}
+        self._successes = 0
+
+    @property
+    def consecutive_failures(self) -> int:
+        """How many times in a row calls to this service have failed."""
+        return self._consecutive_failures
+
+    @property
+    def count_calls(self) -> int:
+        """How many times the guild count has been fetched for this service."""
+        return self._count_calls
+
+    @property
+    def count_time(self) -> float:
+        """Total time (in seconds) spent fetching the guild count for this service."""
+        return self._count_time
+
+    @property
+    def failures(self) -> int:
+        """How many calls to this service have failed.
+
+        A call fails if it raises, times out or gets an error status code
+        other than 429 for any of its requests.
+        """
+        return self._failures
+
+    @property
+    def last_success_at(self) -> datetime.datetime | None:
+        """When this service was last successfully called."""
+        return self._last_success_at
+
+    @property
+    def post_latency_buckets(self) -> collections.Mapping[float, int]:
+        """Cumulative histogram of this service's POST request latencies.
+
+        This maps upper bounds (in seconds) to how many requests took at
+        most that long.
+        """
+        return dict(zip(_LATENCY_BUCKETS, itertools.accumulate(self._latency_buckets), strict=True))
+
+    @property
+    def post_latency_count(self) -> int:
+        """How many POST requests this service has made."""
+        return sum(self._latency_buckets)
+
+    @property
+    def post_latency_sum(self) -> float:
+        """Total time (in seconds) this service has spent on POST requests."""
+        return self._latency_sum
+
+    @property
+    def status_counts(self) -> collections.Mapping[int, int]:
+        """How many responses this service has received for each status code."""
+        return self._status_counts.copy()
+
+    @property
+    def successes(self) -> int:
+        """How many calls to this service have succeeded."""
+        return self._successes
+
+    def record_call(self, *, failed: bool) -> None:
+        """Record the outcome of a call to this service.
+
+        Parameters
+        ----------
+        failed
+            Whether the call failed.
+        """
+        if failed:
+            self._consecutive_failures += 1
+            self._failures += 1
+
+        else:
+            self._consecutive_failures = 0
+            self._last_success_at = datetime.datetime.now(tz=datetime.UTC)
+            self._successes += 1
+
+    def record_count(self, duration: float, /) -> None:
+        """Record a guild count fetch made for this service.
+
+        Parameters
+        ----------
+        duration
+            How long (in seconds) the fetch took.
+        """
+        self._count_calls += 1
+        self._count_time += duration
+
+    def record_response(self, status: int, duration: float, /, *, is_post: bool) -> None:
+        """Record a response received by this service.
+
+        Parameters
+        ----------
+        status
+            The response's status code.
+        duration
+            How long (in seconds) the request took.
+        is_post
+            Whether this was a POST request.
+        """
+        self._status_counts[status] = self._status_counts.get(status, 0) + 1
+        if is_post:
+            self._latency_buckets[bisect.bisect_left(_LATENCY_BUCKETS, duration)] += 1
+            self._latency_sum += duration
+
+
+class _ServiceCall:
+    __slots__ = ("count", "failed", "stats")
+
+    def __init__(self, stats: ServiceStats, /) -> None:
+        self.count: int | collections.Mapping[int, int] | None = None
+        self.failed = False
+        self.stats = stats
+
+
+_CURRENT_CALL: contextvars.ContextVar[_ServiceCall] = contextvars.ContextVar("_CURRENT_CALL")
+
+
+def _mark_failed() -> None:
+    if call := _CURRENT_CALL.get(None):
+        call.failed = True
+
+
+async def _on_request_start(
+    _: aiohttp.ClientSession, context: types.SimpleNamespace, __: aiohttp.TraceRequestStartParams, /
+) -> None:
+    context.started_at = time.perf_counter()
+
+
+async def _on_request_end(
+    _: aiohttp.ClientSession, context: types.SimpleNamespace, params: aiohttp.TraceRequestEndParams, /
+) -> None:
+    if not (call := _CURRENT_CALL.get(None)):
+        return
+
+    # Failed responses aren't marked as failing the call here as services may
+    # retry them, with the call's outcome being left to the service.
+    call.stats.record_response(
+        params.response.status, time.perf_counter() - context.started_at, is_post=params.method == "POST"
+    )
+
+
+def make_trace_config() -> aiohttp.TraceConfig:
+    """Create an aiohttp trace config which records service request metrics.
+
+    Sessions created by [ServiceManager][yuyo.list_status.ServiceManager]
+    already use this, so this only needs to be passed as `trace_configs=`
+    when creating a shared session for the manager.
+
+    Returns
+    -------
+    aiohttp.TraceConfig
+        The created trace config.
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
+
+
+async def _count(client: AbstractManager, /) -> int | collections.Mapping[int, int]:
+    call = _CURRENT_CALL.get(None)
+    # The manager already fetches the count when checking min_change.
+    if call and call.count is not None:
+        return call.count
+
+    started_at = time.perf_counter()
+    try:
+        return await client.counter.count()
+
+    finally:
+        if call:
+            call.stats.record_count(time.perf_counter() - started_at)
+
+
 class _ServiceDescriptor:
-    __slots__ = ("function", "repeat")
+    __slots__ = (
+        "function",
+        "jitter",
+        "last_called_at",
+        "last_count",
+        "max_staleness",
+        "min_change",
+        "repeat",
+        "stats",
+        "timeout",
+    )
 
-    def __init__(self, service: ServiceSig, repeat: float, /) -> None:
+    def __init__(
+        self,
+        service: ServiceSig,
+        repeat: float,
+        /,
+        *,
+        jitter: float = 0.0,
+        max_staleness: float | None = None,
+        min_change: int | None = None,
+        timeout: float,
+    ) -> None:
         self.function = service
+        self.jitter = jitter
+        self.last_called_at = 0.0
+        self.last_count: int | collections.Mapping[int, int] | None = None
+        self.max_staleness = max_staleness
+        self.min_change = min_change
         self.repeat = repeat
+        self.stats = ServiceStats()
+        self.timeout = timeout
 
     def __repr__(self) -> str:
         return f"_ServiceDescriptor <{self.function}, {self.repeat}>"
 
+    def next_interval(self) -> float:
+        if self.jitter:
+            return self.repeat + random.uniform(0, self.jitter)  # noqa: S311
+
+        return self.repeat
+
+    def should_skip(self, count: int | collections.Mapping[int, int], now: float, /) -> bool:
+        if self.min_change is None or self.last_count is None:
+            return False
+
+        if self.max_staleness is not None and now - self.last_called_at >= self.max_staleness:
+            return False
+
+        return _count_change(self.last_count, count) < self.min_change
+
+
+class _ServiceQueue:
+    """Heap of services ordered by the monotonic time they're next due to be called at."""
+
+    __slots__ = ("_counter", "_heap")
+
+    def __init__(self, services: collections.Iterable[_ServiceDescriptor], now: float, /) -> None:
+        self._counter = itertools.count()
+        self._heap = [(now + service.next_interval(), next(self._counter), service) for service in services]
+        heapq.heapify(self._heap)
+
+    @property
+    def next_deadline(self) -> float | None:
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: float, /) -> list[_ServiceDescriptor]:
+        due: list[_ServiceDescriptor] = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+
+        return due
+
+    def push(self, service: _ServiceDescriptor, started_at: float, /) -> None:
+        # This is scheduled relative to when the call started so that how long
+        # the call took doesn't skew the service's interval.
+        heapq.heappush(self._heap, (started_at + service.next_interval(), next(self._counter), service))
+
+
+class SessionConfig:
+    """Settings used to create the aiohttp session a service manager owns."""
+
+    __slots__ = ("_connection_limit", "_dns_ttl", "_keepalive_timeout", "_timeout")
+
+    def __init__(
+        self,
+        *,
+        connection_limit: int = 10,
+        dns_ttl: datetime.timedelta | int | None = datetime.timedelta(minutes=5),
+        keepalive_timeout: datetime.timedelta | float = datetime.timedelta(seconds=30),
+        timeout: datetime.timedelta | float | None = datetime.timedelta(seconds=30),
+    ) -> None:
+        """Initialise a session config.
+
+        Parameters
+        ----------
+        connection_limit
+            The maximum amount of connections the session can have open at once.
+
+            Setting this to `0` marks it as unlimited.
+        dns_ttl
+            How long (in seconds) resolved DNS entries should be cached for.
+
+            If this is [None][] then they'll be cached forever.
+        keepalive_timeout
+            How long (in seconds) idle connections should be kept open for
+            so they can be reused by later requests.
+        timeout
+            The total time (in seconds) a single request can take.
+
+            If this is [None][] then requests won't time out.
+        """
+        self._connection_limit = connection_limit
+        self._dns_ttl = None if dns_ttl is None else int(_to_seconds(dns_ttl))
+        self._keepalive_timeout = _to_seconds(keepalive_timeout)
+        self._timeout = None if timeout is None else _to_seconds(timeout)
+
+    def build_session(self, *, trace_configs: collections.Sequence[aiohttp.TraceConfig] = ()) -> aiohttp.ClientSession:
+        """Create an aiohttp session with these settings.
+
+        This must be called within a running event loop.
+
+        Parameters
+        ----------
+        trace_configs
+            Trace configs the session should use.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+            The created session.
+        """
+        connector = aiohttp.TCPConnector(
+            keepalive_timeout=self._keepalive_timeout, limit=self._connection_limit, ttl_dns_cache=self._dns_ttl
+        )
+        return aiohttp.ClientSession(
+            connector=connector, timeout=aiohttp.ClientTimeout(total=self._timeout), trace_configs=list(trace_configs)
+        )
+
 
 class ServiceManager(AbstractManager):
     """Standard service manager."""
@@ -461,10 +1086,13 @@ class ServiceManager(AbstractManager):
         "_event_manager",
         "_me",
         "_me_lock",
+        "_owns_session",
         "_rest",
         "_services",
         "_session",
+        "_session_config",
         "_shards",
+        "_skipped_calls",
         "_task",
         "_user_agent",
     )
@@ -478,6 +1106,8 @@ class ServiceManager(AbstractManager):
         event_manager: hikari.api.EventManager | None = None,
         shards: traits.ShardAware | None = None,
         event_managed: bool | None = None,
+        session: aiohttp.ClientSession | None = None,
+        session_config: SessionConfig | None = None,
         strategy: AbstractCountStrategy | None = None,
         user_agent: str | None = None,
     ) -> None:
@@ -503,6 +1133,16 @@ class ServiceManager(AbstractManager):
             on `event_manager`'s lifetime events.
 
             Defaults to [True][] when `event_manager` is passed.
+        session
+            A shared aiohttp session this manager's services should use.
+
+            This session won't be closed by the manager and, if it's closed
+            externally, [ServiceManager.get_session][yuyo.list_status.ServiceManager.get_session]
+            will raise. Request metrics will only be recorded for this if it
+            was created with [make_trace_config][yuyo.list_status.make_trace_config].
+        session_config
+            Settings used to create the aiohttp session this manager owns
+            when `session` isn't passed.
         strategy
             The counter strategy this manager should expose to services.
 
@@ -518,13 +1158,22 @@ class ServiceManager(AbstractManager):
             when `strategy` was left as [None][].
 
             If `event_managed` is passed as [True][] when `event_manager` is [None][].
+
+            If both `session` and `session_config` are passed.
         """
+        if session and session_config:
+            error_message = "session_config cannot be passed alongside session"
+            raise ValueError(error_message)
+
         self._cache = cache
         self._event_manager = event_manager
         self._rest = rest
         self._services: list[_ServiceDescriptor] = []
-        self._session: aiohttp.ClientSession | None = None
+        self._owns_session = session is None
+        self._session = session
+        self._session_config = session_config or SessionConfig()
         self._shards = shards
+        self._skipped_calls = 0
         self._task: asyncio.Task[None] | None = None
         self._me: hikari.OwnUser | None = None
         self._me_lock: asyncio.Lock | None = None
@@ -565,6 +1214,8 @@ class ServiceManager(AbstractManager):
         /,
         *,
         event_managed: bool = True,
+        session: aiohttp.ClientSession | None = None,
+        session_config: SessionConfig | None = None,
         strategy: AbstractCountStrategy | None = None,
         user_agent: str | None = None,
     ) -> Self:
@@ -577,6 +1228,16 @@ class ServiceManager(AbstractManager):
         event_managed
             Whether this client should be automatically opened and closed based
             on `bot`'s lifetime events.
+        session
+            A shared aiohttp session this manager's services should use.
+
+            This session won't be closed by the manager and, if it's closed
+            externally, [ServiceManager.get_session][yuyo.list_status.ServiceManager.get_session]
+            will raise. Request metrics will only be recorded for this if it
+            was created with [make_trace_config][yuyo.list_status.make_trace_config].
+        session_config
+            Settings used to create the aiohttp session this manager owns
+            when `session` isn't passed.
         strategy
             The counter strategy this manager should expose to services.
 
@@ -595,12 +1256,16 @@ class ServiceManager(AbstractManager):
         ValueError
             If the manager failed to find a suitable standard strategy to use
             when `strategy` was left as [None][].
+
+            If both `session` and `session_config` are passed.
         """
         return cls(
             bot.rest,
             cache=bot.cache if isinstance(bot, hikari.CacheAware) else None,
             event_manager=bot.event_manager,
             event_managed=event_managed,
+            session=session,
+            session_config=session_config,
             shards=bot,
             strategy=strategy,
             user_agent=user_agent,
@@ -613,6 +1278,8 @@ class ServiceManager(AbstractManager):
         /,
         *,
         tanjun_managed: bool = True,
+        session: aiohttp.ClientSession | None = None,
+        session_config: SessionConfig | None = None,
         strategy: AbstractCountStrategy | None = None,
         user_agent: str | None = None,
     ) -> Self:
@@ -630,6 +1297,16 @@ class ServiceManager(AbstractManager):
         tanjun_managed
             Whether this client should be automatically opened and closed based
             on the Tanjun client's lifetime client callback.
+        session
+            A shared aiohttp session this manager's services should use.
+
+            This session won't be closed by the manager and, if it's closed
+            externally, [ServiceManager.get_session][yuyo.list_status.ServiceManager.get_session]
+            will raise. Request metrics will only be recorded for this if it
+            was created with [make_trace_config][yuyo.list_status.make_trace_config].
+        session_config
+            Settings used to create the aiohttp session this manager owns
+            when `session` isn't passed.
         strategy
             The counter strategy this manager should expose to services.
 
@@ -648,6 +1325,8 @@ class ServiceManager(AbstractManager):
         ValueError
             If the manager failed to find a suitable standard strategy to use
             when `strategy` was left as [None][].
+
+            If both `session` and `session_config` are passed.
         """
         import tanjun
 
@@ -655,6 +1334,8 @@ class ServiceManager(AbstractManager):
             tanjun_client.rest,
             cache=tanjun_client.cache,
             event_manager=tanjun_client.events,
+            session=session,
+            session_config=session_config,
             shards=tanjun_client.shards,
             strategy=strategy,
             user_agent=user_agent,
@@ -698,6 +1379,19 @@ class ServiceManager(AbstractManager):
     def services(self) -> collections.Sequence[ServiceSig]:
         return [service.function for service in self._services]
 
+    @property
+    def service_stats(self) -> collections.Sequence[tuple[ServiceSig, ServiceStats]]:
+        """Pairs of the registered services and their recorded metrics."""
+        return [(service.function, service.stats) for service in self._services]
+
+    @property
+    def skipped_calls(self) -> int:
+        """How many service calls have been skipped since the guild count hadn't changed enough.
+
+        This only counts services which were added with `min_change`.
+        """
+        return self._skipped_calls
+
     @property
     def user_agent(self) -> str:
         return self._user_agent or _DEFAULT_USER_AGENT
@@ -709,16 +1403,48 @@ class ServiceManager(AbstractManager):
         await self.close()
 
     def add_service(
-        self, service: ServiceSig, /, *, repeat: datetime.timedelta | int | float = datetime.timedelta(hours=1)
+        self,
+        service: ServiceSig,
+        /,
+        *,
+        jitter: datetime.timedelta | int | float = 0,
+        max_staleness: datetime.timedelta | int | float | None = None,
+        min_change: int | None = None,
+        repeat: datetime.timedelta | int | float = datetime.timedelta(hours=1),
+        timeout: datetime.timedelta | int | float | None = None,
     ) -> Self:
         """Add a service to this manager.
 
+        Services are called concurrently, so a slow service won't delay
+        the other services.
+
         Parameters
         ----------
         service
             Asynchronous callback used to update this service.
+        jitter
+            Maximum random delay (in seconds) to add to each interval between
+            calls to this service.
+        max_staleness
+            The longest (in seconds) this service can go without being called
+            while `min_change` is set.
+
+            If this is left as [None][] then calls will be skipped for as long
+            as the guild count doesn't change by `min_change`.
+        min_change
+            The minimum change in the guild count since this service was last
+            successfully called needed for it to be called again.
+
+            For shard-specific counts this is the sum of the change in each
+            shard's count. If this is left as [None][] then this service will
+            be called every `repeat` regardless.
         repeat
             How often this service should be updated in seconds.
+        timeout
+            How long (in seconds) a call to this service can take before it's
+            cancelled.
+
+            Defaults to `repeat`.
 
         Returns
         -------
@@ -736,17 +1462,20 @@ class ServiceManager(AbstractManager):
             error_message = "Cannot add a service to an already running manager"
             raise RuntimeError(error_message)
 
-        if isinstance(repeat, datetime.timedelta):
-            float_repeat = repeat.total_seconds()
-
-        else:
-            float_repeat = float(repeat)
-
+        float_repeat = _to_seconds(repeat)
         if float_repeat < 1:
             error_message = "Repeat cannot be under 1 second"
             raise ValueError(error_message)
 
-        _queue_insert(self._services, lambda s: s.repeat > float_repeat, _ServiceDescriptor(service, float_repeat))
+        descriptor = _ServiceDescriptor(
+            service,
+            float_repeat,
+            jitter=_to_seconds(jitter),
+            max_staleness=None if max_staleness is None else _to_seconds(max_staleness),
+            min_change=min_change,
+            timeout=float_repeat if timeout is None else _to_seconds(timeout),
+        )
+        bisect.insort(self._services, descriptor, key=lambda s: s.repeat)
         return self
 
     def remove_service(self, service: ServiceSig, /) -> None:
@@ -777,15 +1506,121 @@ class ServiceManager(AbstractManager):
             error_message = "Couldn't find service"
             raise ValueError(error_message)
 
+    def get_service_stats(self, service: ServiceSig, /) -> ServiceStats:
+        """Get the recorded metrics for the first found entry of a registered service.
+
+        Parameters
+        ----------
+        service
+            The service callback to get the metrics for.
+
+        Returns
+        -------
+        ServiceStats
+            The service's recorded metrics.
+
+        Raises
+        ------
+        ValueError
+            If the service callback isn't found.
+        """
+        for descriptor in self._services:
+            if descriptor.function == service:
+                return descriptor.stats
+
+        error_message = "Couldn't find service"
+        raise ValueError(error_message)
+
+    def render_prometheus_metrics(self) -> str:
+        """Render this manager's service metrics in the Prometheus text format.
+
+        Services are labelled by their function or class name and the index
+        they were registered at, so that services with the same name are
+        rendered as separate series.
+
+        Returns
+        -------
+        str
+            The rendered metrics.
+        """
+        lines = [
+            "# HELP yuyo_list_status_skipped_calls_total Service calls skipped since the guild count hadn't changed.",
+            "# TYPE yuyo_list_status_skipped_calls_total counter",
+            f"yuyo_list_status_skipped_calls_total {self._skipped_calls}",
+        ]
+        metrics: list[tuple[str, str, str, list[tuple[str, float]]]] = [
+            ("calls_total", "counter", "Service calls by outcome.", []),
+            ("consecutive_failures", "gauge", "Service calls which have failed in a row.", []),
+            ("last_success_timestamp_seconds", "gauge", "When the service last succeeded.", []),
+            ("responses_total", "counter", "Responses received by status code.", []),
+            ("post_latency_seconds", "histogram", "Latency of the service's POST requests.", []),
+            ("count_seconds_total", "counter", "Time spent fetching the guild count.", []),
+            ("count_calls_total", "counter", "How many times the guild count has been fetched.", []),
+        ]
+        samples = {name: entries for name, _, _, entries in metrics}
+        for index, service in enumerate(self._services):
+            stats = service.stats
+            label = f'service="{_escape_label(_service_name(service.function))}",index="{index}"'
+            samples["calls_total"].append((f'{{{label},outcome="success"}}', stats.successes))
+            samples["calls_total"].append((f'{{{label},outcome="failure"}}', stats.failures))
+            samples["consecutive_failures"].append((f"{{{label}}}", stats.consecutive_failures))
+            if stats.last_success_at:
+                samples["last_success_timestamp_seconds"].append((f"{{{label}}}", stats.last_success_at.timestamp()))
+
+            for status, count in sorted(stats.status_counts.items()):
+                samples["responses_total"].append((f'{{{label},status="{status}"}}', count))
+
+            for bound, count in stats.post_latency_buckets.items():
+                samples["post_latency_seconds"].append((f'_bucket{{{label},le="{_format_bound(bound)}"}}', count))
+
+            samples["post_latency_seconds"].append((f"_sum{{{label}}}", stats.post_latency_sum))
+            samples["post_latency_seconds"].append((f"_count{{{label}}}", stats.post_latency_count))
+            samples["count_seconds_total"].append((f"{{{label}}}", stats.count_time))
+            samples["count_calls_total"].append((f"{{{label}}}", stats.count_calls))
+
+        for name, type_, help_, entries in metrics:
+            lines.append(f"# HELP yuyo_list_status_{name} {help_}")
+            lines.append(f"# TYPE yuyo_list_status_{name} {type_}")
+            lines.extend(f"yuyo_list_status_{name}{suffix} {value}" for suffix, value in entries)
+
+        return "\n".join(lines) + "\n"
+
     def with_service(
-        self, *, repeat: datetime.timedelta | int | float = datetime.timedelta(hours=1)
+        self,
+        *,
+        jitter: datetime.timedelta | int | float = 0,
+        max_staleness: datetime.timedelta | int | float | None = None,
+        min_change: int | None = None,
+        repeat: datetime.timedelta | int | float = datetime.timedelta(hours=1),
+        timeout: datetime.timedelta | int | float | None = None,
     ) -> collections.Callable[[_ServiceSigT], _ServiceSigT]:
         """Add a service to this manager by decorating a function.
 
         Parameters
         ----------
+        jitter
+            Maximum random delay (in seconds) to add to each interval between
+            calls to this service.
+        max_staleness
+            The longest (in seconds) this service can go without being called
+            while `min_change` is set.
+
+            If this is left as [None][] then calls will be skipped for as long
+            as the guild count doesn't change by `min_change`.
+        min_change
+            The minimum change in the guild count since this service was last
+            successfully called needed for it to be called again.
+
+            For shard-specific counts this is the sum of the change in each
+            shard's count. If this is left as [None][] then this service will
+            be called every `repeat` regardless.
         repeat
             How often this service should be updated in seconds.
+        timeout
+            How long (in seconds) a call to this service can take before it's
+            cancelled.
+
+            Defaults to `repeat`.
 
         Returns
         -------
@@ -801,7 +1636,14 @@ class ServiceManager(AbstractManager):
         """
 
         def decorator(service: _ServiceSigT, /) -> _ServiceSigT:
-            self.add_service(service, repeat=repeat)
+            self.add_service(
+                service,
+                jitter=jitter,
+                max_staleness=max_staleness,
+                min_change=min_change,
+                repeat=repeat,
+                timeout=timeout,
+            )
             return service
 
         return decorator
@@ -815,8 +1657,10 @@ class ServiceManager(AbstractManager):
         self._task = None
         await self._counter.close()
 
-        if self._session and not self._session.closed:
-            await self._session.close()
+        if self._owns_session and self._session:
+            if not self._session.closed:
+                await self._session.close()
+
             self._session = None
 
     async def open(self) -> None:
@@ -831,8 +1675,8 @@ class ServiceManager(AbstractManager):
             error_message = "Cannot run a client with no registered services."
             raise RuntimeError(error_message)
 
-        if not self._session or self._session.closed:
-            self._session = aiohttp.ClientSession()
+        if self._owns_session and (not self._session or self._session.closed):
+            self._session = self._session_config.build_session(trace_configs=[make_trace_config()])
 
         if not self._task:
             await self._counter.open()
@@ -858,56 +1702,120 @@ class ServiceManager(AbstractManager):
         return self._me
 
     def get_session(self) -> aiohttp.ClientSession:
-        if not self._session:
+        if not self._task or not self._session:
             error_message = "Client is currently inactive"
             raise RuntimeError(error_message)
 
         # Asserts that this is only called within a running event loop.
         asyncio.get_running_loop()
         if self._session.closed:
-            self._session = aiohttp.ClientSession()
+            if not self._owns_session:
+                error_message = "The shared session passed to this manager has been closed"
+                raise RuntimeError(error_message)
+
+            _LOGGER.warning("Service manager's session was closed while running, creating a new one")
+            self._session = self._session_config.build_session(trace_configs=[make_trace_config()])
 
         return self._session
 
+    async def _call_service(self, service: _ServiceDescriptor, /) -> None:
+        # Each service call is run in its own task so this doesn't need to be reset.
+        call = _ServiceCall(service.stats)
+        _CURRENT_CALL.set(call)
+        try:
+            called = await asyncio.wait_for(self._run_service(service, call), service.timeout)
+
+        except CountUnknownError:
+            pass
+
+        except TimeoutError:
+            _LOGGER.warning("Service call to %r timed out after %s seconds", service.function, service.timeout)
+            service.stats.record_call(failed=True)
+
+        except Exception as exc:
+            _LOGGER.exception(
+                "Service call to %r service raised an unexpected exception", service.function, exc_info=exc
+            )
+            service.stats.record_call(failed=True)
+
+        else:
+            if not called:
+                return
+
+            service.stats.record_call(failed=call.failed)
+            if call.count is not None and not call.failed:
+                service.last_count = call.count
+                service.last_called_at = time.monotonic()
+
+    async def _run_service(self, service: _ServiceDescriptor, call: _ServiceCall, /) -> bool:
+        if service.min_change is not None:
+            count = await _count(self)
+            if not isinstance(count, int):
+                count = dict(count)
+
+            if service.should_skip(count, time.monotonic()):
+                self._skipped_calls += 1
+                return False
+
+            call.count = count
+
+        await service.function(self)
+        return True
+
     async def _loop(self) -> None:
-        # This acts as a priority queue.
-        queue: list[tuple[float, _ServiceDescriptor]] = [(service.repeat, service) for service in self._services]
-        while True:
-            await asyncio.sleep(sleep := queue[0][0])
-            queue = [(time_ - sleep, service) for time_, service in queue]
+        queue = _ServiceQueue(self._services, time.monotonic())
+        wake = asyncio.Event()
+        tasks: set[asyncio.Task[None]] = set()
 
-            while queue[0][0] <= 0:
-                service = queue.pop(0)[1]
-                time_taken = time.perf_counter()
+        def on_done(service: _ServiceDescriptor, started_at: float, task: asyncio.Task[None], /) -> None:
+            tasks.discard(task)
+            queue.push(service, started_at)
+            wake.set()
 
+        try:
+            while True:
+                now = time.monotonic()
+                for service in queue.pop_due(now):
+                    task = asyncio.create_task(self._call_service(service))
+                    task.add_done_callback(functools.partial(on_done, service, now))
+                    tasks.add(task)
+
+                wake.clear()
+                deadline = queue.next_deadline
                 try:
-                    await service.function(self)
+                    await asyncio.wait_for(wake.wait(), None if deadline is None else deadline - time.monotonic())
 
-                except CountUnknownError:
+                except TimeoutError:
                     pass
 
-                except Exception as exc:
-                    _LOGGER.exception(
-                        "Service call to %r service raised an unexpected exception", service.function, exc_info=exc
-                    )
+        finally:
+            for task in tasks:
+                task.cancel()
 
-                time_taken = time.perf_counter() - time_taken
-                queue = [(time_ - time_taken, service) for time_, service in queue]
-                _queue_insert(queue, lambda s: s[0] > service.repeat, (service.repeat, service))  # noqa: B023
 
+def _to_seconds(value: datetime.timedelta | float, /) -> float:
+    return value.total_seconds() if isinstance(value, datetime.timedelta) else float(value)
 
-def _queue_insert(sequence: list[_T], check: collections.Callable[[_T], bool], value: _T, /) -> None:
-    # As we rely on order here for queueing calls we have a dedicated method for inserting based on time left.
-    index: int = -1
-    for _index, sub_value in enumerate(sequence):
-        index = _index
-        if check(sub_value):
-            break
 
-    else:
-        index += 1
+def _service_name(service: ServiceSig, /) -> str:
+    return getattr(service, "__qualname__", None) or type(service).__qualname__
+
+
+def _escape_label(value: str, /) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
 
-    sequence.insert(index, value)
+def _format_bound(bound: float, /) -> str:
+    return "+Inf" if bound == float("inf") else str(bound)
+
+
+def _count_change(old: int | collections.Mapping[int, int], new: int | collections.Mapping[int, int], /) -> int:
+    if isinstance(old, int) or isinstance(new, int):
+        old_total = old if isinstance(old, int) else sum(old.values())
+        new_total = new if isinstance(new, int) else sum(new.values())
+        return abs(new_total - old_total)
+
+    return sum(abs(new.get(shard_id, 0) - old.get(shard_id, 0)) for shard_id in old.keys() | new.keys())
 
 
 async def _log_response(service_name: str, response: aiohttp.ClientResponse, /, *, is_global: bool = True) -> None:
@@ -915,6 +1823,9 @@ async def _log_response(service_name: str, response: aiohttp.ClientResponse, /,
         _LOGGER.info("Posted bot's stats to %s for the %s", service_name, "whole bot" if is_global else "local shards")
         return
 
+    # This lets the manager know the post failed even when the session isn't
+    # tracing requests.
+    _mark_failed()
     try:
         content = await response.read()
 
@@ -948,24 +1859,53 @@ async def _log_response(service_name: str, response: aiohttp.ClientResponse, /,
 class TopGGService:
     """<https://top.gg> status update service."""
 
-    __slots__ = ("_token",)
+    __slots__ = ("_fetched_at", "_remote_shards", "_remote_ttl", "_token")
 
-    def __init__(self, token: str, /) -> None:
+    def __init__(
+        self, token: str, /, *, remote_ttl: datetime.timedelta | int | float | None = datetime.timedelta(hours=1)
+    ) -> None:
         """Initialise a top.gg service.
 
         Parameters
         ----------
         token
             Authorization token used to update the bot's status.
+        remote_ttl
+            How long (in seconds) the locally cached shard counts can be used
+            for before they're re-fetched from Top.GG.
+
+            These are only used to post shard-specific counts and let this
+            keep the counts of shards which are posted by other processes.
+            They're always re-fetched on the first post and after a post fails.
+            If this is [None][] then they won't otherwise be re-fetched.
         """
+        self._fetched_at = 0.0
+        self._remote_shards: dict[int, int] | None = None
+        self._remote_ttl = None if remote_ttl is None else _to_seconds(remote_ttl)
         self._token = token
 
+    async def _fetch_shards(
+        self, session: aiohttp.ClientSession, url: str, headers: dict[str, str], /
+    ) -> dict[int, int]:
+        now = time.monotonic()
+        if self._remote_shards is not None and (self._remote_ttl is None or now - self._fetched_at < self._remote_ttl):
+            return self._remote_shards.copy()
+
+        _LOGGER.debug("Fetching stats from Top.GG")
+        async with session.get(url, headers=headers) as response:
+            response.raise_for_status()
+            raw_shards: list[str] | None = (await response.json()).get("shards")
+
+        self._fetched_at = now
+        return {index: int(count) for index, count in enumerate(raw_shards or ())}
+
     async def __call__(self, client: AbstractManager, /) -> None:
-        counts = await client.counter.count()
+        counts = await _count(client)
         me = await client.get_me()
         headers = {"Authorization": self._token, "User-Agent": client.user_agent}
         session = client.get_session()
         url = f"https://top.gg/api/bots/{me.id}/stats"
+        shards: dict[int, int] | None = None
 
         if isinstance(counts, int):
             is_global = True
@@ -976,21 +1916,21 @@ class TopGGService:
                 error_message = "Shard count unknown"
                 raise RuntimeError(error_message)
 
-            _LOGGER.debug("Fetching stats from Top.GG")
-            async with session.get(url, headers=headers) as response:
-                response.raise_for_status()
-                raw_shards: list[str] | None = (await response.json()).get("shards")
-
             is_global = False
-            shards = {index: int(count) for index, count in enumerate(raw_shards or ())}
+            shards = await self._fetch_shards(session, url, headers)
             shards.update(counts)
             json = {"shards": [shards.get(shard_id, 0) for shard_id in range(client.shards.shard_count)]}
 
         if client.shards:
             json["shard_count"] = client.shards.shard_count
 
+        # The cached shards are only kept if this post succeeds, otherwise
+        # they'll be re-fetched next call.
+        self._remote_shards = None
         async with session.post(url, headers=headers, json=json) as response:
             await _log_response("Top.GG", response, is_global=is_global)
+            if shards is not None and response.status < http.HTTPStatus.MULTIPLE_CHOICES:
+                self._remote_shards = shards
 
 
 class BotsGGService:
@@ -1009,7 +1949,7 @@ class BotsGGService:
         self._token = token
 
     async def __call__(self, client: AbstractManager, /) -> None:
-        counts = await client.counter.count()
+        counts = await _count(client)
         me = await client.get_me()
         headers = {"Authorization": self._token, "User-Agent": client.user_agent}
         session = client.get_session()
@@ -1031,46 +1971,157 @@ class BotsGGService:
             await _log_response("Bots.GG", response, is_global=is_global)
 
 
+class _RetryAfterLimiter:
+    """Concurrency limiter which lets requests share a `Retry-After` block."""
+
+    __slots__ = ("_blocked_until", "_semaphore")
+
+    def __init__(self, max_concurrency: int, /) -> None:
+        self._blocked_until = 0.0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        try:
+            # This is re-checked after sleeping as other requests may have
+            # extended the block in the meantime.
+            while (delay := self._blocked_until - time.monotonic()) > 0:  # noqa: ASYNC110
+                await asyncio.sleep(delay)
+
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: types.TracebackType | None,
+    ) -> None:
+        self._semaphore.release()
+
+    def block(self, retry_after: float, /) -> None:
+        self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+
+
 class DiscordBotListService:
     """<https://discordbotlist.com> status update service."""
 
-    __slots__ = ("_token",)
+    __slots__ = ("_max_concurrency", "_max_retries", "_timeout", "_token")
 
-    def __init__(self, token: str, /) -> None:
+    def __init__(
+        self,
+        token: str,
+        /,
+        *,
+        max_concurrency: int = 5,
+        max_retries: int | None = None,
+        timeout: datetime.timedelta | int | float | None = None,
+    ) -> None:
         """Initialise a discordbotlist.com service.
 
         Parameters
         ----------
         token
             Authorization token used to update the bot's status.
+        max_concurrency
+            The maximum amount of shard-specific stats requests which can be
+            in-flight at once.
+        max_retries
+            The maximum amount of times a shard's stats request will be retried.
+
+            If this is left as [None][] then requests will be retried until
+            `timeout` or the manager's service timeout is reached.
+        timeout
+            The total time (in seconds) one update is allowed to take before
+            any remaining shards are given up on.
+
+            If this is left as [None][] then this is only limited by the
+            manager's service timeout.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrency` or `max_retries` is less than 1.
         """
+        if max_concurrency < 1:
+            error_message = "max_concurrency must be greater than or equal to 1"
+            raise ValueError(error_message)
+
+        if max_retries is not None and max_retries < 1:
+            error_message = "max_retries must be greater than or equal to 1"
+            raise ValueError(error_message)
+
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._timeout = None if timeout is None else _to_seconds(timeout)
         self._token = token
 
     async def __call__(self, client: AbstractManager, /) -> None:
-        counts = await client.counter.count()
+        counts = await _count(client)
         if isinstance(counts, int):
             await self._post(client, counts)
             return
 
-        back_off = backoff.Backoff()
-        for shard_id, count in counts.items():
-            async for retry in back_off:
+        limiter = _RetryAfterLimiter(self._max_concurrency)
+        posted: set[int] = set()
+        try:
+            async with asyncio.timeout(self._timeout), asyncio.TaskGroup() as task_group:
+                for shard_id, count in counts.items():
+                    task_group.create_task(self._post_shard(client, limiter, posted, shard_id, count))
+
+        except TimeoutError:
+            _LOGGER.warning(
+                "Timed out posting stats to DiscordBotList with %s shard(s) left unposted", len(counts) - len(posted)
+            )
+
+        if len(posted) < len(counts):
+            _mark_failed()
+
+    async def _post_shard(
+        self, client: AbstractManager, limiter: _RetryAfterLimiter, posted: set[int], shard_id: int, count: int, /
+    ) -> None:
+        back_off = backoff.Backoff(max_retries=self._max_retries)
+        async for retry in back_off:
+            async with limiter:
                 _LOGGER.debug("Posting stats to DiscordBotList for shard %s; attempt %s", shard_id, retry + 1)
-                retry_after = await self._post(client, count, shard_id=shard_id)
-                if retry_after is None:
-                    _LOGGER.info("Posted stats to DiscordBotList for shard %s", shard_id)
-                    break
+                try:
+                    retry_after = await self._post(client, count, shard_id=shard_id)
 
-                if retry_after != -1:
-                    back_off.set_next_backoff(retry_after)
-                    _LOGGER.info("Rate-limited on posting stats to DiscordBotList, retrying in %s seconds", retry_after)
+                except aiohttp.ClientResponseError as exc:
+                    _LOGGER.warning(
+                        "Failed to post stats to DiscordBotList for shard %s due to status %s", shard_id, exc.status
+                    )
+                    return
+
+                except aiohttp.ClientError as exc:
+                    _LOGGER.info(
+                        "Failed to post stats to DiscordBotList for shard %s, retrying soon: %r", shard_id, exc
+                    )
+                    continue
 
-                else:
-                    _LOGGER.info("Rate-limited on posting stats to DiscordBotList, retrying soon")
+            if retry_after is None:
+                _LOGGER.info("Posted stats to DiscordBotList for shard %s", shard_id)
+                posted.add(shard_id)
+                return
 
-            back_off.reset()
+            if retry_after != -1:
+                # The limiter holds back every shard's requests for this so
+                # the backoff shouldn't add its own delay on top of it.
+                limiter.block(retry_after)
+                back_off.set_next_backoff(0)
+                _LOGGER.info("Rate-limited on posting stats to DiscordBotList, retrying in %s seconds", retry_after)
+
+            else:
+                _LOGGER.info("Rate-limited on posting stats to DiscordBotList, retrying soon")
+
+        # This is only reached when max_retries is set.
+        assert self._max_retries is not None
+        _LOGGER.warning(
+            "Gave up on posting stats to DiscordBotList for shard %s after %s attempts", shard_id, self._max_retries + 1
+        )
 
-    async def _post(self, client: AbstractManager, count: int, /, *, shard_id: int | None = None) -> int | None:
+    async def _post(self, client: AbstractManager, count: int, /, *, shard_id: int | None = None) -> float | None:
         headers = {"Authorization": self._token, "User-Agent": client.user_agent}
         json = {"guilds": count}
         me = await client.get_me()
@@ -1088,7 +2139,7 @@ class DiscordBotListService:
 
             if response.status in _RETRY_ERROR_CODES:
                 if retry_after := response.headers.get(_RETRY_AFTER_KEY):
-                    return int(retry_after)
+                    return float(retry_after)
 
                 return -1
 
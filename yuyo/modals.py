@@ -35,10 +35,12 @@ __all__ = [
     "ModalClient",
     "ModalContext",
     "ModalOptions",
+    "MultiWaitForModal",
     "WaitForModal",
     "as_modal",
     "as_modal_template",
     "modal",
+    "regex_converter",
     "text_input",
     "with_static_text_input",
     "with_text_input",
@@ -53,7 +55,7 @@ import datetime
 import enum
 import functools
 import inspect
-import itertools
+import re
 import types
 import typing
 
@@ -74,6 +76,7 @@ if typing.TYPE_CHECKING:
 
     import tanjun
 
+    _ConvertedT = typing.TypeVar("_ConvertedT")
     _ModalT = typing.TypeVar("_ModalT", bound="Modal")
     _ReturnT = typing.TypeVar("_ReturnT")
     __SelfishSig = collections.abc.Callable[[typing.Concatenate[_T, _P]], _ReturnT]
@@ -115,6 +118,7 @@ class ModalContext(interactions.BaseContext[hikari.ModalInteraction]):
         component_ids: collections.abc.Mapping[str, str],
         register_task: collections.abc.Callable[[asyncio.Task[typing.Any]], None],
         *,
+        deletion_scheduler: interactions.DeletionScheduler | None = None,
         ephemeral_default: bool = False,
         response_future: asyncio.Future[_ModalResponseT] | None = None,
     ) -> None:
@@ -123,6 +127,7 @@ class ModalContext(interactions.BaseContext[hikari.ModalInteraction]):
             id_match=id_match,
             id_metadata=id_metadata,
             register_task=register_task,
+            deletion_scheduler=deletion_scheduler,
             ephemeral_default=ephemeral_default,
             response_future=response_future,
         )
@@ -186,6 +191,7 @@ class ModalClient:
     __slots__ = (
         "_alluka",
         "_cache",
+        "_deletion_scheduler",
         "_event_manager",
         "_gc_task",
         "_modals",
@@ -201,6 +207,7 @@ class ModalClient:
         *,
         alluka: alluka_.abc.Client | None = None,
         cache: hikari.api.Cache | None = None,
+        deletion_store: interactions.AbstractDeletionStore | None = None,
         event_manager: hikari.api.EventManager | None = None,
         event_managed: bool | None = None,
         rest: hikari.api.RESTClient | None = None,
@@ -225,6 +232,11 @@ class ModalClient:
             The Alluka client to use for callback dependency injection in this client.
 
             If not provided then this will initialise its own Alluka client.
+        deletion_store
+            Local store used to persist pending `delete_after` deletions so
+            they survive restarts.
+
+            This requires `rest` to be passed.
         event_manager
             The event manager this client should listen to dispatched modal
             interactions from if applicable.
@@ -240,7 +252,8 @@ class ModalClient:
         Raises
         ------
         ValueError
-            If `event_managed` is passed as [True][] when `event_manager` is [None][].
+            * If `event_managed` is passed as [True][] when `event_manager` is [None][].
+            * If `deletion_store` is passed without `rest`.
         """
         if alluka is None:
             alluka = alluka_local.get_client(default=None) or alluka_.Client()
@@ -248,13 +261,14 @@ class ModalClient:
 
         self._alluka = alluka
         self._cache = cache
+        self._deletion_scheduler = interactions.DeletionScheduler(rest=rest, store=deletion_store)
         self._event_manager = event_manager
         self._gc_task: asyncio.Task[None] | None = None
         self._modals: dict[str, tuple[timeouts.AbstractTimeout, AbstractModal]] = {}
         self._rest = rest
         self._server = server
         self._shards = shards
-        self._tasks: list[asyncio.Task[typing.Any]] = []
+        self._tasks: set[asyncio.Task[typing.Any]] = set()
         self._voice = voice
 
         if event_managed or (event_managed is None and event_manager):
@@ -283,6 +297,11 @@ class ModalClient:
         """Hikari cache instance this client was initialised with."""
         return self._cache
 
+    @property
+    def deletion_scheduler(self) -> interactions.DeletionScheduler:
+        """The scheduler used to handle `delete_after` for this client's responses."""
+        return self._deletion_scheduler
+
     @property
     def events(self) -> hikari.api.EventManager | None:
         """Object of the event manager this client was initialised with."""
@@ -425,11 +444,11 @@ class ModalClient:
         alluka.set_type_dependency(ModalClient, self)
 
     def _remove_task(self, task: asyncio.Task[typing.Any], /) -> None:
-        self._tasks.remove(task)
+        self._tasks.discard(task)
 
     def _add_task(self, task: asyncio.Task[typing.Any], /) -> None:
         if not task.done():
-            self._tasks.append(task)
+            self._tasks.add(task)
             task.add_done_callback(self._remove_task)
 
     async def _on_starting(self, _: hikari.StartingEvent | hikari.RESTBotAware, /) -> None:
@@ -457,6 +476,7 @@ class ModalClient:
 
         self._gc_task.cancel()
         self._gc_task = None
+        self._deletion_scheduler.close()
         if self._server:
             self._server.set_listener(hikari.ModalInteraction, None)
 
@@ -472,6 +492,7 @@ class ModalClient:
             return
 
         self._gc_task = asyncio.get_running_loop().create_task(self._gc())
+        self._deletion_scheduler.open()
 
         if self._server:
             self._server.set_listener(hikari.ModalInteraction, self.on_rest_request)
@@ -500,6 +521,7 @@ class ModalClient:
             id_match=id_match,
             id_metadata=id_metadata,
             register_task=self._add_task,
+            deletion_scheduler=self._deletion_scheduler,
             response_future=future,
         )
 
@@ -771,48 +793,307 @@ WaitFor = WaitForModal
 """Alias of [WaitForModal][yuyo.modals.WaitForModal]."""
 
 
+class MultiWaitForModal(AbstractModal):
+    """Executor used to multiplex waits for modal interactions.
+
+    Unlike [WaitForModal][yuyo.modals.WaitForModal], this is registered once
+    (under one or more custom IDs) and then serves any number of concurrent
+    waits, each keyed by the custom ID's match part and the ID of the user
+    who's expected to submit it. Pending waits are expired through a single
+    shared deadline structure.
+
+    Examples
+    --------
+    ```py
+    waiter = yuyo.modals.MultiWaitForModal(timeout=datetime.timedelta(seconds=30))
+    modal_client.register_modal("custom_id", waiter, timeout=None)
+
+    ...
+
+    await ctx.create_modal_response("Title", "custom_id", components=[...])
+
+    try:
+        result = await waiter.wait_for("custom_id", ctx.author)
+    except asyncio.TimeoutError:
+        await ctx.respond("Timed out")
+    else:
+        await result.respond("...")
+    ```
+    """
+
+    __slots__ = ("_ephemeral_default", "_timeout", "_waiters")
+
+    def __init__(
+        self, *, ephemeral_default: bool = False, timeout: datetime.timedelta | None = _DEFAULT_TIMEOUT
+    ) -> None:
+        """Initialise a multiplexed wait for executor.
+
+        Parameters
+        ----------
+        ephemeral_default
+            Whether or not the responses made on contexts spawned from this executor
+            should default to ephemeral (meaning only the author can see them) unless
+            `flags` is specified on the response method.
+        timeout
+            How long each wait should last for before it times-out.
+
+            If this is [None][] then waits will never time-out.
+        """
+        self._ephemeral_default = ephemeral_default
+        self._timeout = timeout.total_seconds() if timeout is not None else None
+        self._waiters: _internal.WaiterRegistry[tuple[str, hikari.Snowflake], Context] = _internal.WaiterRegistry()
+
+    def is_waiting(self, custom_id: str, user: hikari.SnowflakeishOr[hikari.User], /) -> bool:
+        """Whether a wait is pending for a custom ID and user.
+
+        Parameters
+        ----------
+        custom_id
+            The custom ID to check. Only the match part of this is used.
+        user
+            The user to check.
+        """
+        return (_internal.split_custom_id(custom_id).id_match, hikari.Snowflake(user)) in self._waiters
+
+    async def execute(self, ctx: Context, /) -> None:
+        if not self._waiters.resolve((ctx.id_match, ctx.interaction.user.id), ctx):
+            error_message = "This modal has timed out"
+            raise interactions.InteractionError(error_message)
+
+        ctx.set_ephemeral_default(self._ephemeral_default)
+
+    async def wait_for(self, custom_id: str, user: hikari.SnowflakeishOr[hikari.User], /) -> Context:
+        """Wait for a user to submit a modal.
+
+        Parameters
+        ----------
+        custom_id
+            The custom ID of the modal to wait for.
+
+            Only the match part of this (the part before any ":") is used.
+        user
+            The user to wait for.
+
+        Returns
+        -------
+        Context
+            The matching interaction.
+
+        Raises
+        ------
+        RuntimeError
+            If this custom ID and user pair is already being waited for.
+        asyncio.TimeoutError
+            If the timeout is reached.
+        """
+        key = (_internal.split_custom_id(custom_id).id_match, hikari.Snowflake(user))
+        future = self._waiters.add(key, self._timeout)
+        try:
+            return await future
+
+        finally:
+            self._waiters.discard(key, future)
+
+
 class _TrackedField:
-    __slots__ = ("default", "id_match", "parameter", "type")
+    __slots__ = ("converter", "default", "id_match", "label", "parameter", "type")
 
-    def __init__(self, id_match: str, default: typing.Any, parameter: str, type_: hikari.ComponentType, /) -> None:
+    def __init__(
+        self,
+        id_match: str,
+        default: typing.Any,
+        parameter: str,
+        type_: hikari.ComponentType,
+        /,
+        *,
+        converter: collections.abc.Callable[[str], typing.Any] | None = None,
+        label: str | None = None,
+    ) -> None:
+        self.converter = converter
         self.default = default
         self.id_match = id_match
+        self.label = label or id_match
         self.parameter = parameter
         self.type = type_
 
-    def process(self, components: dict[str, hikari.ModalComponentTypesT], /) -> typing.Any:
-        component = components.get(self.id_match)
 
-        # Discord still provides text components when no input was given just with
-        # an empty string for `value` but we also want to support possible future
-        # cases where they just just don't provide the component.
-        if not component or not component.value:
-            if self.default is NO_DEFAULT:
-                error_message = f"Missing required component `{self.id_match}`"
+class _TrackedDataclass:
+    __slots__ = ("dataclass", "fields", "parameter")
+
+    def __init__(self, keyword: str, dataclass: type[ModalOptions], fields: list[_TrackedField], /) -> None:
+        self.dataclass = dataclass
+        self.fields = fields
+        self.parameter = keyword
+
+
+class _ExtractionPlan:
+    """Field extraction plan which is compiled once for a modal's tracked fields.
+
+    Every tracked field (including those within modal options dataclasses) is
+    assigned a fixed slot and each field custom ID is mapped to the slots it
+    fills, along with the component type and converter they expect.
+    """
+
+    __slots__ = ("_dataclasses", "_defaults", "_parameters", "_required", "_slots")
+
+    def __init__(self, tracked_fields: collections.abc.Iterable[_TrackedField | _TrackedDataclass], /) -> None:
+        dataclasses: list[tuple[str, type[ModalOptions], tuple[tuple[str, int], ...]]] = []
+        defaults: list[typing.Any] = []
+        parameters: list[tuple[str, int]] = []
+        required: list[tuple[int, str]] = []
+        slots: dict[str, list[tuple[int, _TrackedField]]] = {}
+
+        def add_slot(field: _TrackedField, /) -> int:
+            index = len(defaults)
+            defaults.append(field.default)
+            slots.setdefault(field.id_match, []).append((index, field))
+            if field.default is NO_DEFAULT:
+                required.append((index, field.id_match))
+
+            return index
+
+        for field in tracked_fields:
+            if isinstance(field, _TrackedDataclass):
+                sub_fields = tuple((sub_field.parameter, add_slot(sub_field)) for sub_field in field.fields)
+                dataclasses.append((field.parameter, field.dataclass, sub_fields))
+
+            else:
+                parameters.append((field.parameter, add_slot(field)))
+
+        self._dataclasses = tuple(dataclasses)
+        self._defaults = tuple(defaults)
+        self._parameters = tuple(parameters)
+        self._required = tuple(required)
+        self._slots = {
+            id_match: tuple((index, field.type, field.converter, field.label) for index, field in entries)
+            for id_match, entries in slots.items()
+        }
+
+    def execute(self, ctx: Context, /) -> dict[str, typing.Any]:
+        component_ids = ctx.component_ids
+        assert isinstance(component_ids, dict)
+        values = list(self._defaults)
+
+        for row in ctx.interaction.components:
+            for component in row.components:
+                id_match, _, id_metadata = component.custom_id.partition(":")
+                component_ids[id_match] = id_metadata
+
+                # Discord still provides text components when no input was given just with
+                # an empty string for `value` but we also want to support possible future
+                # cases where they just just don't provide the component.
+                if not component.value or not (entries := self._slots.get(id_match)):
+                    continue
+
+                for index, type_, converter, label in entries:
+                    if component.type is not type_:
+                        error_message = (
+                            f"Mismatched component type, expected {type_} for `{id_match}` but got {component.type}"
+                        )
+                        raise RuntimeError(error_message)
+
+                    if converter is None:
+                        values[index] = component.value
+                        continue
+
+                    try:
+                        values[index] = converter(component.value)
+
+                    except ValueError:
+                        error_message = f"Invalid value provided for `{label}`"
+                        raise InteractionError(error_message) from None
+
+        for index, id_match in self._required:
+            if values[index] is NO_DEFAULT:
+                error_message = f"Missing required component `{id_match}`"
                 raise RuntimeError(error_message)
 
-            return self.default
+        fields = {parameter: values[index] for parameter, index in self._parameters}
+        for parameter, dataclass, sub_fields in self._dataclasses:
+            fields[parameter] = dataclass(**{sub_parameter: values[index] for sub_parameter, index in sub_fields})
 
-        if component.type is not self.type:
-            error_message = (
-                f"Mismatched component type, expected {self.type} for `{self.id_match}` but got {component.type}"
-            )
-            raise RuntimeError(error_message)
+        return fields
 
-        return component.value
 
+class _TemplateRow(hikari.api.ModalActionRowBuilder):
+    """Modal row which is built from its modal class's pre-serialised payload.
 
-class _TrackedDataclass:
-    __slots__ = ("_dataclass", "_fields", "parameter")
+    A full row builder is only created if the row's components are accessed
+    or modified.
+    """
 
-    def __init__(self, keyword: str, dataclass: type[ModalOptions], fields: list[_TrackedField], /) -> None:
-        self._dataclass = dataclass
-        self._fields = fields
-        self.parameter = keyword
+    __slots__ = ("_component", "_custom_id", "_payload", "_row")
 
-    def process(self, components: dict[str, hikari.ModalComponentTypesT], /) -> typing.Any:
-        sub_fields = {field.parameter: field.process(components) for field in self._fields}
-        return self._dataclass(**sub_fields)
+    def __init__(
+        self,
+        component: hikari.api.TextInputBuilder,
+        payload: collections.abc.Mapping[str, typing.Any],
+        custom_id: str | None,
+        /,
+    ) -> None:
+        self._component = component
+        self._custom_id = custom_id
+        self._payload = payload
+        self._row: hikari.impl.ModalActionRowBuilder | None = None
+
+    def _get_row(self) -> hikari.impl.ModalActionRowBuilder:
+        if self._row is None:
+            # The static component is copied to avoid changes leaking to
+            # other instances (and out of sync with the cached payload).
+            component = copy.copy(self._component)
+            if self._custom_id is not None:
+                component.set_custom_id(self._custom_id)
+
+            self._row = hikari.impl.ModalActionRowBuilder(components=[component])
+
+        return self._row
+
+    @property
+    def type(self) -> typing.Literal[hikari.ComponentType.ACTION_ROW]:
+        return hikari.ComponentType.ACTION_ROW
+
+    @property
+    def components(self) -> collections.abc.Sequence[hikari.api.ComponentBuilder]:
+        return self._get_row().components
+
+    def add_component(self, component: hikari.api.ComponentBuilder, /) -> Self:
+        self._get_row().add_component(component)
+        return self
+
+    def add_text_input(
+        self,
+        custom_id: str,
+        label: str,
+        /,
+        *,
+        style: hikari.TextInputStyle = hikari.TextInputStyle.SHORT,
+        placeholder: hikari.UndefinedOr[str] = hikari.UNDEFINED,
+        value: hikari.UndefinedOr[str] = hikari.UNDEFINED,
+        required: bool = True,
+        min_length: int = 0,
+        max_length: int = 4000,
+    ) -> Self:
+        self._get_row().add_text_input(
+            custom_id,
+            label,
+            style=style,
+            placeholder=placeholder,
+            value=value,
+            required=required,
+            min_length=min_length,
+            max_length=max_length,
+        )
+        return self
+
+    def build(self) -> collections.abc.MutableMapping[str, typing.Any]:
+        if self._row is not None:
+            return self._row.build()
+
+        payload = dict(self._payload)
+        if self._custom_id is not None:
+            payload["custom_id"] = self._custom_id
+
+        return {"type": hikari.ComponentType.ACTION_ROW, "components": [payload]}
 
 
 class Modal(AbstractModal):
@@ -947,11 +1228,17 @@ class Modal(AbstractModal):
     `Modal.callback` method.
     """
 
-    __slots__ = ("_ephemeral_default", "_rows", "_tracked_fields")
+    __slots__ = ("_ephemeral_default", "_plan", "_rows", "_tracked_fields")
 
     _actual_callback: collections.abc.Callable[..., _CoroT[None]] | None = None
+    _callback_is_method: typing.ClassVar[bool] = False
+    _callback_needs_injection: bool = True
+    _static_plan: typing.ClassVar[_ExtractionPlan | None] = None
     _static_tracked_fields: typing.ClassVar[list[_TrackedField | _TrackedDataclass]] = []
     _static_builders: typing.ClassVar[list[tuple[str, hikari.api.TextInputBuilder]]] = []
+    _static_payloads: typing.ClassVar[
+        list[tuple[str, hikari.api.TextInputBuilder, collections.abc.Mapping[str, typing.Any]]] | None
+    ] = None
 
     def __init__(
         self, *, ephemeral_default: bool = False, id_metadata: collections.abc.Mapping[str, str] | None = None
@@ -968,32 +1255,40 @@ class Modal(AbstractModal):
             The keys should be the match part of field custom IDs.
         """
         self._ephemeral_default = ephemeral_default
+        self._plan: _ExtractionPlan | None = None
         self._tracked_fields: list[_TrackedField | _TrackedDataclass] = self._static_tracked_fields.copy()
 
         # TODO: don't duplicate fields when redeclared
         if id_metadata is None:
-            self._rows = [
-                hikari.impl.ModalActionRowBuilder(components=[component]) for _, component in self._static_builders
+            self._rows: list[hikari.api.ModalActionRowBuilder] = [
+                _TemplateRow(component, payload, None) for _, component, payload in self._get_static_payloads()
             ]
 
         else:
             self._rows = [
-                hikari.impl.ModalActionRowBuilder(
-                    components=[
-                        (
-                            copy.copy(component).set_custom_id(f"{id_match}:{metadata}")
-                            if (metadata := id_metadata.get(id_match))
-                            else component
-                        )
-                    ]
+                _TemplateRow(
+                    component, payload, f"{id_match}:{metadata}" if (metadata := id_metadata.get(id_match)) else None
                 )
-                for id_match, component in self._static_builders
+                for id_match, component, payload in self._get_static_payloads()
             ]
 
+    @classmethod
+    def _get_static_payloads(
+        cls,
+    ) -> list[tuple[str, hikari.api.TextInputBuilder, collections.abc.Mapping[str, typing.Any]]]:
+        if cls._static_payloads is None:
+            cls._static_payloads = [
+                (id_match, component, component.build()) for id_match, component in cls._static_builders
+            ]
+
+        return cls._static_payloads
+
     def __init_subclass__(cls, *args: typing.Any, parse_signature: bool = True, **kwargs: typing.Any) -> None:
         super().__init_subclass__(*args, **kwargs)
+        cls._static_plan = None
         cls._static_tracked_fields = []
         cls._static_builders = []
+        cls._static_payloads = None
 
         if not parse_signature:
             return
@@ -1005,6 +1300,8 @@ class Modal(AbstractModal):
             pass
 
         else:
+            cls._callback_is_method = True
+            cls._callback_needs_injection = _internal.needs_injection(cls._actual_callback)
             for name, descriptor in _parse_descriptors(cls.callback):
                 descriptor.add_static(name, cls, pass_as_kwarg=True)
 
@@ -1028,6 +1325,7 @@ class Modal(AbstractModal):
                 fields.append(descriptor.to_tracked_field(name))
 
             cls._static_tracked_fields.append(_TrackedDataclass(parameter, options, fields))
+            cls._static_plan = None
 
         else:
             for (
@@ -1050,6 +1348,7 @@ class Modal(AbstractModal):
                 fields.append(descriptor.to_tracked_field(name))
 
             self._tracked_fields.append(_TrackedDataclass(parameter, options, fields))
+            self._plan = None
 
         else:
             for (
@@ -1074,6 +1373,7 @@ class Modal(AbstractModal):
         min_length: int = 0,
         max_length: int = 4000,
         parameter: str | None = None,
+        converter: collections.abc.Callable[[str], typing.Any] | None = None,
     ) -> type[Self]:
         """Add a text input field to all instances and subclasses of this modal class.
 
@@ -1117,6 +1417,15 @@ class Modal(AbstractModal):
 
             This will be of type [str][] and may also be the value passed for
             `default`.
+        converter
+            Callback used to convert the field's text before it's passed to
+            `parameter` (e.g. [int][], [float][],
+            [hikari.Snowflake][hikari.snowflakes.Snowflake] or
+            [regex_converter][yuyo.modals.regex_converter]).
+
+            If this raises [ValueError][] then an error response is sent
+            rather than calling the modal's callback. This isn't applied to
+            `default`.
 
         Returns
         -------
@@ -1143,11 +1452,14 @@ class Modal(AbstractModal):
             min_length=min_length,
             max_length=max_length,
             parameter=parameter,
+            converter=converter,
         )
         cls._static_builders.append((id_match, component))
+        cls._static_payloads = None
 
         if field:
             cls._static_tracked_fields.append(field)
+            cls._static_plan = None
 
         return cls
 
@@ -1164,6 +1476,7 @@ class Modal(AbstractModal):
         min_length: int = 0,
         max_length: int = 4000,
         parameter: str | None = None,
+        converter: collections.abc.Callable[[str], typing.Any] | None = None,
     ) -> Self:
         """Add a text input field to this modal instance.
 
@@ -1207,6 +1520,15 @@ class Modal(AbstractModal):
 
             This will be of type [str][] and may also be the value passed for
             `default`.
+        converter
+            Callback used to convert the field's text before it's passed to
+            `parameter` (e.g. [int][], [float][],
+            [hikari.Snowflake][hikari.snowflakes.Snowflake] or
+            [regex_converter][yuyo.modals.regex_converter]).
+
+            If this raises [ValueError][] then an error response is sent
+            rather than calling the modal's callback. This isn't applied to
+            `default`.
 
         Returns
         -------
@@ -1223,14 +1545,33 @@ class Modal(AbstractModal):
             min_length=min_length,
             max_length=max_length,
             parameter=parameter,
+            converter=converter,
         )
         self._rows.append(hikari.impl.ModalActionRowBuilder(components=[component]))
 
         if field:
             self._tracked_fields.append(field)
+            self._plan = None
 
         return self
 
+    def _get_plan(self) -> _ExtractionPlan:
+        if self._plan:
+            return self._plan
+
+        cls = type(self)
+        if self._tracked_fields != cls._static_tracked_fields:
+            self._plan = _ExtractionPlan(self._tracked_fields)
+
+        # Instances which only have the class's static fields share its plan.
+        elif not (plan := cls._static_plan):
+            self._plan = cls._static_plan = _ExtractionPlan(self._tracked_fields)
+
+        else:
+            self._plan = plan
+
+        return self._plan
+
     async def execute(self, ctx: Context, /) -> None:
         # <<inherited docstring from AbstractModal>>.
         if self._actual_callback is None:
@@ -1238,19 +1579,19 @@ class Modal(AbstractModal):
             raise RuntimeError(error_message)
 
         ctx.set_ephemeral_default(self._ephemeral_default)
-        components: dict[str, hikari.ModalComponentTypesT] = {}
-        assert isinstance(ctx.component_ids, dict)
+        fields = self._get_plan().execute(ctx)
+        if not self._callback_needs_injection:
+            await self._actual_callback(ctx, **fields)
 
-        component: hikari.ModalComponentTypesT | None
-        for component in itertools.chain.from_iterable(
-            component_.components for component_ in ctx.interaction.components
-        ):
-            id_match, id_metadata = _internal.split_custom_id(component.custom_id)
-            components[id_match] = component
-            ctx.component_ids[id_match] = id_metadata
+        elif self._callback_is_method:
+            # Alluka caches injection plans per callback, so the class's function is
+            # passed here rather than a new bound method for every execution.
+            callback = type(self)._actual_callback  # noqa: SLF001
+            assert callback is not None
+            await ctx.client.alluka.call_with_async_di(callback, self, ctx, **fields)
 
-        fields = {field.parameter: field.process(components) for field in self._tracked_fields}
-        await ctx.client.alluka.call_with_async_di(self._actual_callback, ctx, **fields)
+        else:
+            await ctx.client.alluka.call_with_async_di(self._actual_callback, ctx, **fields)
 
 
 def _workout_value(default: typing.Any, value: hikari.UndefinedOr[str]) -> hikari.UndefinedOr[str]:
@@ -1274,6 +1615,7 @@ def _make_text_input(
     min_length: int,
     max_length: int,
     parameter: str | None,
+    converter: collections.abc.Callable[[str], typing.Any] | None,
 ) -> tuple[str, hikari.impl.TextInputBuilder, _TrackedField | None]:
     if custom_id is not None:
         id_match = _internal.split_custom_id(custom_id)[0]
@@ -1296,7 +1638,9 @@ def _make_text_input(
     )
 
     if parameter:
-        field = _TrackedField(id_match, default, parameter, hikari.ComponentType.TEXT_INPUT)
+        field = _TrackedField(
+            id_match, default, parameter, hikari.ComponentType.TEXT_INPUT, converter=converter, label=label
+        )
 
     else:
         field = None
@@ -1305,13 +1649,14 @@ def _make_text_input(
 
 
 class _DynamicModal(Modal, typing.Generic[_P], parse_signature=False):
-    __slots__ = ("_actual_callback",)
+    __slots__ = ("_actual_callback", "_callback_needs_injection")
 
     def __init__(
         self, callback: collections.abc.Callable[_P, _CoroT[None]], /, *, ephemeral_default: bool = False
     ) -> None:
         super().__init__(ephemeral_default=ephemeral_default)
         self._actual_callback = callback
+        self._callback_needs_injection = _internal.needs_injection(callback)
 
     def callback(self, *args: _P.args, **kwargs: _P.kwargs) -> _CoroT[None]:
         assert self._actual_callback is not None
@@ -1488,6 +1833,7 @@ def with_static_text_input(
     min_length: int = 0,
     max_length: int = 4000,
     parameter: str | None = None,
+    converter: collections.abc.Callable[[str], typing.Any] | None = None,
 ) -> collections.abc.Callable[[type[_ModalT]], type[_ModalT]]:
     """Add a static text input field to the decorated modal subclass.
 
@@ -1528,6 +1874,14 @@ def with_static_text_input(
 
         This will be of type [str][] and may also be the value passed for
         `default`.
+    converter
+        Callback used to convert the field's text before it's passed to
+        `parameter` (e.g. [int][], [float][],
+        [hikari.Snowflake][hikari.snowflakes.Snowflake] or
+        [regex_converter][yuyo.modals.regex_converter]).
+
+        If this raises [ValueError][] then an error response is sent rather
+        than calling the modal's callback. This isn't applied to `default`.
 
     Returns
     -------
@@ -1544,6 +1898,7 @@ def with_static_text_input(
         min_length=min_length,
         max_length=max_length,
         parameter=parameter,
+        converter=converter,
     )
 
 
@@ -1559,6 +1914,7 @@ def with_text_input(
     min_length: int = 0,
     max_length: int = 4000,
     parameter: str | None = None,
+    converter: collections.abc.Callable[[str], typing.Any] | None = None,
 ) -> collections.abc.Callable[[_ModalT], _ModalT]:
     """Add a text input field to the decorated modal instance.
 
@@ -1599,6 +1955,14 @@ def with_text_input(
 
         This will be of type [str][] and may also be the value passed for
         `default`.
+    converter
+        Callback used to convert the field's text before it's passed to
+        `parameter` (e.g. [int][], [float][],
+        [hikari.Snowflake][hikari.snowflakes.Snowflake] or
+        [regex_converter][yuyo.modals.regex_converter]).
+
+        If this raises [ValueError][] then an error response is sent rather
+        than calling the modal's callback. This isn't applied to `default`.
 
     Returns
     -------
@@ -1615,9 +1979,51 @@ def with_text_input(
         min_length=min_length,
         max_length=max_length,
         parameter=parameter,
+        converter=converter,
     )
 
 
+def regex_converter(pattern: str | re.Pattern[str], /) -> collections.abc.Callable[[str], str]:
+    """Create a text input converter which validates the input against a regex pattern.
+
+    Parameters
+    ----------
+    pattern
+        The pattern the whole input text must match.
+
+    Returns
+    -------
+    collections.abc.Callable[[str], str]
+        The created converter.
+
+        This returns the input text unchanged if it matches and raises
+        [ValueError][] otherwise.
+
+    Examples
+    --------
+    ```py
+    @modals.as_modal_template
+    async def modal_template(
+        ctx: modals.Context,
+        colour: str = modals.text_input(
+            "Colour", converter=modals.regex_converter(r"#[0-9a-fA-F]{6}")
+        ),
+    ) -> None:
+        ...
+    ```
+    """
+    compiled = re.compile(pattern)
+
+    def convert(value: str, /) -> str:
+        if compiled.fullmatch(value) is None:
+            error_message = f"{value!r} doesn't match the pattern `{compiled.pattern}`"
+            raise ValueError(error_message)
+
+        return value
+
+    return convert
+
+
 def _parse_descriptors(
     callback: collections.abc.Callable[..., typing.Any], /
 ) -> collections.abc.Iterable[tuple[str, _ComponentDescriptor]]:
@@ -1662,7 +2068,17 @@ class _ModalOptionsDescriptor(_ComponentDescriptor):
 
 
 class _TextInputDescriptor(_ComponentDescriptor):
-    __slots__ = ("_custom_id", "_default", "_label", "_max_length", "_min_length", "_placeholder", "_style", "_value")
+    __slots__ = (
+        "_converter",
+        "_custom_id",
+        "_default",
+        "_label",
+        "_max_length",
+        "_min_length",
+        "_placeholder",
+        "_style",
+        "_value",
+    )
 
     def __init__(
         self,
@@ -1676,7 +2092,9 @@ class _TextInputDescriptor(_ComponentDescriptor):
         default: typing.Any = NO_DEFAULT,
         min_length: int = 0,
         max_length: int = _MAX_STRING_LENGTH,
+        converter: collections.abc.Callable[[str], typing.Any] | None = None,
     ) -> None:
+        self._converter = converter
         self._label = label
         self._custom_id = custom_id
         self._style = style
@@ -1698,6 +2116,7 @@ class _TextInputDescriptor(_ComponentDescriptor):
             default=self._default,
             min_length=self._min_length,
             max_length=self._max_length,
+            converter=self._converter,
         )
 
     def add_static(self, field_name: str, modal: type[Modal], /, *, pass_as_kwarg: bool = False) -> None:
@@ -1712,11 +2131,19 @@ class _TextInputDescriptor(_ComponentDescriptor):
             default=self._default,
             min_length=self._min_length,
             max_length=self._max_length,
+            converter=self._converter,
         )
 
     def to_tracked_field(self, keyword: str, /) -> _TrackedField:
         id_match = _internal.split_custom_id(self._custom_id)[0] if self._custom_id else keyword
-        return _TrackedField(id_match, self._default, keyword, hikari.ComponentType.TEXT_INPUT)
+        return _TrackedField(
+            id_match,
+            self._default,
+            keyword,
+            hikari.ComponentType.TEXT_INPUT,
+            converter=self._converter,
+            label=self._label,
+        )
 
 
 @typing.overload
@@ -1731,6 +2158,7 @@ def text_input(
     default: _T,
     min_length: int = 0,
     max_length: int = 4000,
+    converter: None = None,
 ) -> str | _T: ...
 
 
@@ -1745,9 +2173,41 @@ def text_input(
     value: hikari.UndefinedOr[str] = hikari.UNDEFINED,
     min_length: int = 0,
     max_length: int = 4000,
+    converter: None = None,
 ) -> str: ...
 
 
+@typing.overload
+def text_input(
+    label: str,
+    /,
+    *,
+    custom_id: str | None = None,
+    style: hikari.TextInputStyle = hikari.TextInputStyle.SHORT,
+    placeholder: hikari.UndefinedOr[str] = hikari.UNDEFINED,
+    value: hikari.UndefinedOr[str] = hikari.UNDEFINED,
+    default: _T,
+    min_length: int = 0,
+    max_length: int = 4000,
+    converter: collections.abc.Callable[[str], _ConvertedT],
+) -> _ConvertedT | _T: ...
+
+
+@typing.overload
+def text_input(
+    label: str,
+    /,
+    *,
+    custom_id: str | None = None,
+    style: hikari.TextInputStyle = hikari.TextInputStyle.SHORT,
+    placeholder: hikari.UndefinedOr[str] = hikari.UNDEFINED,
+    value: hikari.UndefinedOr[str] = hikari.UNDEFINED,
+    min_length: int = 0,
+    max_length: int = 4000,
+    converter: collections.abc.Callable[[str], _ConvertedT],
+) -> _ConvertedT: ...
+
+
 def text_input(
     label: str,
     /,
@@ -1759,7 +2219,8 @@ def text_input(
     default: _T | typing.Literal[_NoDefaultEnum.VALUE] = NO_DEFAULT,
     min_length: int = 0,
     max_length: int = 4000,
-) -> str | _T:
+    converter: collections.abc.Callable[[str], _ConvertedT] | None = None,
+) -> str | _ConvertedT | _T:
     """Descriptor used to declare a text input field.
 
     Parameters
@@ -1793,6 +2254,14 @@ def text_input(
         Maximum length the input text can be.
 
         This can be greater than or equal to 1 and less than or equal to 4000.
+    converter
+        Callback used to convert the field's text before it's passed to
+        the callback (e.g. [int][], [float][],
+        [hikari.Snowflake][hikari.snowflakes.Snowflake] or
+        [regex_converter][yuyo.modals.regex_converter]).
+
+        If this raises [ValueError][] then an error response is sent rather
+        than calling the modal's callback. This isn't applied to `default`.
 
     Examples
     --------
@@ -1831,6 +2300,7 @@ def text_input(
         default=default,
         min_length=min_length,
         max_length=max_length,
+        converter=converter,
     )
     return typing.cast("str", descriptor)
 
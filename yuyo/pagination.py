@@ -558,6 +558,29 @@ class Paginator:
         """Whether this has finished iterating over the original iterator."""
         return self._iterator is None
 
+    @property
+    def index(self) -> int:
+        """Index of the current page.
+
+        This will be `-1` if the paginator hasn't been moved forward to the
+        first entry yet.
+        """
+        return self._index
+
+    @property
+    def pages(self) -> collections.Sequence[AbstractPage]:
+        """The pages which have been loaded from the iterator so far."""
+        return self._buffer
+
+    async def buffer_all(self) -> None:
+        """Load the rest of the iterator's entries into this paginator.
+
+        This doesn't change the current page.
+        """
+        if self._iterator:
+            self._buffer.extend(map(Page.from_entry, await _internal.collect_iterable(self._iterator)))
+            self._iterator = None
+
     def close(self) -> None:
         """Close the paginator."""
         self._buffer.clear()
@@ -642,10 +665,7 @@ class Paginator:
             The last page in this paginator, or [None][] if this is already on
             the last page.
         """
-        if self._iterator:
-            self._buffer.extend(map(Page.from_entry, await _internal.collect_iterable(self._iterator)))
-            self._iterator = None
-
+        await self.buffer_all()
         if self._buffer and self._is_behind_buffer:
             self._index = len(self._buffer) - 1
             return self._buffer[-1]
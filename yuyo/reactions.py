@@ -31,11 +31,22 @@
 
 from __future__ import annotations
 
-__all__: list[str] = ["ReactionClient", "ReactionHandler", "ReactionPaginator"]
+__all__: list[str] = [
+    "AbstractHandlerStore",
+    "ReactionClient",
+    "ReactionHandler",
+    "ReactionPaginator",
+    "SQLiteHandlerStore",
+]
 
 import abc
 import asyncio
 import datetime
+import json
+import logging
+import sqlite3
+import threading
+import time
 import typing
 from collections import abc as collections
 
@@ -46,8 +57,10 @@ import hikari
 from . import _internal
 from . import pagination
 from . import timeouts
+from ._internal import serialise
 
 if typing.TYPE_CHECKING:
+    import os
     from typing import Self
 
     import tanjun
@@ -61,6 +74,8 @@ if typing.TYPE_CHECKING:
         """Protocol of a cacheless Hikari Gateway bot."""
 
 
+_LOGGER = logging.getLogger("hikari.yuyo.reactions")
+
 ReactionEventT = hikari.ReactionAddEvent | hikari.ReactionDeleteEvent
 """Type hint of the event types [CallbackSig][yuyo.reactions.CallbackSig] takes as its first argument."""
 
@@ -113,6 +128,186 @@ class AbstractReactionHandler(abc.ABC):
             If this reaction handler has been closed.
         """
 
+    def dump(self) -> bytes | None:
+        """Serialise this handler's state so it can be persisted.
+
+        This is used when [ReactionClient][yuyo.reactions.ReactionClient] has a
+        handler store and this handler's type has been registered with
+        [ReactionClient.add_handler_type][yuyo.reactions.ReactionClient.add_handler_type].
+
+        Returns
+        -------
+        bytes | None
+            The serialised state or [None][] if this handler's current state
+            can't be persisted.
+
+            By default handlers aren't persisted.
+        """
+        return None
+
+    @classmethod
+    async def load(cls, data: bytes, message: hikari.Message, /) -> Self:
+        """Rebuild a handler from its serialised state.
+
+        Parameters
+        ----------
+        data
+            The state returned by
+            [AbstractReactionHandler.dump][yuyo.reactions.AbstractReactionHandler.dump].
+        message
+            The message the handler targets.
+
+        Returns
+        -------
+        Self
+            The rebuilt handler.
+
+            This should already be opened with `message`.
+
+        Raises
+        ------
+        NotImplementedError
+            If this handler type doesn't support persistence.
+        """
+        error_message = f"{cls.__name__} doesn't support being loaded"
+        raise NotImplementedError(error_message)
+
+
+class AbstractHandlerStore(abc.ABC):
+    """Abstract interface of a local store used to persist reaction handlers.
+
+    This lets reaction handlers survive restarts.
+
+    [ReactionClient][yuyo.reactions.ReactionClient] calls these methods in
+    worker threads, so implementations may block but must be thread-safe.
+    Writes are buffered by the client and made by its gc task.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def get(self, message_id: hikari.Snowflake, /) -> tuple[str, bytes] | None:
+        """Get a stored handler.
+
+        Parameters
+        ----------
+        message_id
+            ID of the message the handler targets.
+
+        Returns
+        -------
+        tuple[str, bytes] | None
+            The handler's registered type name and serialised state if found
+            else [None][].
+        """
+
+    @abc.abstractmethod
+    def load_ids(self) -> collections.Collection[hikari.Snowflake]:
+        """Load the message IDs of all the stored handlers.
+
+        Returns
+        -------
+        collections.abc.Collection[hikari.snowflakes.Snowflake]
+            IDs of the messages which have stored handlers.
+        """
+
+    @abc.abstractmethod
+    def set(self, message_id: hikari.Snowflake, type_name: str, data: bytes, /) -> None:
+        """Store a handler, replacing any previously stored handler for the message.
+
+        Parameters
+        ----------
+        message_id
+            ID of the message the handler targets.
+        type_name
+            The handler type's registered name.
+        data
+            The handler's serialised state.
+        """
+
+    @abc.abstractmethod
+    def delete(self, message_id: hikari.Snowflake, /) -> None:
+        """Remove a stored handler.
+
+        Parameters
+        ----------
+        message_id
+            ID of the message the handler targets.
+        """
+
+
+class SQLiteHandlerStore(AbstractHandlerStore):
+    """SQLite implementation of [AbstractHandlerStore][yuyo.reactions.AbstractHandlerStore].
+
+    [ReactionClient][yuyo.reactions.ReactionClient] calls this from worker
+    threads so it's safe to use from multiple threads.
+    """
+
+    __slots__ = ("_connection", "_lock")
+
+    def __init__(self, path: str | os.PathLike[str], /) -> None:
+        """Initialise an SQLite handler store.
+
+        Parameters
+        ----------
+        path
+            Path of the SQLite database file to use.
+
+            `":memory:"` may be passed to use an in-memory database.
+        """
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS reaction_handlers "
+                "(message_id INTEGER PRIMARY KEY, type_name TEXT NOT NULL, data BLOB NOT NULL)"
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def get(self, message_id: hikari.Snowflake, /) -> tuple[str, bytes] | None:
+        # <<inherited docstring from AbstractHandlerStore>>.
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT type_name, data FROM reaction_handlers WHERE message_id = ?", (message_id,)
+            ).fetchone()
+
+        if row:
+            return (row[0], row[1])
+
+        return None
+
+    def load_ids(self) -> collections.Collection[hikari.Snowflake]:
+        # <<inherited docstring from AbstractHandlerStore>>.
+        with self._lock:
+            rows = self._connection.execute("SELECT message_id FROM reaction_handlers").fetchall()
+
+        return [hikari.Snowflake(message_id) for (message_id,) in rows]
+
+    def set(self, message_id: hikari.Snowflake, type_name: str, data: bytes, /) -> None:
+        # <<inherited docstring from AbstractHandlerStore>>.
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO reaction_handlers VALUES (?, ?, ?)", (message_id, type_name, data)
+            )
+
+    def delete(self, message_id: hikari.Snowflake, /) -> None:
+        # <<inherited docstring from AbstractHandlerStore>>.
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM reaction_handlers WHERE message_id = ?", (message_id,))
+
+
+def _write_handlers(store: AbstractHandlerStore, writes: dict[hikari.Snowflake, tuple[str, bytes] | None], /) -> None:
+    for message_id, entry in writes.items():
+        if entry is None:
+            store.delete(message_id)
+
+        else:
+            store.set(message_id, *entry)
+
 
 class ReactionHandler(AbstractReactionHandler):
     """Standard basic implementation of a reaction handler."""
@@ -276,10 +471,29 @@ Handler = ReactionHandler
 """Alias of [ReactionHandler][yuyo.reactions.ReactionHandler]."""
 
 
+_PAGINATOR_BUTTONS = {
+    "first": "_on_first",
+    "previous": "_on_previous",
+    "stop": "_on_disable",
+    "next": "_on_next",
+    "last": "_on_last",
+}
+"""Mapping of the persisted names of the standard paginator buttons to their callbacks' attribute names."""
+
+
 class ReactionPaginator(ReactionHandler):
-    """Standard implementation of a reaction handler for pagination."""
+    """Standard implementation of a reaction handler for pagination.
+
+    !!! note
+        This can only be persisted to a
+        [ReactionClient][yuyo.reactions.ReactionClient]'s handler store once
+        its page iterator has been exhausted (see
+        [ReactionPaginator.buffer_all][yuyo.reactions.ReactionPaginator.buffer_all])
+        and while it only has the standard pagination buttons, as the iterator
+        and custom callbacks can't be serialised.
+    """
 
-    __slots__ = ("_delete_task", "_paginator", "_reactions")
+    __slots__ = ("_delete_task", "_expires_at", "_paginator", "_reactions")
 
     def __init__(
         self,
@@ -319,6 +533,7 @@ class ReactionPaginator(ReactionHandler):
 
         super().__init__(authors=authors, timeout=timeout)
         self._delete_task: asyncio.Task[None] | None = None
+        self._expires_at = None if timeout is None else time.time() + timeout.total_seconds()
         self._paginator = pagination.Paginator(iterator)
         self._reactions: list[hikari.CustomEmoji | str] = []
 
@@ -513,6 +728,71 @@ class ReactionPaginator(ReactionHandler):
         if page := await self._paginator.jump_to_last():
             await self._edit_message(page)
 
+    async def buffer_all(self) -> Self:
+        """Load the rest of this paginator's pages from its iterator.
+
+        This lets the paginator be persisted to a
+        [ReactionClient][yuyo.reactions.ReactionClient]'s handler store.
+
+        Returns
+        -------
+        Self
+            To enable chained calls.
+        """
+        await self._paginator.buffer_all()
+        return self
+
+    def dump(self) -> bytes | None:
+        # <<inherited docstring from AbstractReactionHandler>>.
+        if not self._paginator.has_finished_iterating:
+            return None
+
+        actions = {getattr(self, name): action for action, name in _PAGINATOR_BUTTONS.items()}
+        buttons: list[tuple[str | int, str]] = []
+        for emoji_identifier, callback in self._callbacks.items():
+            if (action := actions.get(callback)) is None:
+                return None
+
+            buttons.append((emoji_identifier, action))
+
+        try:
+            pages = [serialise.serialise_page(page, strict=True) for page in self._paginator.pages]
+
+        except ValueError:
+            return None
+
+        state = {
+            "authors": list(self._authors),
+            "buttons": buttons,
+            "expires_at": self._expires_at,
+            "index": self._paginator.index,
+            "pages": pages,
+        }
+        return json.dumps(state, separators=(",", ":")).encode()
+
+    @classmethod
+    async def load(cls, data: bytes, message: hikari.Message, /) -> Self:
+        # <<inherited docstring from AbstractReactionHandler>>.
+        state = json.loads(data)
+        if (expires_at := state["expires_at"]) is None:
+            timeout = None
+
+        else:
+            timeout = datetime.timedelta(seconds=max(expires_at - time.time(), 0))
+
+        pages = [serialise.deserialise_page(page) for page in state["pages"]]
+        self = cls(iter(pages), authors=state["authors"], triggers=(), timeout=timeout)
+        self._expires_at = expires_at
+        await self._paginator.buffer_all()
+        for _ in range(state["index"] + 1):
+            await self._paginator.step_forward()
+
+        for emoji_identifier, action in state["buttons"]:
+            self.set_callback(emoji_identifier, getattr(self, _PAGINATOR_BUTTONS[action]))
+
+        await self.open(message, add_reactions=False)
+        return self
+
     async def get_next_entry(self) -> pagination.AbstractPage | None:
         """Get the next entry in this paginator.
 
@@ -567,19 +847,31 @@ class ReactionPaginator(ReactionHandler):
         remove_reactions
             Whether this should remove the reactions that were being used to
             paginate through this from the previously registered message.
+
+            This will try to clear all the message's reactions in one request
+            (which needs the `MANAGE_MESSAGES` permission) before falling back
+            to removing the bot's own reactions.
         """
         if message := self._message:
             self._message = None
             if not remove_reactions:
                 return
 
-            # TODO: check if we can just clear the reactions before doing this using the cache.
-            for emoji_name in self._reactions:
-                try:
-                    await message.remove_reaction(emoji_name)
+            try:
+                await message.remove_all_reactions()
+
+            except hikari.NotFoundError:
+                return
 
-                except (hikari.NotFoundError, hikari.ForbiddenError):
-                    return
+            except hikari.ForbiddenError:
+                pass
+
+            else:
+                return
+
+            # These all go through the same rate limit bucket so there's no
+            # need to bound this; gathering just avoids idling between requests.
+            await asyncio.gather(*(_remove_reaction(message, emoji_name) for emoji_name in self._reactions))
 
     async def open(self, message: hikari.Message, /, *, add_reactions: bool = True) -> None:
         """Start the reaction paginator and start accepting reactions..
@@ -661,10 +953,37 @@ Paginator = ReactionPaginator
 """Alias of [ReactionPaginator][yuyo.reactions.ReactionPaginator]."""
 
 
+async def _remove_reaction(message: hikari.Message, emoji: hikari.CustomEmoji | str, /) -> None:
+    try:
+        await message.remove_reaction(emoji)
+
+    except (hikari.NotFoundError, hikari.ForbiddenError):
+        pass
+
+
 class ReactionClient:
     """A class which handles the events for multiple registered reaction handlers."""
 
-    __slots__ = ("_alluka", "_event_manager", "_gc_task", "_handlers", "_rest", "blacklist")
+    __slots__ = (
+        "_alluka",
+        "_buckets",
+        "_dirty_ids",
+        "_event_factory",
+        "_event_manager",
+        "_gc_task",
+        "_handler_store",
+        "_handler_type_names",
+        "_handler_types",
+        "_handlers",
+        "_idle_timeout",
+        "_last_used",
+        "_pending_writes",
+        "_rate_limit",
+        "_rest",
+        "_store_lock",
+        "_stored_ids",
+        "blacklist",
+    )
 
     def __init__(
         self,
@@ -672,7 +991,11 @@ class ReactionClient:
         rest: hikari.api.RESTClient,
         event_manager: hikari.api.EventManager,
         alluka: alluka_.abc.Client | None = None,
+        event_factory: hikari.api.EventFactory | None = None,
         event_managed: bool = True,
+        handler_idle_timeout: datetime.timedelta | float = datetime.timedelta(minutes=10),
+        handler_store: AbstractHandlerStore | None = None,
+        user_rate_limit: tuple[int, datetime.timedelta | float] | None = None,
     ) -> None:
         """Initialise a reaction client.
 
@@ -694,20 +1017,102 @@ class ReactionClient:
             The Alluka client to use for callback dependency injection in this client.
 
             If not provided then this will initialise its own Alluka client.
+        event_factory
+            If provided, the event factory to use to only deserialise the reaction
+            events for messages which have a registered handler.
+
+            When this is passed the client listens to
+            [hikari.ShardPayloadEvent][hikari.events.shard_events.ShardPayloadEvent]
+            rather than the reaction events and checks the raw payload's message
+            ID before deserialising it. This avoids building event objects for
+            every reaction the bot sees but means that every raw gateway event is
+            dispatched to this client, so it's only worthwhile for bots which
+            see a lot of reactions and which don't otherwise listen to reaction
+            events.
         event_managed
             Whether the reaction client should be automatically opened and
             closed based on the lifetime events dispatched by `event_managed`.
+        handler_idle_timeout
+            How long (in seconds) persisted handlers are kept in memory after
+            they were last used before being unloaded back to `handler_store`.
+        handler_store
+            Local store to persist handlers to, allowing them to survive restarts.
+
+            Only handlers whose types have been registered with
+            [ReactionClient.add_handler_type][yuyo.reactions.ReactionClient.add_handler_type]
+            and which return state from
+            [AbstractReactionHandler.dump][yuyo.reactions.AbstractReactionHandler.dump]
+            are persisted, with them being lazily loaded when a reaction is
+            received for their message. The IDs of the stored handlers'
+            messages are loaded into memory when the client is opened.
+
+            Changes to a loaded handler's state are written to the store in
+            the background every few seconds, when it's unloaded and when the
+            client is closed.
+        user_rate_limit
+            If provided, a `(uses, period)` tuple of how many reactions each
+            user can make on a handler's message within `period` seconds.
+
+            This is enforced with a token bucket per user per handler which
+            refills over `period`, with excess reaction events being dropped
+            before they reach the handler.
+
+        Raises
+        ------
+        ValueError
+            If `user_rate_limit`'s uses are less than 1 or its period isn't
+            greater than 0.
         """
         if alluka is None:
             alluka = alluka_local.get_client(default=None) or alluka_.Client()
             self._set_standard_deps(alluka)
 
         self._alluka = alluka
-        self.blacklist: list[hikari.Snowflake] = []
+        self.blacklist: set[hikari.Snowflake] = set()
+        self._buckets: dict[tuple[hikari.Snowflake, hikari.Snowflake], tuple[float, float]] = {}
+        self._event_factory = event_factory
         self._event_manager = event_manager
         self._gc_task: asyncio.Task[None] | None = None
+        self._handler_store = handler_store
+        self._handler_type_names: dict[type[AbstractReactionHandler], str] = {}
+        self._handler_types: dict[str, type[AbstractReactionHandler]] = {}
         self._handlers: dict[hikari.Snowflake, AbstractReactionHandler] = {}
+        self._idle_timeout = (
+            handler_idle_timeout.total_seconds()
+            if isinstance(handler_idle_timeout, datetime.timedelta)
+            else handler_idle_timeout
+        )
+        # IDs of the persisted handlers whose state may have changed since they were stored.
+        self._dirty_ids: set[hikari.Snowflake] = set()
+        # Last time each of the in-memory handlers which are also persisted was used.
+        self._last_used: dict[hikari.Snowflake, float] = {}
+        # Store writes which haven't been made yet, with None marking a deletion.
+        # These are made in a thread by the gc task so the store's I/O doesn't
+        # block the event loop.
+        self._pending_writes: dict[hikari.Snowflake, tuple[str, bytes] | None] = {}
         self._rest = rest
+        self._store_lock = asyncio.Lock()
+        # IDs of the messages with handlers in the store, this lets reactions
+        # for untracked messages be ignored without querying the store.
+        self._stored_ids: set[hikari.Snowflake] = set()
+
+        if user_rate_limit:
+            uses, period = user_rate_limit
+            if isinstance(period, datetime.timedelta):
+                period = period.total_seconds()
+
+            if uses < 1:
+                error_message = "user_rate_limit uses must be greater than or equal to 1"
+                raise ValueError(error_message)
+
+            if period <= 0:
+                error_message = "user_rate_limit period must be greater than 0"
+                raise ValueError(error_message)
+
+            self._rate_limit: tuple[int, float] | None = (uses, uses / period)
+
+        else:
+            self._rate_limit = None
 
         if event_managed:
             self._event_manager.subscribe(hikari.StartingEvent, self._on_starting_event)
@@ -720,7 +1125,16 @@ class ReactionClient:
 
     @classmethod
     def from_gateway_bot(
-        cls, bot: _GatewayBotProto, /, *, alluka: alluka_.abc.Client | None = None, event_managed: bool = True
+        cls,
+        bot: _GatewayBotProto,
+        /,
+        *,
+        alluka: alluka_.abc.Client | None = None,
+        event_factory: hikari.api.EventFactory | None = None,
+        event_managed: bool = True,
+        handler_idle_timeout: datetime.timedelta | float = datetime.timedelta(minutes=10),
+        handler_store: AbstractHandlerStore | None = None,
+        user_rate_limit: tuple[int, datetime.timedelta | float] | None = None,
     ) -> Self:
         """Build a `ReactionClient` from a gateway bot.
 
@@ -735,16 +1149,46 @@ class ReactionClient:
             The Alluka client to use for callback dependency injection in this client.
 
             If not provided then this will initialise its own Alluka client.
+        event_factory
+            If provided, the event factory to use to only deserialise the reaction
+            events for messages which have a registered handler.
+
+            For more information see [ReactionClient][yuyo.reactions.ReactionClient].
+            For [hikari.GatewayBot][hikari.impl.gateway_bot.GatewayBot] this
+            should be `bot.event_factory`.
         event_managed
             Whether the reaction client should be automatically opened and
             closed based on the lifetime events dispatched by `bot`.
+        handler_idle_timeout
+            How long (in seconds) persisted handlers are kept in memory after
+            they were last used before being unloaded back to `handler_store`.
+        handler_store
+            Local store to persist handlers to, allowing them to survive restarts.
+        user_rate_limit
+            If provided, a `(uses, period)` tuple of how many reactions each
+            user can make on a handler's message within `period` seconds.
 
         Returns
         -------
         ReactionClient
             The reaction client for the bot.
+
+        Raises
+        ------
+        ValueError
+            If `user_rate_limit`'s uses are less than 1 or its period isn't
+            greater than 0.
         """
-        return cls(alluka=alluka, rest=bot.rest, event_manager=bot.event_manager, event_managed=event_managed)
+        return cls(
+            alluka=alluka,
+            rest=bot.rest,
+            event_factory=event_factory,
+            event_manager=bot.event_manager,
+            event_managed=event_managed,
+            handler_idle_timeout=handler_idle_timeout,
+            handler_store=handler_store,
+            user_rate_limit=user_rate_limit,
+        )
 
     @classmethod
     def from_tanjun(cls, tanjun_client: tanjun.abc.Client, /, *, tanjun_managed: bool = True) -> Self:
@@ -793,24 +1237,201 @@ class ReactionClient:
     async def _gc(self) -> None:
         while True:
             for listener_id, listener in tuple(self._handlers.items()):
-                if not listener.has_expired or listener_id not in self._handlers:
+                if listener_id not in self._handlers:
                     continue
 
-                del self._handlers[listener_id]
-                # This may slow this gc task down but the more we yield the better.
-                await listener.close()
+                if listener.has_expired:
+                    del self._handlers[listener_id]
+                    self._forget(listener_id)
+                    # This may slow this gc task down but the more we yield the better.
+                    await listener.close()
+
+                elif (last_used := self._last_used.get(listener_id)) is not None and (
+                    time.monotonic() - last_used > self._idle_timeout
+                ):
+                    # Idle persisted handlers are unloaded from memory and will be
+                    # loaded again from the store if they're used.
+                    self._dirty_ids.discard(listener_id)
+                    if self._persist(listener_id, listener):
+                        del self._handlers[listener_id]
+                        del self._last_used[listener_id]
+
+            self._flush_dirty()
+            await self._flush_store()
+            if self._rate_limit:
+                self._gc_buckets(self._rate_limit)
 
             await asyncio.sleep(5)  # TODO: is this a good time?
 
+    def _gc_buckets(self, rate_limit: tuple[int, float], /) -> None:
+        uses, refill_rate = rate_limit
+        now = time.monotonic()
+        for key, (tokens, updated_at) in tuple(self._buckets.items()):
+            # Full buckets are the same as missing ones.
+            if key[0] not in self._handlers or tokens + (now - updated_at) * refill_rate >= uses:
+                del self._buckets[key]
+
+    def _consume_token(self, rate_limit: tuple[int, float], key: tuple[hikari.Snowflake, hikari.Snowflake], /) -> bool:
+        uses, refill_rate = rate_limit
+        now = time.monotonic()
+        if bucket := self._buckets.get(key):
+            tokens, updated_at = bucket
+            tokens = min(uses, tokens + (now - updated_at) * refill_rate)
+
+        else:
+            tokens = uses
+
+        if tokens < 1:
+            self._buckets[key] = (tokens, now)
+            return False
+
+        self._buckets[key] = (tokens - 1, now)
+        return True
+
+    def _persist(self, message_id: hikari.Snowflake, handler: AbstractReactionHandler, /) -> bool:
+        if not self._handler_store or (type_name := self._handler_type_names.get(type(handler))) is None:
+            return False
+
+        data = handler.dump()
+        if data is None:
+            # The handler's current state can't be persisted so any outdated
+            # stored state is removed.
+            if message_id in self._stored_ids:
+                self._stored_ids.discard(message_id)
+                self._pending_writes[message_id] = None
+
+            return False
+
+        self._pending_writes[message_id] = (type_name, data)
+        self._stored_ids.add(message_id)
+        return True
+
+    def _flush_dirty(self) -> None:
+        dirty_ids = self._dirty_ids
+        self._dirty_ids = set()
+        for message_id in dirty_ids:
+            if message_id in self._last_used:
+                self._persist(message_id, self._handlers[message_id])
+
+    def _forget(self, message_id: hikari.Snowflake, /) -> None:
+        self._dirty_ids.discard(message_id)
+        self._last_used.pop(message_id, None)
+        if message_id in self._stored_ids:
+            self._stored_ids.discard(message_id)
+            self._pending_writes[message_id] = None
+
+    async def _flush_store(self) -> None:
+        if not self._handler_store or not self._pending_writes:
+            return
+
+        async with self._store_lock:
+            writes = self._pending_writes
+            self._pending_writes = {}
+            await asyncio.to_thread(_write_handlers, self._handler_store, writes)
+
+    async def _get_stored(
+        self, store: AbstractHandlerStore, message_id: hikari.Snowflake, /
+    ) -> tuple[str, bytes] | None:
+        if message_id in self._pending_writes:
+            return self._pending_writes[message_id]
+
+        # This waits for any in-progress writes to be made to the store.
+        async with self._store_lock:
+            if message_id in self._pending_writes:
+                return self._pending_writes[message_id]
+
+            return await asyncio.to_thread(store.get, message_id)
+
+    async def _load_handler(
+        self, store: AbstractHandlerStore, event: hikari.ReactionAddEvent | hikari.ReactionDeleteEvent, /
+    ) -> AbstractReactionHandler | None:
+        if not (entry := await self._get_stored(store, event.message_id)):
+            self._stored_ids.discard(event.message_id)
+            return None
+
+        type_name, data = entry
+        if not (handler_type := self._handler_types.get(type_name)):
+            # This is left in the store in case the type is registered after restarting.
+            self._stored_ids.discard(event.message_id)
+            return None
+
+        try:
+            message = await self._rest.fetch_message(event.channel_id, event.message_id)
+
+        except hikari.NotFoundError:
+            self._forget(event.message_id)
+            return None
+
+        try:
+            handler = await handler_type.load(data, message)
+
+        except Exception:
+            # The stored state is kept in case this is fixed by an update.
+            _LOGGER.exception("Failed to load stored reaction handler for message %s", event.message_id)
+            self._stored_ids.discard(event.message_id)
+            return None
+
+        # Another event may have loaded this handler while the message was being fetched.
+        if existing := self._handlers.get(event.message_id):
+            await handler.close()
+            return existing
+
+        if handler.has_expired:
+            self._forget(event.message_id)
+            await handler.close()
+            return None
+
+        self._handlers[event.message_id] = handler
+        self._last_used[event.message_id] = time.monotonic()
+        return handler
+
     async def _on_reaction_event(self, event: hikari.ReactionAddEvent | hikari.ReactionDeleteEvent, /) -> None:
         if event.user_id in self.blacklist:
             return
 
-        if listener := self._handlers.get(event.message_id):
+        listener = self._handlers.get(event.message_id)
+        if not listener and self._handler_store and event.message_id in self._stored_ids:
+            listener = await self._load_handler(self._handler_store, event)
+
+        if listener:
+            if self._rate_limit and not self._consume_token(self._rate_limit, (event.message_id, event.user_id)):
+                return
+
             try:
                 await listener.on_reaction_event(event, alluka=self._alluka)
             except HandlerClosed:
                 self._handlers.pop(event.message_id, None)
+                self._forget(event.message_id)
+                return
+
+            if event.message_id in self._last_used:
+                # The handler's state is persisted by the gc task rather than
+                # after every reaction.
+                self._last_used[event.message_id] = time.monotonic()
+                self._dirty_ids.add(event.message_id)
+
+    async def _on_payload_event(self, event: hikari.ShardPayloadEvent, /) -> None:
+        assert self._event_factory is not None
+        if event.name == "MESSAGE_REACTION_ADD":
+            deserialize = self._event_factory.deserialize_message_reaction_add_event
+
+        elif event.name == "MESSAGE_REACTION_REMOVE":
+            deserialize = self._event_factory.deserialize_message_reaction_remove_event
+
+        else:
+            return
+
+        # Checking the raw payload first avoids deserialising the event's entities
+        # (e.g. the reacting member) for the vast majority of untracked messages.
+        payload = event.payload
+        message_id = hikari.Snowflake(payload["message_id"])
+        if message_id not in self._handlers and message_id not in self._stored_ids:
+            return
+
+        if hikari.Snowflake(payload["user_id"]) in self.blacklist:
+            return
+
+        await self._on_reaction_event(deserialize(event.shard, dict(payload)))
 
     async def _on_starting_event(self, _: hikari.StartingEvent, /) -> None:
         await self.open()
@@ -835,8 +1456,45 @@ class ReactionClient:
             The message ID to add register a reaction handler with.
         handler
             The object of the opened handler to register in this reaction client.
+
+            If this client has a handler store and this handler's type has been
+            registered then this will also be persisted (once
+            [AbstractReactionHandler.dump][yuyo.reactions.AbstractReactionHandler.dump]
+            returns its state).
         """
-        self._handlers[hikari.Snowflake(message)] = handler
+        message_id = hikari.Snowflake(message)
+        self._handlers[message_id] = handler
+        if self._handler_store and type(handler) in self._handler_type_names:
+            # Handlers which can't be dumped yet are persisted by the gc task once they can be.
+            self._last_used[message_id] = time.monotonic()
+            self._dirty_ids.discard(message_id)
+            self._persist(message_id, handler)
+
+        else:
+            self._forget(message_id)
+
+        return self
+
+    def add_handler_type(self, handler_type: type[AbstractReactionHandler], /, *, name: str | None = None) -> Self:
+        """Register a handler type which can be persisted in the handler store.
+
+        Parameters
+        ----------
+        handler_type
+            The handler type to register.
+
+            This must implement
+            [AbstractReactionHandler.dump][yuyo.reactions.AbstractReactionHandler.dump]
+            and [AbstractReactionHandler.load][yuyo.reactions.AbstractReactionHandler.load].
+        name
+            Name to store the handler type under.
+
+            This must stay the same between restarts and defaults to the type's
+            qualified name.
+        """
+        name = name or f"{handler_type.__module__}.{handler_type.__qualname__}"
+        self._handler_type_names[handler_type] = name
+        self._handler_types[name] = handler_type
         return self
 
     def get_handler(self, message: hikari.SnowflakeishOr[hikari.Message], /) -> AbstractReactionHandler | None:
@@ -845,6 +1503,10 @@ class ReactionClient:
         !!! note
             This does not call [AbstractReactionHandler.close][yuyo.reactions.AbstractReactionHandler.close].
 
+        !!! note
+            Persisted handlers which have been unloaded from memory aren't
+            returned by this until a reaction loads them again.
+
         Parameters
         ----------
         message
@@ -853,13 +1515,16 @@ class ReactionClient:
         Returns
         -------
         AbstractReactionHandler | None
-            The object of the registered handler if found else [None][].
+            The object of the registered handler if found in memory else [None][].
         """
         return self._handlers.get(hikari.Snowflake(message))
 
     def remove_handler(self, message: hikari.SnowflakeishOr[hikari.Message], /) -> AbstractReactionHandler | None:
         """Remove a handler from this reaction client.
 
+        This also removes the handler from the handler store, including
+        persisted handlers which have been unloaded from memory.
+
         !!! note
             This does not call [AbstractReactionHandler.close][yuyo.reactions.AbstractReactionHandler.close].
 
@@ -871,9 +1536,15 @@ class ReactionClient:
         Returns
         -------
         AbstractReactionHandler | None
-            The object of the registered handler if found else [None][].
+            The object of the registered handler if found in memory else [None][].
+
+            Like with [ReactionClient.get_handler][yuyo.reactions.ReactionClient.get_handler],
+            this will be [None][] for persisted handlers which have been
+            unloaded from memory.
         """
-        return self._handlers.pop(hikari.Snowflake(message))
+        message_id = hikari.Snowflake(message)
+        self._forget(message_id)
+        return self._handlers.pop(message_id, None)
 
     def _try_unsubscribe(self, event_type: type[_EventT], callback: event_manager_api.CallbackT[_EventT], /) -> None:
         try:
@@ -885,20 +1556,43 @@ class ReactionClient:
     async def close(self) -> None:
         """Close this client by unregistering any registered tasks and event listeners."""
         if self._gc_task is not None:
-            self._try_unsubscribe(hikari.ReactionAddEvent, self._on_reaction_event)
-            self._try_unsubscribe(hikari.ReactionDeleteEvent, self._on_reaction_event)
+            if self._event_factory:
+                self._try_unsubscribe(hikari.ShardPayloadEvent, self._on_payload_event)
+
+            else:
+                self._try_unsubscribe(hikari.ReactionAddEvent, self._on_reaction_event)
+                self._try_unsubscribe(hikari.ReactionDeleteEvent, self._on_reaction_event)
+
             self._gc_task.cancel()
             listeners = self._handlers
+            # Persisted handlers are kept in the store to be loaded after restarting.
+            for message_id in self._last_used:
+                self._persist(message_id, listeners[message_id])
+
+            self._buckets.clear()
+            self._dirty_ids.clear()
             self._handlers = {}
+            self._last_used.clear()
+            await self._flush_store()
             await asyncio.gather(*(listener.close() for listener in listeners.values()))
 
     async def open(self) -> None:
         """Start this client by registering the required tasks and event listeners for it to function."""
         if self._gc_task is None:
+            if self._handler_store:
+                # Writes made before opening are flushed first so deleted handlers aren't reloaded.
+                await self._flush_store()
+                async with self._store_lock:
+                    self._stored_ids.update(await asyncio.to_thread(self._handler_store.load_ids))
+
             self._gc_task = asyncio.create_task(self._gc())
-            self.blacklist.append((await self._rest.fetch_my_user()).id)
-            self._event_manager.subscribe(hikari.ReactionAddEvent, self._on_reaction_event)
-            self._event_manager.subscribe(hikari.ReactionDeleteEvent, self._on_reaction_event)
+            self.blacklist.add((await self._rest.fetch_my_user()).id)
+            if self._event_factory:
+                self._event_manager.subscribe(hikari.ShardPayloadEvent, self._on_payload_event)
+
+            else:
+                self._event_manager.subscribe(hikari.ReactionAddEvent, self._on_reaction_event)
+                self._event_manager.subscribe(hikari.ReactionDeleteEvent, self._on_reaction_event)
 
 
 Client = ReactionClient